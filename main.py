@@ -30,6 +30,8 @@ from release_notes_generator.generator import ReleaseNotesGenerator
 from release_notes_generator.chapters.custom_chapters import CustomChapters
 from release_notes_generator.action_inputs import ActionInputs
 from release_notes_generator.utils.gh_action import set_action_output
+from release_notes_generator.utils.github_connection import install_thread_safe_connection
+from release_notes_generator.utils.http_cache import HttpCache, install_http_cache
 from release_notes_generator.utils.logging_config import setup_logging
 
 warnings.filterwarnings("ignore", category=InsecureRequestWarning)
@@ -47,9 +49,17 @@ def run() -> None:
 
     # Authenticate with GitHub
     py_github = Github(auth=Auth.Token(token=ActionInputs.get_github_token()), per_page=100, verify=False, timeout=60)
+    # mining and record building send requests of this client from worker threads
+    install_thread_safe_connection(py_github)
 
     ActionInputs.validate_inputs()
 
+    http_cache = None
+    if http_cache_dir := ActionInputs.get_http_cache_dir():
+        http_cache = HttpCache(http_cache_dir, ActionInputs.get_http_cache_max_size_mb() * 1024 * 1024)
+        install_http_cache(py_github, http_cache)
+        logger.info("HTTP response cache enabled in '%s' (%d entries).", http_cache_dir, len(http_cache))
+
     custom_chapters = CustomChapters(print_empty_chapters=ActionInputs.get_print_empty_chapters()).from_yaml_array(
         ActionInputs.get_chapters()
     )
@@ -58,6 +68,14 @@ def run() -> None:
     rls_notes = generator.generate()
     logger.debug("Generated release notes: \n%s", rls_notes)
 
+    if http_cache is not None:
+        logger.info(
+            "HTTP response cache: %d hits, %d misses, %d evictions.",
+            http_cache.hits,
+            http_cache.misses,
+            http_cache.evictions,
+        )
+
     # Set the output for the GitHub Action
     set_action_output(
         "release-notes",
@@ -40,6 +40,11 @@ from release_notes_generator.utils.constants import (
     GLOBAL_EXCLUDE_KEY,
     RUNNER_DEBUG,
     PRINT_EMPTY_CHAPTERS,
+    HTTP_CACHE_DIR,
+    HTTP_CACHE_MAX_SIZE_MB,
+    MINING_STATE_FILE,
+    SUB_ISSUE_GRAPH_FILE,
+    LOCAL_REPOSITORY_PATH,
     DUPLICITY_SCOPE,
     DUPLICITY_ICON,
     OPEN_HIERARCHY_SUB_ISSUE_ICON,
@@ -504,6 +509,46 @@ class ActionInputs:
         """
         return get_action_input(PRINT_EMPTY_CHAPTERS, "true").lower() == "true"
 
+    @staticmethod
+    def get_http_cache_dir() -> str:
+        """
+        Get the directory of the persistent HTTP response cache. Empty value disables the cache.
+        """
+        return get_action_input(HTTP_CACHE_DIR, "").strip()
+
+    @staticmethod
+    def get_http_cache_max_size_mb() -> int:
+        """
+        Get the size limit of the persistent HTTP response cache in megabytes.
+        """
+        raw = get_action_input(HTTP_CACHE_MAX_SIZE_MB, "100").strip()
+        try:
+            return int(raw)
+        except ValueError:
+            logger.error("Error: '%s' is not a valid HTTP cache size, using default 100 MB.", raw)
+            return 100
+
+    @staticmethod
+    def get_mining_state_file() -> str:
+        """
+        Get the path of the file persisting mined data between runs. Empty value disables incremental mining.
+        """
+        return get_action_input(MINING_STATE_FILE, "").strip()
+
+    @staticmethod
+    def get_sub_issue_graph_file() -> str:
+        """
+        Get the path of the file persisting the sub-issue graph between runs. Empty value disables it.
+        """
+        return get_action_input(SUB_ISSUE_GRAPH_FILE, "").strip()
+
+    @staticmethod
+    def get_local_repository_path() -> str:
+        """
+        Get the path of a local clone the commits are read from instead of the API. Empty value disables it.
+        """
+        return get_action_input(LOCAL_REPOSITORY_PATH, "").strip()
+
     @staticmethod
     def validate_input(input_value, expected_type: type, error_message: str, error_buffer: list) -> bool:
         """
@@ -674,6 +719,10 @@ class ActionInputs:
         print_empty_chapters = ActionInputs.get_print_empty_chapters()
         ActionInputs.validate_input(print_empty_chapters, bool, "Print empty chapters must be a boolean.", errors)
 
+        http_cache_max_size_mb = ActionInputs.get_http_cache_max_size_mb()
+        if http_cache_max_size_mb <= 0:
+            errors.append("HTTP cache max size must be a positive integer.")
+
         # Log errors if any
         if errors:
             for error in errors:
@@ -692,6 +741,11 @@ class ActionInputs:
         logger.debug("Verbose logging: %s", verbose)
         logger.debug("Warnings: %s", warnings)
         logger.debug("Print empty chapters: %s", print_empty_chapters)
+        logger.debug("HTTP cache dir: %s", ActionInputs.get_http_cache_dir())
+        logger.debug("HTTP cache max size (MB): %s", http_cache_max_size_mb)
+        logger.debug("Mining state file: %s", ActionInputs.get_mining_state_file())
+        logger.debug("Sub-issue graph file: %s", ActionInputs.get_sub_issue_graph_file())
+        logger.debug("Local repository path: %s", ActionInputs.get_local_repository_path())
         logger.debug("Release notes title: %s", release_notes_title)
         logger.debug("CodeRabbit support active: %s", coderabbit_support_active)
         logger.debug("CodeRabbit release notes title: %s", coderabbit_release_notes_title)
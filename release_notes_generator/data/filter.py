@@ -17,7 +17,7 @@
 """This module contains the Filter classes which are responsible for filtering records based on various criteria."""
 
 import logging
-from copy import deepcopy
+from copy import copy
 from typing import Optional
 
 from github.Issue import Issue
@@ -69,6 +69,7 @@ class FilterByRelease(Filter):
         md.release = data.release
         md.since = data.since
         md.compare_commit_shas = data.compare_commit_shas
+        md.mined_sub_issues = data.mined_sub_issues
 
         if data.release is not None:
             logger.info("Starting issue, prs and commit reduction by the latest release since time.")
@@ -129,9 +130,10 @@ class FilterByRelease(Filter):
                 len(md.commits.items()),
             )
         else:
-            md.issues = deepcopy(data.issues)
-            md.pull_requests = deepcopy(data.pull_requests)
-            md.commits = deepcopy(data.commits)
+            # shallow copies - the PyGithub objects (with their requester and raw data) are shared, not cloned
+            md.issues = copy(data.issues)
+            md.pull_requests = copy(data.pull_requests)
+            md.commits = copy(data.commits)
 
         return md
 
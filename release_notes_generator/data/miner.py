@@ -21,9 +21,11 @@ This module contains logic for mining data from GitHub, including issues, pull r
 import logging
 import re
 import sys
+import time
 import traceback
 from concurrent.futures import ThreadPoolExecutor, as_completed, CancelledError
-from typing import Optional, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Callable, Iterable
 
 import semver
 from github import Github, GithubException
@@ -35,6 +37,15 @@ from github.Commit import Commit as GithubCommit
 
 from release_notes_generator.action_inputs import ActionInputs
 from release_notes_generator.data.utils.bulk_sub_issue_collector import BulkSubIssueCollector
+from release_notes_generator.data.utils.graphql_commit_pull_resolver import GraphQLCommitPullResolver
+from release_notes_generator.data.utils.graphql_compare_preflight import ComparePreflight, GraphQLComparePreflight
+from release_notes_generator.data.utils.graphql_issue_fetcher import GraphQLIssueFetcher
+from release_notes_generator.data.utils.graphql_issue_miner import GraphQLIssueMiner
+from release_notes_generator.data.utils.local_git_repository import LocalGitError, LocalGitRepository
+from release_notes_generator.data.utils.mining_state import MiningState
+from release_notes_generator.data.utils.parallel_paginator import ParallelPaginator
+from release_notes_generator.data.utils.repository_registry import RepositoryRegistry, build_lazy_repository
+from release_notes_generator.data.utils.sub_issue_graph import SubIssueGraph
 
 from release_notes_generator.model.record.issue_record import IssueRecord
 from release_notes_generator.model.mined_data import MinedData
@@ -45,6 +56,8 @@ from release_notes_generator.utils.record_utils import get_id, parse_issue_id
 
 _PR_NUMBER_RE = re.compile(r"\(#(\d+)\)|Merge pull request #(\d+)")
 _COMPARE_COMMITS_MAX_RESULTS = 10_000
+# safety margin for clock skew between the runner and GitHub when re-reading changes since the previous run
+_MINING_STATE_OVERLAP = timedelta(minutes=5)
 
 logger = logging.getLogger(__name__)
 
@@ -56,18 +69,26 @@ class DataMiner:
 
     def __init__(self, github_instance: Github, rate_limiter: GithubRateLimiter):
         self.github_instance = github_instance
+        self._rate_limiter = rate_limiter
         self._safe_call = safe_call_decorator(rate_limiter)
+        self._paginator = ParallelPaginator(rate_limiter)
+        self._compare_preflight: Optional[ComparePreflight] = None
+        self._compare_preflight_ran = False
+        self._repositories = RepositoryRegistry(self._fetch_repository)
+        self._local_clone: Optional[LocalGitRepository] = None
 
     def mine_data(self) -> MinedData:
         """
         Mines data from GitHub, including repository information, issues, pull requests, commits, and releases.
         """
         logger.info("Starting data mining from GitHub...")
-        repo: Optional[Repository] = self.get_repository(ActionInputs.get_github_repository())
+        repo: Optional[Repository] = self._get_home_repository()
         if repo is None:
             raise ValueError("Repository not found")
 
         data = MinedData(repo)
+        for known_repo in self._repositories.found():
+            data.add_repository(known_repo)
         data.release = self.get_latest_release(repo)
 
         # Ensure `since` is derived from resolved release when running in compare mode
@@ -82,6 +103,8 @@ class DataMiner:
 
         if ActionInputs.is_from_tag_name_defined():
             self._handle_compare_mode(repo, data)
+        elif state_file := ActionInputs.get_mining_state_file():
+            self._handle_since_time_mode_with_state(repo, data, state_file)
         else:
             self._handle_since_time_mode(repo, data)
 
@@ -98,13 +121,72 @@ class DataMiner:
         Handle comparison mode: mine commits and PRs between two tags.
 
         Logic:
-          - Fetch commits between from_tag and to_tag using repo.compare().
-          - Extract PR numbers from commit messages and fetch those PRs.
-          - Filter out commits that already have a PR reference to avoid duplication.
+          - Read commits between from_tag and to_tag from the local clone when configured, else (or when it
+            cannot be read) fetch them using repo.compare().
+          - Resolve the PRs which merged the commits in batched GraphQL queries; PR numbers referenced in
+            commit subjects and not resolved that way are fetched one by one.
+          - Filter out commits that belong to a PR or reference one to avoid duplication.
         """
         from_tag = ActionInputs.get_from_tag_name()
         to_tag = ActionInputs.get_tag_name()
 
+        compare_commits = self._get_local_compare_commits(repo, from_tag, to_tag)
+        if compare_commits is None:
+            compare_commits = self._get_compare_commits(repo, from_tag, to_tag)
+        data.compare_commit_shas = {c.sha for c in compare_commits}
+        data.commits = {c: data.home_repository for c in compare_commits}
+
+        owner, name = data.home_repository.full_name.split("/", 1)
+        resolver = GraphQLCommitPullResolver(self.github_instance.requester, self._rate_limiter)
+        commit_pulls = resolver.resolve(owner, name, [c.sha for c in compare_commits], base_ref=repo.default_branch)
+        resolved_pulls = {pull.number: pull for pulls in commit_pulls.values() for pull in pulls}
+
+        pr_numbers = self._extract_pr_numbers_from_commits(compare_commits) - set(resolved_pulls)
+        for number in sorted(pr_numbers):
+            pr = self._safe_call(repo.get_pull)(number)
+            if pr is not None:
+                resolved_pulls[number] = pr
+        # Store each PR with its source repository for downstream filtering and processing.
+        # In compare mode, all PRs come from home_repository; cross-repo is handled elsewhere.
+        data.pull_requests = {resolved_pulls[number]: data.home_repository for number in sorted(resolved_pulls)}
+
+        # Only include commits that don't belong to a PR or reference one
+        # (commits identified by PR are redundant with the PR itself)
+        commits_without_pr: dict[GithubCommit, Repository] = {}
+        for commit in compare_commits:
+            subject = commit.commit.message.splitlines()[0] if commit.commit.message else ""
+            has_pr_ref = bool(_PR_NUMBER_RE.search(subject))
+            if not has_pr_ref and not commit_pulls.get(commit.sha):
+                commits_without_pr[commit] = data.home_repository
+
+        if self._local_clone is not None:
+            commits_without_pr = dict.fromkeys(self._local_clone.link_author_logins([*commits_without_pr]), repo)
+        data.commits = commits_without_pr
+        logger.info(
+            "Compare mode: found %d commit(s) without PR, %d PR(s).",
+            len(commits_without_pr),
+            len(data.pull_requests),
+        )
+
+    def _get_local_compare_commits(self, repo: Repository, from_tag: str, to_tag: str) -> Optional[list[GithubCommit]]:
+        """
+        Read the commits between the tags from the local clone, if one is configured.
+
+        Returns:
+            Optional[list[GithubCommit]]: The commits, or None when no clone is configured or it cannot be read.
+        """
+        if (local := self._open_local_clone(repo)) is None:
+            return None
+        logger.info("Compare mode: reading '%s'..'%s' from local clone '%s'.", from_tag, to_tag, local.path)
+        try:
+            commits: list[GithubCommit] = local.commits_between(from_tag, to_tag)
+        except LocalGitError as e:
+            logger.warning("Compare mode: local clone cannot be used, falling back to the Compare API: %s", e)
+            return None
+        logger.info("Compare mode: read %d commit(s) from the local clone.", len(commits))
+        return commits
+
+    def _get_compare_commits(self, repo: Repository, from_tag: str, to_tag: str) -> list[GithubCommit]:
         logger.info("Compare mode: using repo.compare('%s', '%s').", from_tag, to_tag)
 
         self._validate_tag_exists(repo, from_tag)
@@ -132,45 +214,19 @@ class DataMiner:
                 len(compare_commits),
                 _COMPARE_COMMITS_MAX_RESULTS,
             )
-        data.compare_commit_shas = {c.sha for c in compare_commits}
-        data.commits = {c: data.home_repository for c in compare_commits}
-        pr_numbers = self._extract_pr_numbers_from_commits(compare_commits)
-        pulls: dict[PullRequest, Repository] = {}
-        for number in sorted(pr_numbers):
-            pr = self._safe_call(repo.get_pull)(number)
-            if pr is not None:
-                # Store each PR with its source repository for downstream filtering and processing.
-                # In compare mode, all PRs come from home_repository; cross-repo is handled elsewhere.
-                pulls[pr] = data.home_repository
-        data.pull_requests = pulls
-
-        # Only include commits that don't have a PR reference
-        # (commits identified by PR are redundant with the PR itself)
-        commits_without_pr: dict[GithubCommit, Repository] = {}
-        for commit in compare_commits:
-            subject = commit.commit.message.splitlines()[0] if commit.commit.message else ""
-            has_pr_ref = bool(_PR_NUMBER_RE.search(subject))
-            if not has_pr_ref:
-                commits_without_pr[commit] = data.home_repository
-
-        data.commits = commits_without_pr
-        logger.info(
-            "Compare mode: found %d commit(s) without PR, %d PR(s).",
-            len(commits_without_pr),
-            len(data.pull_requests),
-        )
+        return compare_commits
 
     def _validate_tag_exists(self, repo: Repository, tag: str) -> None:
+        if (preflight := self._get_compare_preflight()) is not None:
+            # the preflight query already read both tags
+            if preflight.tag_shas.get(tag) is None:
+                self._exit_on_missing_tag(repo, tag)
+            return
         try:
             repo.get_git_ref(f"tags/{tag}")
         except GithubException as e:
             if e.status == 404:
-                logger.error(
-                    "Tag '%s' does not exist in repository '%s'. "
-                    "Both 'tag-name' and 'from-tag-name' must exist as git tags before compare mode is used. Ending!",
-                    tag,
-                    repo.full_name,
-                )
+                self._exit_on_missing_tag(repo, tag)
             else:
                 logger.error(
                     "GitHub API error validating tag '%s' in repository '%s' (HTTP %s): %s. Ending!",
@@ -189,6 +245,29 @@ class DataMiner:
             )
             sys.exit(1)
 
+    @staticmethod
+    def _exit_on_missing_tag(repo: Repository, tag: str) -> None:
+        logger.error(
+            "Tag '%s' does not exist in repository '%s'. "
+            "Both 'tag-name' and 'from-tag-name' must exist as git tags before compare mode is used. Ending!",
+            tag,
+            repo.full_name,
+        )
+        sys.exit(1)
+
+    def _get_compare_preflight(self) -> Optional[ComparePreflight]:
+        """
+        Read the repository, both tags and the from-tag release of a compare run in one GraphQL query, once per miner.
+        None outside compare mode or when the query failed, then the REST calls are used.
+        """
+        if not self._compare_preflight_ran and ActionInputs.is_from_tag_name_defined():
+            self._compare_preflight_ran = True
+            preflight = GraphQLComparePreflight(self.github_instance.requester, self._rate_limiter)
+            self._compare_preflight = preflight.run(
+                ActionInputs.get_github_repository(), ActionInputs.get_from_tag_name(), ActionInputs.get_tag_name()
+            )
+        return self._compare_preflight
+
     def _handle_since_time_mode(self, repo: Repository, data: MinedData) -> None:
         """
         Handle since-time mode: mine issues, PRs, and commits based on release timestamp.
@@ -196,21 +275,253 @@ class DataMiner:
         Logic:
           - Fetch all issues and open issues since the release timestamp.
           - De-duplicate by issue number to include long-lived open issues.
-          - Fetch all closed PRs on default branch.
-          - Fetch commits since the release timestamp (or all commits if no release).
+          - Fetch closed PRs on default branch updated since the release timestamp (or all if no release).
+          - Fetch commits since the release timestamp (or all commits if no release), read from the local clone
+            when configured.
         """
-        self._get_issues(data)
+        since = data.since
 
-        # Fetch closed PRs and commits, then reduce them by the latest release since time
-        pull_requests = list(
-            self._safe_call(repo.get_pulls)(state=PullRequestRecord.PR_STATE_CLOSED, base=repo.default_branch)
+        def _get_pulls() -> list[PullRequest]:
+            # Fetch closed PRs, then reduce them by the latest release since time
+            pulls = self._safe_call(repo.get_pulls)(
+                state=PullRequestRecord.PR_STATE_CLOSED, base=repo.default_branch, sort="updated", direction="desc"
+            )
+            return self._take_pulls_updated_since(self._paginator.iterate(pulls), since)
+
+        # the listings are independent once `since` is known
+        results = self._run_listings_concurrently(
+            "Since-time listings",
+            {
+                "issues": lambda: self._get_issues(data),
+                "pull requests": _get_pulls,
+                "commits": lambda: self._get_commits(repo, since, data.release.tag_name if data.release else None),
+            },
         )
-        data.pull_requests = {pr: data.home_repository for pr in pull_requests}
-        if data.since:
-            commits = list(self._safe_call(repo.get_commits)(since=data.since))
+        data.pull_requests = {pr: data.home_repository for pr in results["pull requests"]}
+        data.commits = {c: data.home_repository for c in results["commits"]}
+
+    def _get_commits(self, repo: Repository, since: Optional[datetime], tag: Optional[str]) -> list[GithubCommit]:
+        if (local_commits := self._get_local_commits(repo, since, tag)) is not None:
+            return local_commits
+        if since:
+            return self._paginator.collect(self._safe_call(repo.get_commits)(since=since))
+        return self._paginator.collect(self._safe_call(repo.get_commits)())
+
+    def _get_local_commits(
+        self, repo: Repository, since: Optional[datetime], tag: Optional[str]
+    ) -> Optional[list[GithubCommit]]:
+        """
+        Read the commits of the default branch since the moment, not in the tag, from the local clone if configured.
+
+        Returns:
+            Optional[list[GithubCommit]]: The commits, or None when no clone is configured or it cannot be read.
+        """
+        if (local := self._open_local_clone(repo)) is None:
+            return None
+        try:
+            commits: list[GithubCommit] = local.commits_since(repo.default_branch, since, tag)
+        except LocalGitError as e:
+            logger.warning("Local clone cannot be used, listing commits via the API: %s", e)
+            return None
+        logger.info("Read %d commit(s) of '%s' from local clone '%s'.", len(commits), repo.default_branch, local.path)
+        # keep only those FilterByRelease keeps (authored after the release), their authors are linked to GitHub
+        return local.link_author_logins([c for c in commits if since is None or c.commit.author.date > since])
+
+    def _open_local_clone(self, repo: Repository) -> Optional[LocalGitRepository]:
+        """The configured local clone, kept to link the authors of the commits read from it; None when none is."""
+        if path := ActionInputs.get_local_repository_path():
+            self._local_clone = LocalGitRepository(
+                path, self.github_instance.requester, repo.full_name, repo.html_url, rate_limiter=self._rate_limiter
+            )
+        return self._local_clone
+
+    def _handle_since_time_mode_with_state(self, repo: Repository, data: MinedData, state_file: str) -> None:
+        """
+        Handle since-time mode incrementally from the state persisted by the previous run.
+
+        Logic:
+          - Reuse the stored state when it was mined for the same repository and release timestamp,
+            otherwise mine everything as in since-time mode.
+          - Persist the mined data together with the new high-water mark for the next run.
+        """
+        mined_at = datetime.now(timezone.utc) - _MINING_STATE_OVERLAP
+        state = MiningState.load(state_file)
+
+        if state is not None and state.matches(repo.full_name, data.since):
+            logger.info("Incremental mining: fetching changes since %s.", state.high_water_mark)
+            self._handle_incremental_since_time_mode(repo, data, state)
         else:
-            commits = list(self._safe_call(repo.get_commits)())
-        data.commits = {c: data.home_repository for c in commits}
+            if state is not None:
+                logger.info("Mining state belongs to another repository or release, running full mining.")
+            self._handle_since_time_mode(repo, data)
+
+        payloads = [self._raw_payloads(objects) for objects in (data.issues, data.pull_requests, data.commits)]
+        if any(p is None for p in payloads):
+            logger.warning("Mined data has no raw payload, mining state not saved.")
+            return
+
+        MiningState(
+            repository=repo.full_name,
+            since=data.since,
+            high_water_mark=mined_at,
+            head_sha=next(iter(data.commits)).sha if data.commits else None,
+            issues=payloads[0],  # type: ignore[arg-type]
+            pull_requests=payloads[1],  # type: ignore[arg-type]
+            commits=payloads[2],  # type: ignore[arg-type]
+            sub_issues=data.mined_sub_issues,
+        ).save(state_file)
+
+    def _handle_incremental_since_time_mode(self, repo: Repository, data: MinedData, state: MiningState) -> None:
+        """
+        Merge the objects updated since the high-water mark into the stored state.
+
+        Logic:
+          - Issues updated since the mark are mined as in a full run and replace their stored version. An issue
+            not updated since the mark keeps its stored state and sub-issues, so the stored open issues are still open.
+          - Pull requests updated since the mark replace their stored version when closed on the default branch,
+            otherwise (reopened, re-targeted) they are dropped.
+          - New commits are read by comparing the stored head with the default branch; a rewritten history
+            falls back to listing all commits.
+          - Each collection is ordered as the full listings order it, so the output matches a full run.
+        """
+        requester = self.github_instance.requester
+        high_water_mark = state.high_water_mark
+
+        def _merge_issues() -> list[Issue]:
+            issues = {i.number: i for i in state.build_issues(requester)}
+            updated_issues = self._mine_issues_via_graphql(data, high_water_mark, with_open=False)
+            if updated_issues is None:
+                updated_issues = self._paginator.collect(
+                    self._safe_call(repo.get_issues)(state=IssueRecord.ISSUE_STATE_ALL, since=high_water_mark)
+                )
+            for issue in updated_issues:
+                issues[issue.number] = issue
+            logger.debug("Incremental mining: %d issue(s) updated since last run.", len(updated_issues))
+
+            # adding or removing a sub-issue updates the parent, the stored sub-issues of the others are current
+            kept = {get_id(i, repo) for i in issues.values()} - {get_id(i, repo) for i in updated_issues}
+            stored = {parent: children for parent, children in state.sub_issues.items() if parent in kept}
+            data.mined_sub_issues = {**stored, **data.mined_sub_issues}
+
+            # full run order: issues updated since the release first, then the remaining (open) ones, newest first
+            ordered_issues = sorted(issues.values(), key=lambda i: i.number, reverse=True)
+            ordered_issues.sort(key=lambda i: data.since is not None and i.updated_at < data.since)
+            return ordered_issues
+
+        def _merge_pulls() -> list[PullRequest]:
+            pulls = {p.number: p for p in state.build_pull_requests(requester)}
+            updated_pulls = self._safe_call(repo.get_pulls)(state="all", sort="updated", direction="desc")
+            for pull in self._take_pulls_updated_since(self._paginator.iterate(updated_pulls), high_water_mark):
+                if pull.state == PullRequestRecord.PR_STATE_CLOSED and pull.base.ref == repo.default_branch:
+                    pulls[pull.number] = pull
+                else:
+                    pulls.pop(pull.number, None)
+
+            oldest = datetime.min.replace(tzinfo=timezone.utc)
+            return sorted(pulls.values(), key=lambda p: p.updated_at or oldest, reverse=True)
+
+        results = self._run_listings_concurrently(
+            "Incremental listings",
+            {
+                "issues": _merge_issues,
+                "pull requests": _merge_pulls,
+                "commits": lambda: self._get_commits_since_head(repo, data.since, state),
+            },
+        )
+        data.issues = {i: data.home_repository for i in results["issues"]}
+        data.pull_requests = {p: data.home_repository for p in results["pull requests"]}
+        data.commits = {c: data.home_repository for c in results["commits"]}
+
+    def _get_commits_since_head(
+        self, repo: Repository, since: Optional[datetime], state: MiningState
+    ) -> list[GithubCommit]:
+        if state.head_sha is None:
+            return self._get_commits(repo, since, None)
+
+        comparison = self._safe_call(repo.compare)(state.head_sha, repo.default_branch)
+        if comparison is None or comparison.status not in ("ahead", "identical"):
+            logger.info("Incremental mining: history of %s was rewritten, listing all commits.", repo.default_branch)
+            return self._get_commits(repo, since, None)
+
+        # compare lists commits oldest first, keep only those FilterByRelease keeps (authored after the release)
+        new_commits = [c for c in comparison.commits if since is None or c.commit.author.date > since]
+        logger.debug("Incremental mining: %d new commit(s) since last run.", len(new_commits))
+        return list(reversed(new_commits)) + state.build_commits(self.github_instance.requester)
+
+    @staticmethod
+    def _run_listings_concurrently(phase: str, listings: dict[str, Callable[[], Any]]) -> dict[str, Any]:
+        """
+        Run independent listings at the same time and log the duration of each one and of the whole phase.
+
+        The listings share the thread-safe rate limiter of the miner, so the wall-clock of the phase is
+        the duration of the slowest listing instead of the sum of all of them.
+
+        Parameters:
+            phase (str): The phase name used in the timing log.
+            listings (dict[str, Callable[[], Any]]): The listings by their names.
+        Returns:
+            dict[str, Any]: The results of the listings by their names.
+        """
+        durations: dict[str, float] = {}
+
+        def _timed(name: str, listing: Callable[[], Any]) -> Any:
+            started = time.perf_counter()
+            try:
+                return listing()
+            finally:
+                durations[name] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(listings), thread_name_prefix="mine-listing") as ex:
+            futures = {name: ex.submit(_timed, name, listing) for name, listing in listings.items()}
+            results = {name: future.result() for name, future in futures.items()}
+
+        logger.info(
+            "%s finished in %.2fs wall-clock (%s).",
+            phase,
+            time.perf_counter() - started,
+            ", ".join(f"{name}: {durations[name]:.2f}s" for name in listings),
+        )
+        return results
+
+    @staticmethod
+    def _raw_payloads(objects: Iterable[Any]) -> Optional[list[dict[str, Any]]]:
+        payloads = []
+        for obj in objects:
+            # `_rawData` keeps the received payload, `raw_data` would trigger a lazy completion
+            raw = getattr(obj, "_rawData", None)
+            if not isinstance(raw, dict):
+                return None
+            payloads.append(raw)
+        return payloads
+
+    @staticmethod
+    def _take_pulls_updated_since(
+        pulls: Optional[Iterable[PullRequest]], since: Optional[datetime]
+    ) -> list[PullRequest]:
+        """
+        Take pull requests from a listing sorted by `updated` in descending order until the first one
+        last updated before `since`.
+
+        Note: A PR closed or merged after `since` is always updated after it too, so the skipped tail
+        contains nothing FilterByRelease would keep. Stopping the iteration stops the pagination.
+
+        Parameters:
+            pulls: The pull requests sorted by update time, newest first.
+            since: The release timestamp; when None all pull requests are taken.
+        Returns:
+            list[PullRequest]: The pull requests updated at or after `since`.
+        """
+        if since is None:
+            return list(pulls or [])
+
+        taken: list[PullRequest] = []
+        for pull in pulls or []:
+            if pull.updated_at is not None and pull.updated_at < since:
+                break
+            taken.append(pull)
+        logger.debug("Took %d closed PR(s) updated since %s.", len(taken), since)
+        return taken
 
     def mine_missing_sub_issues(self, data: MinedData) -> tuple[dict[Issue, Repository], dict[str, list[PullRequest]]]:
         """
@@ -222,7 +533,9 @@ class DataMiner:
             dict[str, list[PullRequest]]: A dictionary mapping fetched cross-repo issue with its pull requests.
         """
         logger.info("Mapping sub-issues...")
-        data.parents_sub_issues = self._scan_sub_issues_for_parents([get_id(i, r) for i, r in data.issues.items()])
+        data.parents_sub_issues = self._scan_sub_issues_for_parents(
+            [get_id(i, r) for i, r in data.issues.items()], known=data.mined_sub_issues
+        )
 
         logger.info("Fetch all repositories in cache...")
         self._fetch_all_repositories_in_cache(data)
@@ -236,50 +549,69 @@ class DataMiner:
         return fetched_issues, prs_of_fetched_cross_repo_issues
 
     def _make_bulk_sub_issue_collector(self) -> BulkSubIssueCollector:
-        return BulkSubIssueCollector(ActionInputs.get_github_token())
+        return BulkSubIssueCollector(ActionInputs.get_github_token(), rate_limiter=self._rate_limiter)
 
-    def _scan_sub_issues_for_parents(self, parents_to_check: list[str]) -> dict[str, list[str]]:
+    def _scan_sub_issues_for_parents(
+        self, parents_to_check: list[str], known: Optional[dict[str, list[str]]] = None
+    ) -> dict[str, list[str]]:
         """
-        Scan sub-issues for parents.
+        Scan sub-issues for parents, down through all levels of the hierarchy.
+
+        With a sub-issue graph file, the stored sub-issues of the issues not updated since the previous run are
+        reused and only the others are scanned; the file is rewritten with the scanned hierarchy.
 
         Parameters:
             parents_to_check (list[str]): List of parent issue IDs to check.
+            known (Optional[dict[str, list[str]]]): Sub-issues already received while mining. Parents present
+                in it are not scanned again; an empty list marks an issue without sub-issues.
         Returns:
             dict[str, list[str]]: A dictionary mapping parent issue IDs to their sub-issue IDs.
         """
-        new_parent_ids: list[str] = parents_to_check
-        bulk_sub_issue_collector = self._make_bulk_sub_issue_collector()
-        parents_sub_issues: dict[str, list[str]] = {}
-
-        # run in cycle to get all levels of hierarchy
-        while new_parent_ids:
-            logger.debug("Scanning sub-issues with parent ids: %s", new_parent_ids)
-            new_parent_ids = bulk_sub_issue_collector.scan_sub_issues_for_parents(new_parent_ids)
-            parents_sub_issues.update(bulk_sub_issue_collector.parents_sub_issues)
+        known = dict(known or {})
+        graph_file = ActionInputs.get_sub_issue_graph_file()
+        current_updated_at: dict[str, Optional[str]] = {}
+        if graph_file and (graph := SubIssueGraph.load(graph_file)) is not None:
+            stored = graph.reachable(parents_to_check)
+            fetcher = GraphQLIssueFetcher(self.github_instance.requester, self._rate_limiter)
+            current_updated_at = fetcher.fetch_updated_at(stored)
+            reusable = graph.reusable(current_updated_at)
+            logger.info("Reusing stored sub-issues of %d of %d issue(s) of the graph.", len(reusable), len(stored))
+            # the sub-issues received while mining are current, they win over the stored ones
+            known = {**reusable, **known}
+
+        logger.debug("Scanning sub-issues with parent ids: %s", parents_to_check)
+        collector = self._make_bulk_sub_issue_collector()
+        parents_sub_issues = collector.scan_hierarchy(parents_to_check, known=known)
+
+        if graph_file:
+            updated_at = {iid: ts for iid, ts in current_updated_at.items() if ts is not None} | collector.updated_at
+            SubIssueGraph(
+                children=dict(parents_sub_issues),
+                updated_at={iid: ts for iid, ts in updated_at.items() if iid in parents_sub_issues},
+            ).save(graph_file)
 
         return parents_sub_issues
 
     def _fetch_all_repositories_in_cache(self, data: MinedData) -> None:
-        def _check_repo_and_add(iid: str):
-            org, repo, _num = parse_issue_id(iid)
-            full_name = f"{org}/{repo}"
-            if data.get_repository(full_name) is None:
-                new_repo = self._fetch_repository(full_name=full_name)
-                if new_repo is None:
-                    logger.error("Repository fetch returned None for %s", full_name)
-                    return
+        """
+        Register the repositories of all parent and sub-issues which are not in the mined data yet.
 
-                data.add_repository(new_repo)
-                logger.debug("Fetched missing repository: %s", full_name)
+        The repositories are built lazily without an existence check: their issues are read by the repository URL,
+        so a missing repository surfaces as a missing issue.
+        """
+        issue_ids: set[str] = set(data.parents_sub_issues.keys())
+        for ids in data.parents_sub_issues.values():
+            issue_ids.update(ids)
 
-        # check keys
-        for iid in data.parents_sub_issues.keys():
-            _check_repo_and_add(iid)
+        full_names: set[str] = set()
+        for iid in issue_ids:
+            org, repo, _num = parse_issue_id(iid)
+            full_names.add(f"{org}/{repo}")
 
-        # check values
-        for ids in data.parents_sub_issues.values():
-            for iid in ids:
-                _check_repo_and_add(iid)
+        for full_name in sorted(name for name in full_names if data.get_repository(name) is None):
+            repository = build_lazy_repository(self.github_instance.requester, full_name)
+            self._repositories.add(repository)
+            data.add_repository(repository)
 
     def _fetch_missing_issues(
         self,
@@ -304,9 +636,12 @@ class DataMiner:
             logger.debug("Fetched 0 missing issues (nothing to check).")
             return fetched_issues
 
+        # resolve the issues in batched GraphQL queries, the REST worker fetches only those of failed batches
+        prefetched = GraphQLIssueFetcher(self.github_instance.requester, self._rate_limiter).fetch(to_check)
+
         # Thread pool
         with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch-issue") as ex:
-            futures = {ex.submit(self.__worker, pid, data, self._safe_call): pid for pid in to_check}
+            futures = {ex.submit(self.__worker, pid, data, self._safe_call, prefetched): pid for pid in to_check}
             for fut in as_completed(futures):
                 parent_id = futures[fut]
                 try:
@@ -362,7 +697,7 @@ class DataMiner:
 
     @staticmethod
     def __worker(
-        parent_id: str, data: MinedData, safe_call: Callable
+        parent_id: str, data: MinedData, safe_call: Callable, prefetched: Optional[dict[str, Optional[Issue]]] = None
     ) -> tuple[str, Optional[Issue], Optional[Repository], Optional[str]]:
         """
         Returns (parent_id, issue|None, repo|None, error|None)
@@ -378,12 +713,15 @@ class DataMiner:
         if r is None:
             return (parent_id, None, None, f"Cannot get repository for {org}/{repo}")
 
-        # GitHub call
-        try:
-            logger.debug("Fetching missing issue: %s", parent_id)
-            issue = safe_call(r.get_issue)(num)
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            return (parent_id, None, r, f"get_issue failed: {e}")
+        if prefetched is not None and parent_id in prefetched:
+            issue = prefetched[parent_id]
+        else:
+            # GitHub call
+            try:
+                logger.debug("Fetching missing issue: %s", parent_id)
+                issue = safe_call(r.get_issue)(num)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                return (parent_id, None, r, f"get_issue failed: {e}")
 
         if issue is None:
             return (parent_id, None, r, "Issue not found")
@@ -414,24 +752,27 @@ class DataMiner:
         Returns:
             bool: True if the repository exists, False otherwise.
         """
-        repo: Repository = self._safe_call(self.github_instance.get_repo)(ActionInputs.get_github_repository())
-        if repo is None:
+        return self._get_home_repository() is not None
+
+    def _get_home_repository(self) -> Optional[Repository]:
+        # compare mode reads the repository with the preflight query
+        preflight = self._get_compare_preflight()
+        if preflight is None:
+            return self.get_repository(ActionInputs.get_github_repository())
+        if preflight.repository is None:
             logger.error("Repository not found: %s", ActionInputs.get_github_repository())
-            return False
-        return True
+        else:
+            self._repositories.add(preflight.repository)
+        return preflight.repository
 
     def get_repository(self, full_name: str) -> Optional[Repository]:
         """
-        Retrieves the specified GitHub repository.
+        Retrieves the specified GitHub repository, fetching it on the first request only.
 
         Returns:
             Optional[Repository]: The GitHub repository if found, None otherwise.
         """
-        repo: Optional[Repository] = self._safe_call(self.github_instance.get_repo)(full_name)
-        if repo is None:
-            logger.error("Repository not found: %s", full_name)
-            return None
-        return repo
+        return self._repositories.get(full_name)
 
     def get_latest_release(self, repository: Repository) -> Optional[GitRelease]:
         """
@@ -446,7 +787,11 @@ class DataMiner:
         # check if from-tag name is defined
         if ActionInputs.is_from_tag_name_defined():
             logger.info("Getting latest release by from-tag name %s", ActionInputs.get_from_tag_name())
-            rls = self._safe_call(repository.get_release)(ActionInputs.get_from_tag_name())
+            preflight = self._get_compare_preflight()
+            if preflight is not None:
+                rls = preflight.release
+            else:
+                rls = self._safe_call(repository.get_release)(ActionInputs.get_from_tag_name())
 
             if rls is None:
                 logger.error(
@@ -456,7 +801,7 @@ class DataMiner:
 
         else:
             logger.info("Getting latest release by semantic ordering (could not be the last one by time).")
-            gh_releases: list = list(self._safe_call(repository.get_releases)())
+            gh_releases: list = self._paginator.collect(self._safe_call(repository.get_releases)())
             rls = self.__get_latest_semantic_release(gh_releases)
 
             if rls is None:
@@ -486,7 +831,14 @@ class DataMiner:
         logger.info("Fetching issues from repository...")
 
         if data.release is None:
-            issues = list(self._safe_call(data.home_repository.get_issues)(state=IssueRecord.ISSUE_STATE_ALL))
+            if (mined_issues := self._mine_issues_via_graphql(data, None)) is not None:
+                data.issues = {i: data.home_repository for i in mined_issues}
+                logger.info("Fetched %d issues", len(data.issues))
+                return
+
+            issues = self._paginator.collect(
+                self._safe_call(data.home_repository.get_issues)(state=IssueRecord.ISSUE_STATE_ALL)
+            )
             data.issues = {i: data.home_repository for i in issues}
 
             logger.info("Fetched %d issues", len(data.issues.items()))
@@ -501,29 +853,54 @@ class DataMiner:
         elif getattr(data.release, "created_at", None) is not None:
             data.since = data.release.created_at  # type: ignore[assignment]
 
-        issues_since = self._safe_call(data.home_repository.get_issues)(
-            state=IssueRecord.ISSUE_STATE_ALL,
-            since=data.since,
-        )
-        open_issues = self._safe_call(data.home_repository.get_issues)(
-            state=IssueRecord.ISSUE_STATE_OPEN,
+        if (mined_issues := self._mine_issues_via_graphql(data, data.since)) is not None:
+            data.issues = {i: data.home_repository for i in mined_issues}
+            logger.info("Fetched %d issues (deduplicated).", len(data.issues))
+            return
+
+        home_repository, since = data.home_repository, data.since
+        listings = self._run_listings_concurrently(
+            "Issue listings",
+            {
+                "issues since": lambda: self._paginator.collect(
+                    self._safe_call(home_repository.get_issues)(state=IssueRecord.ISSUE_STATE_ALL, since=since)
+                ),
+                "open issues": lambda: self._paginator.collect(
+                    self._safe_call(home_repository.get_issues)(state=IssueRecord.ISSUE_STATE_OPEN)
+                ),
+            },
         )
+        by_number: dict[int, Issue] = {}
+        for issue in list(listings["issues since"]) + list(listings["open issues"]):
+            if (num := getattr(issue, "number", None)) is not None:
+                by_number.setdefault(num, issue)
+        data.issues = {i: data.home_repository for i in list(by_number.values())}
+        logger.info("Fetched %d issues (deduplicated).", len(data.issues))
 
-        issues_since = list(issues_since or [])
-        open_issues = list(open_issues or [])
+    def _mine_issues_via_graphql(
+        self, data: MinedData, since: Optional[datetime], with_open: bool = True
+    ) -> Optional[list[Issue]]:
+        """
+        Mine the issues with labels, type, assignees and, with the hierarchy, first-level sub-issues via GraphQL.
 
-        by_number = {}
-        for issue in issues_since:
-            num = getattr(issue, "number", None)
-            if num is not None and num not in by_number:
-                by_number[num] = issue
-        for issue in open_issues:
-            num = getattr(issue, "number", None)
-            if num is not None and num not in by_number:
-                by_number[num] = issue
+        Parameters:
+            data (MinedData): The mined data; its `mined_sub_issues` is filled.
+            since (Optional[datetime]): The issues updated since the moment are mined, all when None.
+            with_open (bool): Whether the open issues not updated since the moment are mined too.
+        Returns:
+            Optional[list[Issue]]: The mined issues, or None when the GraphQL mining failed and REST is to be used.
+        """
+        owner, name = data.home_repository.full_name.split("/", 1)
+        hierarchy = ActionInputs.get_hierarchy()
+        graphql_miner = GraphQLIssueMiner(self.github_instance.requester, self._rate_limiter, with_sub_issues=hierarchy)
+        try:
+            issues = graphql_miner.mine(owner, name, since, with_open=with_open)
+        except (GithubException, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning("GraphQL issue mining failed, falling back to REST listings: %s", e)
+            return None
 
-        data.issues = {i: data.home_repository for i in list(by_number.values())}
-        logger.info("Fetched %d issues (deduplicated).", len(data.issues))
+        data.mined_sub_issues = graphql_miner.sub_issues
+        return issues
 
     @staticmethod
     def __get_latest_semantic_release(releases) -> Optional[GitRelease]:
@@ -591,9 +968,18 @@ class DataMiner:
         return data
 
     def _fetch_prs_for_fetched_cross_issues(self, issues: dict[Issue, Repository]) -> dict[str, list[PullRequest]]:
+        issue_ids = {i: get_id(i, repo) for i, repo in issues.items()}
+        fetcher = GraphQLIssueFetcher(self.github_instance.requester, self._rate_limiter)
+        cross_referencing_pulls = fetcher.fetch_cross_referencing_pulls(list(issue_ids.values()))
+
         prs_of_cross_repo_issues: dict[str, list[PullRequest]] = {}
-        for i, repo in issues.items():
-            prs_of_cross_repo_issues[iid := get_id(i, repo)] = []
+        for i, iid in issue_ids.items():
+            if iid in cross_referencing_pulls:
+                prs_of_cross_repo_issues[iid] = cross_referencing_pulls[iid]
+                continue
+
+            # not resolved by the batched query, walk the REST timeline
+            prs_of_cross_repo_issues[iid] = []
             try:
                 for ev in i.get_timeline():  # timeline includes cross-references
                     if ev.event == "cross-referenced" and getattr(ev, "source", None):
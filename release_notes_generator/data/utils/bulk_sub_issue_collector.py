@@ -23,16 +23,26 @@ from __future__ import annotations
 import json
 import logging
 import time
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 import requests
 
+from release_notes_generator.data.utils.sub_issue_query_planner import (
+    QUERY_TOO_LARGE_ERROR_TYPES,
+    PlannedQuery,
+    QueryTooLargeError,
+    SubIssueBatch,
+    SubIssueQueryPlanner,
+)
+from release_notes_generator.utils.github_rate_limiter import GRAPHQL_RESOURCE, GithubRateLimiter
 from release_notes_generator.utils.record_utils import parse_issue_id, format_issue_id
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
-class CollectorConfig:
+class CollectorConfig:  # pylint: disable=too-many-instance-attributes
     """
     Configuration options for BulkSubIssueCollector.
     Override defaults when instantiating if you need custom behavior.
@@ -49,16 +59,35 @@ class CollectorConfig:
     # Pagination and batching
     per_page: int = 100  # Max allowed by GitHub for subIssues
     max_parents_per_repo: int = 100  # Max issue aliases per repository(...) block
-    max_repos_per_request: int = 1  # Max repository blocks per query
+    max_repos_per_request: int = 20  # Upper bound of repository blocks per query
+    max_query_cost: int = 100  # Rate limit points a planned query may cost
+    max_query_nodes: int = 100_000  # Nodes a planned query may return; GitHub refuses more than 500,000
+
+    # Concurrency
+    max_workers: int = 4  # Queries running at once over the shared session
 
     # Pacing
     gentle_pacing_seconds: float = 0.05
 
 
+@dataclass
+class _ScanState:
+    """Work queue of one scan."""
+
+    known: dict[str, list[str]]
+    expand: bool  # queue the found parents, or only report them
+    pending: SubIssueBatch = field(default_factory=dict)
+    seen: set[str] = field(default_factory=set)
+    new_parents: set[str] = field(default_factory=set)
+
+
 class BulkSubIssueCollector:
     """
     Collect sub-issues for received parent issues in bulk via GitHub GraphQL API.
     Prepare list of new parents build from found sub-issues.
+
+    Queries run concurrently off a work queue of parents and their next-page cursors. Their size is planned by
+    SubIssueQueryPlanner from the estimated node count and rate limit cost of the parents.
     """
 
     def __init__(
@@ -66,18 +95,30 @@ class BulkSubIssueCollector:
         token: str,
         cfg: CollectorConfig | None = None,
         session: requests.Session | None = None,
+        rate_limiter: GithubRateLimiter | None = None,
     ):
         self._cfg = cfg or CollectorConfig()
         self._session = session or requests.Session()
+        self._rate_limiter = rate_limiter
         self._headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json",
         }
 
+        self._planner = SubIssueQueryPlanner(
+            per_page=self._cfg.per_page,
+            max_cost=self._cfg.max_query_cost,
+            max_nodes=self._cfg.max_query_nodes,
+            max_aliases_per_repo=self._cfg.max_parents_per_repo,
+            max_repos=self._cfg.max_repos_per_request,
+            concurrency=self._cfg.max_workers,
+        )
+
         # Parent -> list of its direct sub-issues ("org/repo#n")
         self.parents_sub_issues: dict[str, list[str]] = {}
+        # Issue -> its `updatedAt`, for the issues read by the queries of the latest scan
+        self.updated_at: dict[str, str] = {}
 
-    # pylint: disable=too-many-locals,too-many-statements,too-many-branches
     def scan_sub_issues_for_parents(self, parents_to_check: list[str]) -> list[str]:
         """
         Input:  ["org/repo#123", "org2/repo2#77", ...]
@@ -87,131 +128,150 @@ class BulkSubIssueCollector:
         if not parents_to_check:
             return []
 
-        new_parents_to_check: set[str] = set()
-        self.parents_sub_issues = {}
+        state = _ScanState(known={}, expand=False)
+        self._scan(parents_to_check, state)
 
-        by_repo: dict[tuple[str, str], list[int]] = {}
-        originals: set[str] = set()
-
-        for raw in parents_to_check:
-            org, repo, num = parse_issue_id(raw)
-            by_repo.setdefault((org, repo), []).append(num)
-            originals.add(raw)
-
-        # Outer chunk by repositories to keep queries within safe length.
-        repo_items = list(by_repo.items())
-        for i in range(0, len(repo_items), self._cfg.max_repos_per_request):
-            repo_chunk = repo_items[i : i + self._cfg.max_repos_per_request]
-
-            # Maintain cursors per (org, repo, issue).
-            cursors: dict[tuple[str, str, int], str | None] = {}
-            remaining_by_repo: dict[tuple[str, str], set[int]] = {k: set(v) for k, v in repo_chunk}
-            for (org, repo), nums in remaining_by_repo.items():
-                for n in nums:
-                    cursors[(org, repo, n)] = None
-
-            # Continue until all parents in this chunk are fully paginated.
-            while any(remaining_by_repo.values()):
-                # Build one GraphQL query with up to max_repos_per_request repos,
-                # each with up to max_parents_per_repo parent issues that still have pages.
-                repo_blocks: list[str] = []
-                alias_maps: dict[str, tuple[str, str, int]] = {}  # alias -> (org, repo, parent_num)
-
-                for r_idx, ((org, repo), parents_rem) in enumerate(remaining_by_repo.items()):
-                    if not parents_rem:
-                        continue
-                    current_parents = list(parents_rem)[: self._cfg.max_parents_per_repo]
-                    issue_blocks: list[str] = []
-                    for p_idx, parent_num in enumerate(current_parents):
-                        alias = f"i{r_idx}_{p_idx}"
-                        alias_maps[alias] = (org, repo, parent_num)
-                        after = cursors[(org, repo, parent_num)]
-                        after_part = f', after: "{after}"' if after else ""
-                        issue_blocks.append(
-                            f"{alias}: issue(number: {parent_num}) {{\n"
-                            "  number\n"
-                            f"  subIssues(first: {self._cfg.per_page}{after_part}) {{\n"
-                            "    nodes {\n"
-                            "      number\n"
-                            "      repository { owner { login } name }\n"
-                            "      # only count to decide if child is also a parent\n"
-                            "      subIssues(first: 0) { totalCount }\n"
-                            "    }\n"
-                            "    pageInfo { hasNextPage endCursor }\n"
-                            "  }\n"
-                            "}"
-                        )
-                    if issue_blocks:
-                        repo_alias = f"r{r_idx}"
-                        repo_blocks.append(
-                            f'{repo_alias}: repository(owner: "{org}", name: "{repo}") {{\n'
-                            f"   {' '.join(issue_blocks)}\n"
-                            " }"
-                        )
-
-                if not repo_blocks:
-                    break
-
-                query = f"query Bulk {{ {' '.join(repo_blocks)} }}"
-                data = self._post_graphql({"query": query})
-
-                # Parse results: top-level 'data' contains our repo aliases
-                d_repo = data.get("data", {})
-
-                for alias, (org, repo, parent_num) in alias_maps.items():
-                    issue_node = self._find_alias_node(d_repo, alias)
-                    parent_id = format_issue_id(org, repo, parent_num)
-
-                    if issue_node is None:
-                        # Parent not found / no access — mark as complete
-                        remaining_by_repo[(org, repo)].discard(parent_num)
-                        # Ensure map key exists (empty list)
-                        self.parents_sub_issues.setdefault(parent_id, [])
-                        logger.info("No sub-issues found for parent %s.", parent_id)
-                        continue
-
-                    conn = issue_node["subIssues"]
-                    child_ids: list[str] = self.parents_sub_issues.setdefault(parent_id, [])
-
-                    for child in conn.get("nodes", []):
-                        child_num = child["number"]
-                        child_org = child["repository"]["owner"]["login"]
-                        child_repo = child["repository"]["name"]
-                        child_id = format_issue_id(child_org, child_repo, child_num)
-                        # Save every direct child in the mapping (no duplicates)
-                        if child_id not in child_ids:
-                            child_ids.append(child_id)
-
-                        # If the child has children, it's a "new parent"
-                        if child_id not in originals:
-                            if child["subIssues"]["totalCount"] > 0:
-                                new_parents_to_check.add(child_id)
-                            else:
-                                # save no sub-issues for non-parents
-                                self.parents_sub_issues.setdefault(child_id, [])
-
-                    logger.debug("Sub-issues found for parent %s: %s", parent_id, child_ids)
-
-                    page = conn["pageInfo"]
-                    if page["hasNextPage"]:
-                        cursors[(org, repo, parent_num)] = page["endCursor"]
-                    else:
-                        remaining_by_repo[(org, repo)].discard(parent_num)
+        # Deterministic order
+        return sorted(state.new_parents, key=parse_issue_id)
 
-                # Gentle pacing to avoid secondary limits
-                time.sleep(self._cfg.gentle_pacing_seconds)
+    def scan_hierarchy(
+        self, parents_to_check: list[str], known: dict[str, list[str]] | None = None
+    ) -> dict[str, list[str]]:
+        """
+        Input:  ["org/repo#123", "org2/repo2#77", ...] and the sub-issues already known for some of them,
+                where an empty list marks an issue without sub-issues.
+        Output: parent ID -> its direct sub-issue IDs, for all levels of the hierarchy below the parents.
 
-        # Deterministic order
-        # return sorted(new_parents_to_check, key=lambda s: (lambda o, r, n: (o, r, n))(*parse_issue_id(s)))
-        return sorted(new_parents_to_check, key=parse_issue_id)
+        A child with sub-issues is queued as soon as its parent's page is read and rides along the next query,
+        so the levels overlap instead of waiting for the previous one to be fully paginated.
+        """
+        self._scan(parents_to_check, _ScanState(known=known or {}, expand=True))
+        return self.parents_sub_issues
 
     # ---------- internals ----------
 
+    def _scan(self, parents_to_check: list[str], state: _ScanState) -> None:
+        """Query the queued parents concurrently until no parent has pages left."""
+        self.parents_sub_issues = {}
+        self.updated_at = {}
+        state.seen.update(parents_to_check)
+        self._queue_parents(parents_to_check, state)
+
+        running: dict[Future, PlannedQuery] = {}
+        with ThreadPoolExecutor(max_workers=self._cfg.max_workers, thread_name_prefix="scan-sub-issues") as ex:
+            try:
+                while state.pending or running:
+                    # queries are planned when a worker frees up, so each one uses the latest cost feedback
+                    while state.pending and len(running) < self._cfg.max_workers:
+                        planned = self._planner.plan(state.pending)
+                        running[ex.submit(self._post_query, planned.text)] = planned
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        planned = running.pop(future)
+                        try:
+                            data = future.result()
+                        except QueryTooLargeError:
+                            if not self._planner.shrink(planned, state.pending):
+                                raise
+                            continue
+                        self._read_result(data, planned, state)
+            except BaseException:
+                for future in running:
+                    future.cancel()
+                raise
+
+        logger.debug(
+            "Sub-issue queries so far: %d, planned %.1f point(s), observed %d point(s).",
+            self._planner.queries_count,
+            self._planner.planned_cost_total,
+            self._planner.observed_cost_total,
+        )
+
+    def _queue_parents(self, parent_ids: list[str], state: _ScanState) -> None:
+        """Queue parents for their first page; the known ones are resolved right away with their known children."""
+        to_queue = deque(parent_ids)
+        while to_queue:
+            parent_id = to_queue.popleft()
+            if parent_id not in state.known:
+                org, repo, num = parse_issue_id(parent_id)
+                state.pending.setdefault((org, repo), {})[num] = None
+                continue
+
+            self.parents_sub_issues[parent_id] = list(state.known[parent_id])
+            for child_id in state.known[parent_id]:
+                if child_id in state.seen:
+                    continue
+                if state.known.get(child_id) == []:
+                    self.parents_sub_issues.setdefault(child_id, [])
+                else:
+                    state.seen.add(child_id)
+                    to_queue.append(child_id)
+
+    def _post_query(self, query: str) -> dict:
+        data = self._post_graphql({"query": query})
+        # Gentle pacing to avoid secondary limits
+        time.sleep(self._cfg.gentle_pacing_seconds)
+        return data
+
+    def _read_result(self, data: dict, planned: PlannedQuery, state: _ScanState) -> None:
+        """Record the sub-issues of the queried parents, queue their next pages and the newly found parents."""
+        # Parse results: top-level 'data' contains our repo aliases
+        d_repo = data.get("data", {})
+        self._planner.observe(planned, d_repo.get("rateLimit"))
+
+        for alias, (org, repo, parent_num) in planned.aliases.items():
+            issue_node = self._find_alias_node(d_repo, alias)
+            parent_id = format_issue_id(org, repo, parent_num)
+
+            if issue_node is None:
+                # Parent not found / no access — mark as complete, ensure map key exists (empty list)
+                self.parents_sub_issues.setdefault(parent_id, [])
+                logger.info("No sub-issues found for parent %s.", parent_id)
+                continue
+
+            if issue_node.get("updatedAt"):
+                self.updated_at[parent_id] = issue_node["updatedAt"]
+            conn = issue_node["subIssues"]
+            child_ids: list[str] = self.parents_sub_issues.setdefault(parent_id, [])
+
+            for child in conn.get("nodes", []):
+                child_num = child["number"]
+                child_org = child["repository"]["owner"]["login"]
+                child_repo = child["repository"]["name"]
+                child_id = format_issue_id(child_org, child_repo, child_num)
+                if child.get("updatedAt"):
+                    self.updated_at[child_id] = child["updatedAt"]
+                # Save every direct child in the mapping (no duplicates)
+                if child_id not in child_ids:
+                    child_ids.append(child_id)
+
+                # If the child has children, it's a "new parent"
+                if child_id in state.seen:
+                    continue
+                if child["subIssues"]["totalCount"] > 0:
+                    state.seen.add(child_id)
+                    if state.expand:
+                        self._queue_parents([child_id], state)
+                    else:
+                        state.new_parents.add(child_id)
+                else:
+                    # save no sub-issues for non-parents
+                    self.parents_sub_issues.setdefault(child_id, [])
+
+            logger.debug("Sub-issues found for parent %s: %s", parent_id, child_ids)
+
+            page = conn["pageInfo"]
+            if page["hasNextPage"]:
+                state.pending.setdefault((org, repo), {})[parent_num] = page["endCursor"]
+
     def _post_graphql(self, payload: dict) -> dict:
         last_exc: Exception | None = None
         for attempt in range(1, self._cfg.max_retries + 1):
             try:
                 logger.debug("Posting graphql query")
+                if self._rate_limiter is not None:
+                    self._rate_limiter.wait_if_needed(GRAPHQL_RESOURCE)
                 resp = self._session.post(
                     self._cfg.api_url,
                     headers=self._headers,
@@ -219,14 +279,23 @@ class BulkSubIssueCollector:
                     verify=self._cfg.verify_tls,
                     timeout=self._cfg.timeout,
                 )
+                if self._rate_limiter is not None:
+                    self._rate_limiter.update_from_headers(resp.headers)
                 resp.raise_for_status()
                 data = resp.json()
                 if data.get("errors"):
+                    if any(
+                        isinstance(e, dict) and e.get("type") in QUERY_TOO_LARGE_ERROR_TYPES for e in data["errors"]
+                    ):
+                        raise QueryTooLargeError(f"GitHub GraphQL query too large: {data['errors']}")
                     logger.error("GraphQL errors: %s", data["errors"])
                     raise RuntimeError(f"GitHub GraphQL errors: {data['errors']}")
 
                 logger.debug("Posted graphql query")
                 return data
+            except QueryTooLargeError:
+                # the same query fails again, the caller splits it
+                raise
             except Exception as e:  # pylint: disable=broad-exception-caught
                 last_exc = e
                 if attempt == self._cfg.max_retries:
@@ -0,0 +1,92 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Base of the clients resolving many objects per GitHub GraphQL query, with the batches queried in parallel.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Sequence, TypeVar
+
+from github.Requester import Requester
+
+from release_notes_generator.utils.github_rate_limiter import GithubRateLimiter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class GraphQLBatchResolver:
+    """
+    Split the keys of a request into batches, query the batches in parallel and merge their results.
+
+    Subclasses build and run the query of one batch; a batch which failed is left out of the result,
+    so the caller can resolve its keys another way.
+    """
+
+    # count of keys per query when none is given
+    default_batch_size: int = 50
+
+    def __init__(
+        self,
+        requester: Requester,
+        rate_limiter: Optional[GithubRateLimiter] = None,
+        batch_size: Optional[int] = None,
+        max_workers: int = 4,
+    ):
+        self._requester = requester
+        self._rate_limiter = rate_limiter
+        self._batch_size = batch_size or self.default_batch_size
+        self._max_workers = max_workers
+        self.queries_count: int = 0
+
+    def run_batches(
+        self,
+        keys: Sequence[T],
+        batch_size: int,
+        query_batch: Callable[[list[T]], Optional[dict[str, Any]]],
+        thread_name_prefix: str,
+        failure_message: str,
+    ) -> dict[str, Any]:
+        """
+        Query the keys in batches of the given size.
+
+        Parameters:
+            keys (Sequence[T]): The keys, in the order they are batched.
+            batch_size (int): The count of keys per query.
+            query_batch (Callable): Runs the query of one batch; returns its result or None when it failed.
+            thread_name_prefix (str): The name prefix of the worker threads.
+            failure_message (str): The warning logged for a failed batch, formatted with the count of its keys.
+        Returns:
+            dict[str, Any]: The merged results of the batches which succeeded.
+        """
+        batches = [list(keys[i : i + batch_size]) for i in range(0, len(keys), batch_size)]
+        if not batches:
+            return {}
+
+        merged: dict[str, Any] = {}
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix=thread_name_prefix) as ex:
+            for batch, result in zip(batches, ex.map(query_batch, batches)):
+                self.queries_count += 1
+                if result is None:
+                    logger.warning(failure_message, len(batch))
+                    continue
+                merged.update(result)
+        return merged
@@ -0,0 +1,182 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Resolve commits of a repository to the pull requests which merged them, or to their authors,
+many per GitHub GraphQL query.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+from github import GithubException
+from github.PullRequest import PullRequest
+
+from release_notes_generator.data.utils.graphql_batch_resolver import GraphQLBatchResolver
+from release_notes_generator.data.utils.graphql_issue_fetcher import build_pull_request
+from release_notes_generator.utils.constants import (
+    ASSOCIATED_PULL_REQUESTS_PAGE_SIZE,
+    COMMIT_AUTHORS_FETCH_BATCH_SIZE,
+    COMMIT_PULLS_FETCH_BATCH_SIZE,
+    PULL_REQUEST_FIELDS_FRAGMENT,
+)
+from release_notes_generator.utils.github_rate_limiter import graphql_query
+
+logger = logging.getLogger(__name__)
+
+
+class GraphQLCommitPullResolver(GraphQLBatchResolver):
+    """
+    Resolve commit SHAs to their merged pull requests through aliased `object(oid:)` fields.
+
+    `associatedPullRequests` finds the pull request of a commit however it was merged (merge commit, squash or
+    rebase) and whatever its subject says. The pull requests carry the fields the records need (body, labels,
+    author, merge state), so they are read without further requests. The same aliases resolve the GitHub logins
+    of commit authors, which commits read from a local clone lack.
+    """
+
+    default_batch_size = COMMIT_PULLS_FETCH_BATCH_SIZE
+
+    def resolve(
+        self, owner: str, name: str, shas: list[str], base_ref: Optional[str] = None
+    ) -> dict[str, list[PullRequest]]:
+        """
+        Resolve the commits to the pull requests of the repository which merged them.
+
+        A commit is also associated with pull requests which merged it elsewhere (e.g. into a feature branch).
+        Only the pull requests merged into the base branch or whose merge commit is one of the commits are kept.
+
+        Parameters:
+            owner (str): The owner of the repository.
+            name (str): The name of the repository.
+            shas (list[str]): The SHAs of the commits, e.g. the compared range.
+            base_ref (Optional[str]): The branch the commits were merged into; None keeps only the pull requests
+                whose merge commit is one of the commits.
+        Returns:
+            dict[str, list[PullRequest]]: The merged pull requests by commit SHA; an empty list marks a commit
+                merged without a pull request. SHAs of a failed batch or with more associated pull requests
+                than one page are left out, so the caller can resolve them another way.
+        """
+        unique = list(dict.fromkeys(shas))
+        in_range = set(unique)
+
+        def _resolve_batch(batch: list[str]) -> Optional[dict[str, Any]]:
+            return self._resolve_batch(owner, name, batch, base_ref, in_range)
+
+        resolved = self.run_batches(
+            unique,
+            self._batch_size,
+            _resolve_batch,
+            "resolve-commit-pulls",
+            "Batched resolution of %d commit(s) failed, their subjects are used.",
+        )
+        logger.debug("Resolved %d commit(s) in %d GraphQL query(ies).", len(resolved), self.queries_count)
+        return resolved
+
+    def resolve_author_logins(self, owner: str, name: str, shas: list[str]) -> dict[str, Optional[str]]:
+        """
+        Resolve the commits to the GitHub logins of their authors, as the REST commit payload links them.
+
+        Parameters:
+            owner (str): The owner of the repository.
+            name (str): The name of the repository.
+            shas (list[str]): The SHAs of the commits.
+        Returns:
+            dict[str, Optional[str]]: The author login by commit SHA; None marks an author without a GitHub account.
+                SHAs of a failed batch or unknown to GitHub are left out, so the caller can resolve them another way.
+        """
+
+        def _resolve_batch(batch: list[str]) -> Optional[dict[str, Any]]:
+            try:
+                repository = self._query_commits(owner, name, batch, "author { user { login } }")
+            except (GithubException, ValueError, KeyError, TypeError, AttributeError) as e:
+                logger.debug("Batched commit author query failed: %s", e)
+                return None
+            return {
+                sha: ((repository[f"c{i}"].get("author") or {}).get("user") or {}).get("login")
+                for i, sha in enumerate(batch)
+                if isinstance(repository.get(f"c{i}"), dict)
+            }
+
+        logins = self.run_batches(
+            list(dict.fromkeys(shas)),
+            COMMIT_AUTHORS_FETCH_BATCH_SIZE,
+            _resolve_batch,
+            "resolve-commit-authors",
+            "Batched author resolution of %d commit(s) failed, their noreply addresses are used.",
+        )
+        logger.debug("Resolved authors of %d commit(s) via GraphQL.", len(logins))
+        return logins
+
+    def _query_commits(
+        self, owner: str, name: str, batch: list[str], selection: str, fragment: str = ""
+    ) -> dict[str, Any]:
+        """Query the selection of each commit of the batch; the commits are aliased by their index."""
+        declarations = ", ".join(f"$oid{i}: GitObjectID!" for i in range(len(batch)))
+        commits = "\n    ".join(
+            f"c{i}: object(oid: $oid{i}) {{ ... on Commit {{ {selection} }} }}" for i in range(len(batch))
+        )
+        query = (
+            f"query ResolveCommits($owner: String!, $name: String!, {declarations}) {{\n"
+            f"  repository(owner: $owner, name: $name) {{\n    {commits}\n  }}\n}}\n"
+        ) + fragment
+        variables: dict[str, Any] = {"owner": owner, "name": name}
+        variables.update({f"oid{i}": sha for i, sha in enumerate(batch)})
+
+        payload = graphql_query(self._requester, query, variables, self._rate_limiter)
+        return (payload.get("data") or {}).get("repository") or {}
+
+    def _resolve_batch(
+        self, owner: str, name: str, batch: list[str], base_ref: Optional[str], in_range: set[str]
+    ) -> Optional[dict[str, Any]]:
+        selection = (
+            f"associatedPullRequests(first: {ASSOCIATED_PULL_REQUESTS_PAGE_SIZE}) "
+            "{ totalCount nodes { ...PullRequestFields } }"
+        )
+        try:
+            repository = self._query_commits(owner, name, batch, selection, PULL_REQUEST_FIELDS_FRAGMENT)
+            result: dict[str, list[PullRequest]] = {}
+            for i, sha in enumerate(batch):
+                pulls = (repository.get(f"c{i}") or {}).get("associatedPullRequests")
+                nodes = (pulls or {}).get("nodes") or []
+                if not isinstance(pulls, dict) or pulls.get("totalCount", 0) > len(nodes):
+                    continue
+                result[sha] = [
+                    build_pull_request(self._requester, node)
+                    for node in nodes
+                    if node
+                    and node.get("state") == "MERGED"
+                    and _is_repository(node, owner, name)
+                    and _is_merged_into(node, base_ref, in_range)
+                ]
+            return result
+        except (GithubException, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug("Batched commit query failed: %s", e)
+            return None
+
+
+def _is_repository(node: dict[str, Any], owner: str, name: str) -> bool:
+    repository = node.get("repository") or {}
+    full_name = f"{(repository.get('owner') or {}).get('login')}/{repository.get('name')}"
+    return full_name.lower() == f"{owner}/{name}".lower()
+
+
+def _is_merged_into(node: dict[str, Any], base_ref: Optional[str], in_range: set[str]) -> bool:
+    if base_ref is not None and node.get("baseRefName") == base_ref:
+        return True
+    return (node.get("mergeCommit") or {}).get("oid") in in_range
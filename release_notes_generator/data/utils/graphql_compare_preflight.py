@@ -0,0 +1,133 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Read everything compare mode checks before mining (repository, both tags, release of the previous tag)
+in one GitHub GraphQL query.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from github import GithubException, UnknownObjectException
+from github.GitRelease import GitRelease
+from github.Repository import Repository
+from github.Requester import Requester
+
+from release_notes_generator.utils.constants import COMPARE_PREFLIGHT_QUERY
+from release_notes_generator.utils.github_rate_limiter import GithubRateLimiter, graphql_query
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ComparePreflight:
+    """The repository of a compare run with the state of its tags; `repository` is None when it does not exist."""
+
+    repository: Optional[Repository]
+    tag_shas: dict[str, Optional[str]] = field(default_factory=dict)  # tag name -> SHA, None for a missing tag
+    release: Optional[GitRelease] = None
+
+
+class GraphQLComparePreflight:
+    """
+    Check the repository, both tags and the release of the previous tag of a compare run in a single query.
+
+    The repository and the release are built as lazy PyGithub objects from the response, so they replace
+    the REST objects of `get_repo` and `get_release` without further requests.
+    """
+
+    def __init__(self, requester: Requester, rate_limiter: Optional[GithubRateLimiter] = None):
+        self._requester = requester
+        self._rate_limiter = rate_limiter
+
+    def run(self, full_name: str, from_tag: str, to_tag: str) -> Optional[ComparePreflight]:
+        """
+        Run the preflight query.
+
+        Parameters:
+            full_name (str): The full name of the repository ('org/repo').
+            from_tag (str): The name of the previous tag.
+            to_tag (str): The name of the released tag.
+        Returns:
+            Optional[ComparePreflight]: The preflight or None when the query failed and the REST calls should be used.
+        """
+        owner, _, name = full_name.partition("/")
+        variables = {
+            "owner": owner,
+            "name": name,
+            "fromRef": f"refs/tags/{from_tag}",
+            "toRef": f"refs/tags/{to_tag}",
+            "fromTag": from_tag,
+        }
+
+        try:
+            payload = graphql_query(self._requester, COMPARE_PREFLIGHT_QUERY, variables, self._rate_limiter)
+            repository = payload["data"]["repository"]
+            if repository is None:
+                return ComparePreflight(repository=None)
+            return ComparePreflight(
+                repository=self._build_repository(repository),
+                tag_shas={
+                    from_tag: _target_oid(repository.get("fromRef")),
+                    to_tag: _target_oid(repository.get("toRef")),
+                },
+                release=self._build_release(repository["nameWithOwner"], repository.get("release")),
+            )
+        except UnknownObjectException:
+            return ComparePreflight(repository=None)
+        except (GithubException, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug("Compare preflight query failed, using REST calls: %s", e)
+            return None
+
+    def _build_repository(self, node: dict[str, Any]) -> Repository:
+        full_name = node["nameWithOwner"]
+        raw = {
+            "id": node.get("databaseId"),
+            "name": node.get("name"),
+            "full_name": full_name,
+            "owner": {"login": (node.get("owner") or {}).get("login")},
+            "private": node.get("isPrivate"),
+            "html_url": node.get("url"),
+            "url": f"{self._requester.base_url}/repos/{full_name}",
+            "default_branch": (node.get("defaultBranchRef") or {}).get("name"),
+        }
+        return Repository(self._requester, {}, raw, completed=False)
+
+    def _build_release(self, full_name: str, node: Optional[dict[str, Any]]) -> Optional[GitRelease]:
+        # GraphQL returns draft releases too, `get_release(tag)` answers them as not found
+        if node is None or node.get("isDraft"):
+            return None
+        raw = {
+            "id": node.get("databaseId"),
+            "tag_name": node.get("tagName"),
+            "name": node.get("name"),
+            "body": node.get("description"),
+            "draft": node.get("isDraft"),
+            "prerelease": node.get("isPrerelease"),
+            "created_at": node.get("createdAt"),
+            "published_at": node.get("publishedAt"),
+            "html_url": node.get("url"),
+            "url": f"{self._requester.base_url}/repos/{full_name}/releases/{node.get('databaseId')}",
+        }
+        return GitRelease(self._requester, {}, raw, completed=False)
+
+
+def _target_oid(ref: Optional[dict[str, Any]]) -> Optional[str]:
+    return ((ref or {}).get("target") or {}).get("oid")
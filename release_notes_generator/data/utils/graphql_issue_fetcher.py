@@ -0,0 +1,259 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Fetch issues of any repositories, or the pull requests cross-referencing them, by their ids,
+many per GitHub GraphQL query.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Optional
+
+from github import GithubException
+from github.Issue import Issue
+from github.PullRequest import PullRequest
+from github.Requester import Requester
+
+from release_notes_generator.data.utils.graphql_batch_resolver import GraphQLBatchResolver
+from release_notes_generator.data.utils.graphql_issue_miner import build_issue
+from release_notes_generator.utils.constants import (
+    CROSS_REFERENCES_FETCH_BATCH_SIZE,
+    CROSS_REFERENCES_PAGE_SIZE,
+    ISSUE_FIELDS_FRAGMENT,
+    ISSUES_FETCH_BATCH_SIZE,
+    PULL_REQUEST_FIELDS_FRAGMENT,
+    UPDATED_AT_FETCH_BATCH_SIZE,
+)
+from release_notes_generator.utils.github_rate_limiter import graphql_query
+from release_notes_generator.utils.record_utils import IssueIdParseError, parse_issue_id
+
+logger = logging.getLogger(__name__)
+
+# marks an issue the batched query could not resolve, left to the caller's fallback
+_UNRESOLVED = object()
+
+
+class GraphQLIssueFetcher(GraphQLBatchResolver):
+    """
+    Resolve issue ids ('org/repo#123') to issues through aliased `issue(number:)` fields.
+
+    The ids are grouped by repository and up to `batch_size` issues are resolved per query. The issues carry
+    the fields the records need (labels, type, assignees, closing time), so they are read without further requests.
+    """
+
+    default_batch_size = ISSUES_FETCH_BATCH_SIZE
+
+    def fetch(self, issue_ids: list[str]) -> dict[str, Optional[Issue]]:
+        """
+        Fetch the issues.
+
+        Parameters:
+            issue_ids (list[str]): The ids of the issues.
+        Returns:
+            dict[str, Optional[Issue]]: The issues by their ids; None marks an issue which does not exist.
+                Ids of a failed batch are left out, so the caller can fetch them another way.
+        """
+
+        def _to_issue(owner: str, name: str, node: Optional[dict[str, Any]]) -> Optional[Issue]:
+            return build_issue(self._requester, owner, name, node) if node else None
+
+        fetched = self._fetch(issue_ids, self._batch_size, "...IssueFields", ISSUE_FIELDS_FRAGMENT, _to_issue)
+        logger.debug("Fetched %d issue(s) in %d GraphQL query(ies).", len(fetched), self.queries_count)
+        return fetched
+
+    def fetch_cross_referencing_pulls(self, issue_ids: list[str]) -> dict[str, list[PullRequest]]:
+        """
+        Fetch the pull requests cross-referencing the issues, from the `CROSS_REFERENCED_EVENT` timeline items.
+
+        Parameters:
+            issue_ids (list[str]): The ids of the issues.
+        Returns:
+            dict[str, list[PullRequest]]: The referencing pull requests by issue id, in timeline order.
+                Ids of a failed batch, of a missing issue or with more references than one page are left out,
+                so the caller can read their timeline another way.
+        """
+
+        def _to_pulls(_owner: str, _name: str, node: Optional[dict[str, Any]]) -> Any:
+            items = (node or {}).get("timelineItems")
+            if not isinstance(items, dict) or items.get("totalCount", 0) > len(items.get("nodes") or []):
+                return _UNRESOLVED
+            sources = [item.get("source") or {} for item in items.get("nodes") or [] if item]
+            return [
+                build_pull_request(self._requester, source)
+                for source in sources
+                if source.get("__typename") == "PullRequest"
+            ]
+
+        selection = (
+            f"timelineItems(first: {CROSS_REFERENCES_PAGE_SIZE}, itemTypes: [CROSS_REFERENCED_EVENT]) "
+            "{ totalCount nodes { ... on CrossReferencedEvent { source { __typename ...PullRequestFields } } } }"
+        )
+        fetched = self._fetch(
+            issue_ids, CROSS_REFERENCES_FETCH_BATCH_SIZE, selection, PULL_REQUEST_FIELDS_FRAGMENT, _to_pulls
+        )
+        logger.debug("Fetched cross-references of %d issue(s) via GraphQL.", len(fetched))
+        return fetched
+
+    def fetch_updated_at(self, issue_ids: list[str]) -> dict[str, Optional[str]]:
+        """
+        Fetch the last update time of the issues.
+
+        Parameters:
+            issue_ids (list[str]): The ids of the issues.
+        Returns:
+            dict[str, Optional[str]]: The `updatedAt` timestamps by issue id; None marks an issue which does not exist.
+                Ids of a failed batch are left out.
+        """
+
+        def _to_updated_at(_owner: str, _name: str, node: Optional[dict[str, Any]]) -> Optional[str]:
+            return node.get("updatedAt") if node else None
+
+        fetched = self._fetch(issue_ids, UPDATED_AT_FETCH_BATCH_SIZE, "updatedAt", "", _to_updated_at)
+        logger.debug("Fetched update time of %d issue(s) via GraphQL.", len(fetched))
+        return fetched
+
+    def _fetch(
+        self,
+        issue_ids: list[str],
+        batch_size: int,
+        selection: str,
+        fragment: str,
+        convert: Callable[[str, str, Optional[dict[str, Any]]], Any],
+    ) -> dict[str, Any]:
+        parsed_ids: set[tuple[str, str, int]] = set()
+        for iid in issue_ids:
+            try:
+                parsed_ids.add(parse_issue_id(iid))
+            except IssueIdParseError:
+                logger.debug("Skipping malformed issue id '%s' in batched fetch.", iid)
+
+        def _fetch_batch(batch: list[tuple[str, str, int]]) -> Optional[dict[str, Any]]:
+            return self._fetch_batch(batch, selection, fragment, convert)
+
+        # repository order keeps the issues of one repository in as few queries as possible
+        return self.run_batches(
+            sorted(parsed_ids),
+            batch_size,
+            _fetch_batch,
+            "fetch-issue-batch",
+            "Batched fetch of %d issue(s) failed, they are fetched one by one.",
+        )
+
+    def _fetch_batch(
+        self,
+        batch: list[tuple[str, str, int]],
+        selection: str,
+        fragment: str,
+        convert: Callable[[str, str, Optional[dict[str, Any]]], Any],
+    ) -> Optional[dict[str, Any]]:
+        query, variables, aliases = _build_query(batch, selection, fragment)
+        try:
+            payload: Optional[dict[str, Any]]
+            try:
+                payload = graphql_query(self._requester, query, variables, self._rate_limiter)
+            except GithubException as e:
+                # a missing issue or repository fails the query, the resolved fields are still in the response
+                payload = _partial_payload(e)
+                if payload is None:
+                    raise
+            data = payload.get("data") or {}
+            result: dict[str, Any] = {}
+            for repo_alias, issue_aliases in aliases.items():
+                repository = data.get(repo_alias) or {}
+                for issue_alias, (owner, name, number) in issue_aliases.items():
+                    value = convert(owner, name, repository.get(issue_alias))
+                    if value is not _UNRESOLVED:
+                        result[f"{owner}/{name}#{number}"] = value
+            return result
+        except (GithubException, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.debug("Batched issue query failed: %s", e)
+            return None
+
+
+def build_pull_request(requester: Requester, node: dict[str, Any]) -> PullRequest:
+    """
+    Build a lazy PyGithub pull request from a GraphQL pull request node, shaped as the REST payload.
+
+    Parameters:
+        requester (Requester): The requester of the PyGithub client.
+        node (dict[str, Any]): The pull request node with the `PullRequestFields` fragment.
+    Returns:
+        PullRequest: The pull request; labels and assignees are read from its payload without further requests.
+    """
+    number = node["number"]
+    repository = node["repository"]
+    repository_url = f"{requester.base_url}/repos/{repository['owner']['login']}/{repository['name']}"
+    raw: dict[str, Any] = {
+        "number": number,
+        "title": node.get("title") or "",
+        "body": node.get("body"),
+        # GraphQL tells merged pull requests apart, REST reports them closed
+        "state": "open" if node.get("state") == "OPEN" else "closed",
+        "url": f"{repository_url}/pulls/{number}",
+        "html_url": node.get("url"),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "closed_at": node.get("closedAt"),
+        "merged_at": node.get("mergedAt"),
+        "merge_commit_sha": (node.get("mergeCommit") or {}).get("oid"),
+        "user": {"login": node["author"]["login"]} if node.get("author") else None,
+        "assignees": [{"login": a["login"]} for a in (node.get("assignees") or {}).get("nodes") or []],
+    }
+
+    if node.get("baseRefName"):
+        raw["base"] = {"ref": node["baseRefName"]}
+
+    labels = node.get("labels") or {}
+    label_nodes = labels.get("nodes") or []
+    if labels.get("totalCount", 0) <= len(label_nodes):
+        raw["labels"] = [{"name": label["name"]} for label in label_nodes]
+
+    return PullRequest(requester, {}, raw, completed=False)
+
+
+def _partial_payload(error: GithubException) -> Optional[dict[str, Any]]:
+    payload = error.data
+    if not isinstance(payload, dict) or not isinstance(payload.get("data"), dict):
+        return None
+    if not all(isinstance(e, dict) and e.get("type") == "NOT_FOUND" for e in payload.get("errors") or []):
+        return None
+    return payload
+
+
+def _build_query(
+    batch: list[tuple[str, str, int]], selection: str, fragment: str
+) -> tuple[str, dict[str, Any], dict[str, dict[str, tuple[str, str, int]]]]:
+    """Build the aliased query of a batch, its variables and the map of aliases to the issue id parts."""
+    by_repository: dict[tuple[str, str], list[int]] = {}
+    for owner, name, number in batch:
+        by_repository.setdefault((owner, name), []).append(number)
+
+    declarations: list[str] = []
+    selections: list[str] = []
+    variables: dict[str, Any] = {}
+    aliases: dict[str, dict[str, tuple[str, str, int]]] = {}
+    for index, ((owner, name), numbers) in enumerate(by_repository.items()):
+        declarations.append(f"$owner{index}: String!, $name{index}: String!")
+        variables[f"owner{index}"] = owner
+        variables[f"name{index}"] = name
+        aliases[f"r{index}"] = {f"i{number}": (owner, name, number) for number in numbers}
+        issues = " ".join(f"i{number}: issue(number: {number}) {{ {selection} }}" for number in numbers)
+        selections.append(f"r{index}: repository(owner: $owner{index}, name: $name{index}) {{ {issues} }}")
+
+    query = f"query FetchIssues({', '.join(declarations)}) {{\n  " + "\n  ".join(selections) + "\n}\n"
+    return query + fragment, variables, aliases
@@ -0,0 +1,222 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Mine the issues of a repository, with their labels, type, assignees and first-level sub-issues,
+in one paginated GitHub GraphQL stream.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from github.Issue import Issue
+from github.Requester import Requester
+
+from release_notes_generator.utils.constants import (
+    ISSUES_MINING_MAX_COST,
+    ISSUES_MINING_PAGE_SIZE,
+    ISSUES_MINING_QUERY,
+    ISSUES_MINING_SUB_ISSUES_PAGE_SIZE,
+)
+from release_notes_generator.utils.github_rate_limiter import GithubRateLimiter, graphql_query
+from release_notes_generator.utils.record_utils import format_issue_id
+
+logger = logging.getLogger(__name__)
+
+STREAM_UPDATED = "updated"
+STREAM_OPEN = "open"
+
+
+class GraphQLIssueMiner:
+    """
+    Mine issues via GitHub GraphQL API.
+
+    The result mirrors the REST listings used in since-time mode: issues updated since the release followed by
+    the remaining open issues, newest first. The issues are PyGithub objects built from REST-shaped payloads,
+    so labels, type and assignees are read without further requests. The first-level sub-issues are mined
+    only when requested, as they make up most of the query cost.
+    """
+
+    def __init__(
+        self, requester: Requester, rate_limiter: Optional[GithubRateLimiter] = None, with_sub_issues: bool = True
+    ):
+        self._requester = requester
+        self._rate_limiter = rate_limiter
+        self._with_sub_issues = with_sub_issues
+        # parent issue id -> direct sub-issue ids; leaf sub-issues are stored with an empty list
+        self.sub_issues: dict[str, list[str]] = {}
+        self.pages_count: int = 0
+
+    def mine(self, owner: str, name: str, since: Optional[datetime], with_open: bool = True) -> list[Issue]:
+        """
+        Mine the issues of the repository.
+
+        Parameters:
+            owner (str): The repository owner.
+            name (str): The repository name.
+            since (Optional[datetime]): The release timestamp. When None, all issues are mined.
+            with_open (bool): Whether the open issues not updated since the timestamp are mined too.
+        Returns:
+            list[Issue]: The mined issues, de-duplicated by number.
+        Raises:
+            GithubException: When a query fails.
+            ValueError: When the response is malformed.
+        """
+        self.sub_issues = {}
+        self.pages_count = 0
+        cursors: dict[str, Optional[str]] = {STREAM_UPDATED: None, STREAM_OPEN: None}
+        active: dict[str, bool] = {STREAM_UPDATED: True, STREAM_OPEN: with_open and since is not None}
+        nodes: dict[str, list[dict[str, Any]]] = {STREAM_UPDATED: [], STREAM_OPEN: []}
+
+        while any(active.values()):
+            repository = self._query(
+                {
+                    "owner": owner,
+                    "name": name,
+                    "since": _to_iso(since),
+                    "first": self.page_size(sum(active.values())),
+                    "withUpdated": active[STREAM_UPDATED],
+                    "afterUpdated": cursors[STREAM_UPDATED],
+                    "withOpen": active[STREAM_OPEN],
+                    "afterOpen": cursors[STREAM_OPEN],
+                    "withSubIssues": self._with_sub_issues,
+                    "firstSubIssues": ISSUES_MINING_SUB_ISSUES_PAGE_SIZE,
+                }
+            )
+
+            for stream in (STREAM_UPDATED, STREAM_OPEN):
+                if not active[stream]:
+                    continue
+                connection = repository.get(stream)
+                if not isinstance(connection, dict):
+                    raise ValueError(f"Missing '{stream}' issue connection in GraphQL response.")
+
+                nodes[stream].extend(connection.get("nodes") or [])
+                page_info = connection["pageInfo"]
+                active[stream] = bool(page_info["hasNextPage"])
+                cursors[stream] = page_info["endCursor"]
+
+        # the open issues are appended after the updated ones, as the REST based mining does
+        by_number: dict[int, Issue] = {}
+        for node in nodes[STREAM_UPDATED] + nodes[STREAM_OPEN]:
+            if node["number"] not in by_number:
+                by_number[node["number"]] = self._to_issue(owner, name, node)
+
+        logger.info(
+            "Mined %d issue(s) via GraphQL in %d page(s), sub-issues known for %d parent(s).",
+            len(by_number),
+            self.pages_count,
+            sum(1 for children in self.sub_issues.values() if children),
+        )
+        return list(by_number.values())
+
+    def page_size(self, streams: int) -> int:
+        """
+        Get the count of issues per stream page which keeps one query within ISSUES_MINING_MAX_COST points.
+
+        Parameters:
+            streams (int): The count of streams paged by the query.
+        Returns:
+            int: The page size, between 1 and ISSUES_MINING_PAGE_SIZE.
+        """
+        # connection requests of one issue: assignees, labels and optionally its sub-issues with the count of each child
+        issue_requests = 2 + (1 + ISSUES_MINING_SUB_ISSUES_PAGE_SIZE if self._with_sub_issues else 0)
+        stream_requests = ISSUES_MINING_MAX_COST * 100 // max(1, streams) - 1
+        return max(1, min(ISSUES_MINING_PAGE_SIZE, stream_requests // issue_requests))
+
+    def _query(self, variables: dict[str, Any]) -> dict[str, Any]:
+        payload = graphql_query(self._requester, ISSUES_MINING_QUERY, variables, self._rate_limiter)
+        self.pages_count += 1
+
+        repository = (payload.get("data") or {}).get("repository") if isinstance(payload, dict) else None
+        if not isinstance(repository, dict):
+            raise ValueError("Malformed GraphQL issue mining response.")
+        return repository
+
+    def _to_issue(self, owner: str, name: str, node: dict[str, Any]) -> Issue:
+        self._collect_sub_issues(format_issue_id(owner, name, node["number"]), node.get("subIssues"))
+        return build_issue(self._requester, owner, name, node)
+
+    def _collect_sub_issues(self, parent_id: str, connection: Optional[dict[str, Any]]) -> None:
+        if not isinstance(connection, dict):
+            # sub-issues are not available (e.g. older GitHub Enterprise Server), leave them to the scan
+            return
+
+        nodes = connection.get("nodes") or []
+        if connection.get("totalCount", 0) > len(nodes):
+            # more than one page of sub-issues, leave the parent to the paginated scan
+            return
+
+        children: list[str] = []
+        for child in nodes:
+            child_id = format_issue_id(
+                child["repository"]["owner"]["login"], child["repository"]["name"], child["number"]
+            )
+            children.append(child_id)
+            if child["subIssues"]["totalCount"] == 0:
+                self.sub_issues.setdefault(child_id, [])
+        self.sub_issues[parent_id] = children
+
+
+def build_issue(requester: Requester, owner: str, name: str, node: dict[str, Any]) -> Issue:
+    """
+    Build a lazy PyGithub issue from a GraphQL issue node, shaped as the REST payload.
+
+    Parameters:
+        requester (Requester): The requester of the PyGithub client.
+        owner (str): The repository owner.
+        name (str): The repository name.
+        node (dict[str, Any]): The issue node with the `IssueFields` fragment.
+    Returns:
+        Issue: The issue; labels, type and assignees are read from its payload without further requests.
+    """
+    number = node["number"]
+    repository_url = f"{requester.base_url}/repos/{owner}/{name}"
+    raw: dict[str, Any] = {
+        "number": number,
+        "title": node.get("title") or "",
+        "body": node.get("body"),
+        "state": (node.get("state") or "").lower(),
+        "state_reason": (node.get("stateReason") or "").lower() or None,
+        "url": f"{repository_url}/issues/{number}",
+        "repository_url": repository_url,
+        "html_url": node.get("url"),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "closed_at": node.get("closedAt"),
+        "user": {"login": node["author"]["login"]} if node.get("author") else None,
+        "assignees": [{"login": a["login"]} for a in (node.get("assignees") or {}).get("nodes") or []],
+        "type": {"name": node["issueType"]["name"]} if node.get("issueType") else None,
+    }
+
+    # a truncated label list is left out, so readers fall back to the labels endpoint
+    labels = node.get("labels") or {}
+    label_nodes = labels.get("nodes") or []
+    if labels.get("totalCount", 0) <= len(label_nodes):
+        raw["labels"] = [{"name": label["name"]} for label in label_nodes]
+
+    return Issue(requester, {}, raw, completed=False)
+
+
+def _to_iso(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
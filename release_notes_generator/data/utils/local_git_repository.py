@@ -0,0 +1,219 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module reads commits from a local clone of the mined repository, without any request to GitHub.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import subprocess
+from datetime import datetime
+from typing import Any, Optional
+
+from github.Commit import Commit
+from github.Requester import Requester
+
+from release_notes_generator.data.utils.graphql_commit_pull_resolver import GraphQLCommitPullResolver
+from release_notes_generator.utils.github_rate_limiter import GithubRateLimiter
+
+logger = logging.getLogger(__name__)
+
+GIT_TIMEOUT_SECONDS = 120
+
+# fields of one commit in the `git log` output, separated by the unit separator; records end with the record one
+_LOG_FORMAT = "%H%x1f%P%x1f%an%x1f%ae%x1f%aI%x1f%cn%x1f%ce%x1f%cI%x1f%B%x1e"
+# GitHub login of a commit author using the private noreply address ('123+login@users.noreply.github.com')
+_NOREPLY_EMAIL_RE = re.compile(r"^(?:\d+\+)?([^@]+)@users\.noreply\.github\.com$", re.IGNORECASE)
+
+
+class LocalGitError(RuntimeError):
+    """Raised when the local clone cannot answer a query: no git, not a clone, a missing ref or a shallow history."""
+
+
+class LocalGitRepository:
+    """
+    Read commits of the mined repository from its local clone (e.g. the checkout of the workflow).
+
+    The commits are shaped as the REST payload and built as lazy PyGithub commits, so they are processed like the
+    mined ones. Git knows no GitHub logins; the author login is read from a GitHub noreply address only, until
+    `link_author_logins` resolves it for the commits which end up in the release notes.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        requester: Requester,
+        full_name: str,
+        html_url: str,
+        rate_limiter: Optional[GithubRateLimiter] = None,
+    ):
+        self.path = path
+        self._requester = requester
+        self._full_name = full_name
+        self._html_url = html_url.rstrip("/")
+        self._rate_limiter = rate_limiter
+        # payloads of the commits read so far, by sha
+        self._payloads: dict[str, dict[str, Any]] = {}
+
+    def commits_between(self, base: str, head: str) -> list[Commit]:
+        """
+        Read the commits reachable from the head tag and not from the base tag, as the compare API does.
+
+        Parameters:
+            base (str): The name of the base tag.
+            head (str): The name of the head tag.
+        Returns:
+            list[Commit]: The commits, oldest first.
+        Raises:
+            LocalGitError: When the clone is shallow, a tag is missing or git fails.
+        """
+        self._check_full_history()
+        base_sha = self._resolve_tag(base)
+        head_sha = self._resolve_tag(head)
+        return self._log("--reverse", f"{base_sha}..{head_sha}")
+
+    def commits_since(self, branch: str, since: Optional[datetime], base_tag: Optional[str] = None) -> list[Commit]:
+        """
+        Read the commits of the branch committed at or after the moment, as the commit listing of the API does.
+
+        The commits are filtered by their committer date without stopping at the first older one, so a rebased or
+        cherry-picked history is read completely. The commits of the base tag are released already, the traversal
+        stops at them.
+
+        Parameters:
+            branch (str): The name of the branch, read from its remote-tracking ref when there is one.
+            since (Optional[datetime]): The moment; None reads the whole history of the branch.
+            base_tag (Optional[str]): The tag of the previous release; the whole history is read when it is missing.
+        Returns:
+            list[Commit]: The commits, newest first.
+        Raises:
+            LocalGitError: When the clone is shallow, the branch is missing or git fails.
+        """
+        self._check_full_history()
+        args = [self._resolve_branch(branch)]
+        if base_tag is not None:
+            try:
+                args.insert(0, f"^{self._resolve_tag(base_tag)}")
+            except LocalGitError as e:
+                logger.debug("Reading the whole history of '%s': %s", branch, e)
+        if since is not None:
+            # `--since` stops at the first commit committed earlier, whatever is behind it
+            args.insert(0, f"--since-as-filter={since.isoformat()}")
+        return self._log(*args)
+
+    def _check_full_history(self) -> None:
+        if self._git("rev-parse", "--is-shallow-repository").strip() == "true":
+            raise LocalGitError(f"'{self.path}' is a shallow clone, its history is incomplete (use fetch-depth: 0)")
+
+    def _resolve_tag(self, tag: str) -> str:
+        try:
+            return self._git("rev-parse", "--verify", "--quiet", f"refs/tags/{tag}^{{commit}}").strip()
+        except LocalGitError as e:
+            raise LocalGitError(f"Tag '{tag}' not found in '{self.path}' (are tags fetched?)") from e
+
+    def _resolve_branch(self, branch: str) -> str:
+        # the checkout may sit on a tag or another branch; the fetched remote branch is the one GitHub lists
+        for ref in (f"refs/remotes/origin/{branch}", f"refs/heads/{branch}"):
+            try:
+                return self._git("rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}").strip()
+            except LocalGitError:
+                continue
+        raise LocalGitError(f"Branch '{branch}' not found in '{self.path}'")
+
+    def _log(self, *args: str) -> list[Commit]:
+        output = self._git("log", f"--format={_LOG_FORMAT}", *args, "--")
+        payloads = [self._payload(record.lstrip("\n")) for record in output.split("\x1e") if record.strip()]
+        self._payloads.update((payload["sha"], payload) for payload in payloads)
+        commits = [self._build(payload) for payload in payloads]
+        logger.debug("Read %d commit(s) of %s from '%s'.", len(commits), args[-1], self.path)
+        return commits
+
+    def _payload(self, record: str) -> dict[str, Any]:
+        """Shape one `git log` record as the REST payload of a commit."""
+        sha, parents, a_name, a_email, a_date, c_name, c_email, c_date, message = record.split("\x1f", 8)
+        return {
+            "sha": sha,
+            "url": f"{self._requester.base_url}/repos/{self._full_name}/commits/{sha}",
+            "html_url": f"{self._html_url}/commit/{sha}",
+            "commit": {
+                # git ends the message with a newline, the API does not
+                "message": message.rstrip("\n"),
+                "author": {"name": a_name, "email": a_email, "date": a_date},
+                "committer": {"name": c_name, "email": c_email, "date": c_date},
+            },
+            "author": self._author(_noreply_login(a_email)),
+            "parents": [{"sha": parent} for parent in parents.split()],
+        }
+
+    def link_author_logins(self, commits: list[Commit]) -> list[Commit]:
+        """
+        Link the authors of the commits read from the clone to their GitHub accounts, as the REST payload does.
+
+        Only the given commits are looked up, in batched GraphQL queries; a commit GitHub could not resolve keeps
+        the login of its noreply address.
+
+        Parameters:
+            commits (list[Commit]): The commits which end up in the release notes.
+        Returns:
+            list[Commit]: The commits in the same order, those read from the clone rebuilt with the resolved logins.
+        """
+        shas = list(dict.fromkeys(commit.sha for commit in commits if commit.sha in self._payloads))
+        if not shas:
+            return commits
+        owner, _, name = self._full_name.partition("/")
+        resolver = GraphQLCommitPullResolver(self._requester, self._rate_limiter)
+        logins = resolver.resolve_author_logins(owner, name, shas)
+
+        linked: dict[str, Commit] = {}
+        for sha, login in logins.items():
+            self._payloads[sha] = {**self._payloads[sha], "author": self._author(login)}
+            linked[sha] = self._build(self._payloads[sha])
+        if len(linked) < len(shas):
+            logger.warning(
+                "Author logins of %d commit(s) not resolved by GitHub, read from their noreply addresses only.",
+                len(shas) - len(linked),
+            )
+        return [linked.get(commit.sha, commit) for commit in commits]
+
+    def _build(self, payload: dict[str, Any]) -> Commit:
+        return Commit(self._requester, {}, payload, completed=False)
+
+    @staticmethod
+    def _author(login: Optional[str]) -> Optional[dict[str, Any]]:
+        return {"login": login} if login else None
+
+    def _git(self, *args: str) -> str:
+        try:
+            completed = subprocess.run(
+                ["git", "-C", self.path, *args],
+                capture_output=True,
+                check=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=GIT_TIMEOUT_SECONDS,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            stderr = getattr(e, "stderr", None) or ""
+            raise LocalGitError(f"git {args[0]} failed in '{self.path}': {stderr.strip() or e}") from e
+        return completed.stdout
+
+
+def _noreply_login(email: str) -> Optional[str]:
+    match = _NOREPLY_EMAIL_RE.match(email)
+    return match.group(1) if match else None
@@ -0,0 +1,154 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the MiningState class, a persisted snapshot of the data mined by a previous run.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from github.Commit import Commit
+from github.Issue import Issue
+from github.PullRequest import PullRequest
+from github.Requester import Requester
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MiningState:
+    """
+    Normalized data of a since-time mode mining run, stored as the raw GitHub payloads.
+
+    The state is valid only for the same repository and the same `since` timestamp (i.e. the same latest release).
+    `high_water_mark` is the time the stored data was mined at; later runs fetch only objects updated since then.
+    """
+
+    VERSION = 1
+
+    repository: str
+    since: Optional[datetime]
+    high_water_mark: datetime
+    head_sha: Optional[str] = None
+    issues: list[dict[str, Any]] = field(default_factory=list)
+    pull_requests: list[dict[str, Any]] = field(default_factory=list)
+    commits: list[dict[str, Any]] = field(default_factory=list)
+    # parent issue id -> direct sub-issue ids, as mined with the issues
+    sub_issues: dict[str, list[str]] = field(default_factory=dict)
+
+    def matches(self, repository: str, since: Optional[datetime]) -> bool:
+        """
+        Check if the state can be reused for the mining of the repository from the received timestamp.
+
+        Parameters:
+            repository (str): The full name of the mined repository.
+            since (Optional[datetime]): The timestamp of the latest release.
+        Returns:
+            bool: True if the state was mined for the same repository and release timestamp.
+        """
+        return self.repository == repository and self.since == since
+
+    def build_issues(self, requester: Requester) -> list[Issue]:
+        """Rebuild the stored issues as lazy PyGithub objects."""
+        return [Issue(requester, {}, raw, completed=False) for raw in self.issues]
+
+    def build_pull_requests(self, requester: Requester) -> list[PullRequest]:
+        """Rebuild the stored pull requests as lazy PyGithub objects."""
+        return [PullRequest(requester, {}, raw, completed=False) for raw in self.pull_requests]
+
+    def build_commits(self, requester: Requester) -> list[Commit]:
+        """Rebuild the stored commits as lazy PyGithub objects."""
+        return [Commit(requester, {}, raw, completed=False) for raw in self.commits]
+
+    def save(self, path: str) -> None:
+        """
+        Write the state to the file. Failures are logged and do not stop the run.
+
+        Parameters:
+            path (str): The path of the state file.
+        Returns:
+            None
+        """
+        content = {
+            "version": self.VERSION,
+            "repository": self.repository,
+            "since": self.since.isoformat() if self.since is not None else None,
+            "high_water_mark": self.high_water_mark.isoformat(),
+            "head_sha": self.head_sha,
+            "issues": self.issues,
+            "pull_requests": self.pull_requests,
+            "commits": self.commits,
+            "sub_issues": self.sub_issues,
+        }
+        tmp_path = f"{path}.tmp"
+        try:
+            if directory := os.path.dirname(path):
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as state_file:
+                json.dump(content, state_file)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Failed to save mining state to '%s': %s", path, e)
+            return
+
+        logger.info(
+            "Mining state saved to '%s' (%d issues, %d PRs, %d commits).",
+            path,
+            len(self.issues),
+            len(self.pull_requests),
+            len(self.commits),
+        )
+
+    @staticmethod
+    def load(path: str) -> Optional[MiningState]:
+        """
+        Read the state from the file.
+
+        Parameters:
+            path (str): The path of the state file.
+        Returns:
+            Optional[MiningState]: The state or None when the file is missing, unreadable or of another version.
+        """
+        if not os.path.isfile(path):
+            logger.info("No mining state found at '%s', running full mining.", path)
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as state_file:
+                content = json.load(state_file)
+            if content.get("version") != MiningState.VERSION:
+                logger.info("Mining state at '%s' has unsupported version, running full mining.", path)
+                return None
+            return MiningState(
+                repository=content["repository"],
+                since=datetime.fromisoformat(content["since"]) if content["since"] else None,
+                high_water_mark=datetime.fromisoformat(content["high_water_mark"]),
+                head_sha=content.get("head_sha"),
+                issues=list(content["issues"]),
+                pull_requests=list(content["pull_requests"]),
+                commits=list(content["commits"]),
+                sub_issues=dict(content.get("sub_issues") or {}),
+            )
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning("Failed to load mining state from '%s', running full mining: %s", path, e)
+            return None
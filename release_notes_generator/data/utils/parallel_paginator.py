@@ -0,0 +1,191 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Iterate large paginated GitHub REST listings with their pages fetched concurrently.
+"""
+
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, Optional, TypeVar
+from urllib.parse import parse_qs, urlparse
+
+from github.PaginatedList import PaginatedList
+
+from release_notes_generator.utils.github_rate_limiter import GithubRateLimiter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PAGINATION_MAX_WORKERS = 4
+
+# private `PaginatedList` members the pages are requested with; without any of them the listing is iterated serially
+_PAGINATED_LIST_MEMBERS = (
+    "_PaginatedList__firstUrl",
+    "_PaginatedList__firstParams",
+    "_PaginatedList__requester",
+    "_PaginatedList__headers",
+    "_PaginatedList__list_item",
+    "_PaginatedList__contentClass",
+    "_transformAttributes",
+)
+
+
+class ParallelPaginator:
+    """
+    Fetch the pages of a PyGithub REST `PaginatedList` concurrently and yield the items in listing order.
+
+    The first page is read as usual; its `Link: rel="last"` header tells the number of pages, and the remaining
+    pages are requested by number with at most `max_workers` requests in flight. Listings which cannot be
+    addressed by page number (GraphQL, cursor based links, reversed or pre-loaded lists, plain iterables) are
+    iterated sequentially, as are all listings of a PyGithub release whose `PaginatedList` internals differ.
+    """
+
+    def __init__(self, rate_limiter: Optional[GithubRateLimiter] = None, max_workers: int = PAGINATION_MAX_WORKERS):
+        self._rate_limiter = rate_limiter
+        self._max_workers = max_workers
+
+    def iterate(self, listing: Optional[Iterable[T]]) -> Iterator[T]:
+        """
+        Iterate the items of the listing.
+
+        Stopping the iteration early cancels the page requests not started yet.
+
+        Parameters:
+            listing (Optional[Iterable[T]]): The listing, usually a PyGithub `PaginatedList`.
+        Returns:
+            Iterator[T]: The items in listing order.
+        """
+        if listing is None:
+            return
+        if not isinstance(listing, PaginatedList) or not self._supports_pages(listing):
+            yield from listing
+            return
+
+        headers, first_page = self._fetch_page(listing, 1)
+        yield from first_page
+
+        links = _parse_link_header(headers)
+        if "next" not in links:
+            return
+
+        last_page = _page_number(links.get("last"))
+        if last_page is None:
+            logger.debug("Listing %s has no numbered last page, following next links.", links["next"])
+            yield from self._follow_next_links(listing, links["next"])
+            return
+
+        logger.debug("Fetching %d pages of %s concurrently.", last_page, links["next"])
+        with ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="paginator") as ex:
+            pending: deque[Future] = deque()
+            next_page = 2
+            try:
+                while next_page <= last_page or pending:
+                    # keep the window of requests in flight full, the items are yielded in page order
+                    while next_page <= last_page and len(pending) < self._max_workers:
+                        pending.append(ex.submit(self._fetch_page, listing, next_page))
+                        next_page += 1
+                    _headers, items = pending.popleft().result()
+                    yield from items
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def collect(self, listing: Optional[Iterable[T]]) -> list[T]:
+        """
+        Collect all items of the listing.
+
+        Parameters:
+            listing (Optional[Iterable[T]]): The listing, usually a PyGithub `PaginatedList`.
+        Returns:
+            list[T]: The items in listing order.
+        """
+        return list(self.iterate(listing))
+
+    @staticmethod
+    def _supports_pages(listing: PaginatedList) -> bool:
+        if not all(hasattr(listing, member) for member in _PAGINATED_LIST_MEMBERS):
+            logger.debug("PaginatedList internals not found, iterating the listing sequentially.")
+            return False
+        return (
+            getattr(listing, "is_rest", False) is True
+            and not getattr(listing, "_reversed", False)
+            and getattr(listing, "_PaginatedList__firstUrl") is not None
+            # a list of keys addresses nested items, only a single key is supported
+            and isinstance(getattr(listing, "_PaginatedList__list_item"), str)
+        )
+
+    def _fetch_page(self, listing: PaginatedList, page: int) -> tuple[dict[str, Any], list[Any]]:
+        params = dict(getattr(listing, "_PaginatedList__firstParams") or {})
+        if page > 1:
+            params["page"] = page
+        return self._request(listing, getattr(listing, "_PaginatedList__firstUrl"), params)
+
+    def _follow_next_links(self, listing: PaginatedList, url: Optional[str]) -> Iterator[Any]:
+        while url:
+            headers, items = self._request(listing, url, None)
+            yield from items
+            url = _parse_link_header(headers).get("next")
+
+    def _request(
+        self, listing: PaginatedList, url: str, params: Optional[dict[str, Any]]
+    ) -> tuple[dict[str, Any], list[Any]]:
+        """Request one page the way `PaginatedList` does and build its items."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.wait_if_needed()
+
+        requester = getattr(listing, "_PaginatedList__requester")
+        headers, data = requester.requestJsonAndCheck(
+            "GET", url, parameters=params, headers=getattr(listing, "_PaginatedList__headers")
+        )
+        list_item = getattr(listing, "_PaginatedList__list_item")
+        if isinstance(data, dict) and list_item in data:
+            data = data[list_item]
+
+        content_class = getattr(listing, "_PaginatedList__contentClass")
+        items = [
+            content_class(requester, headers, listing._transformAttributes(element))  # pylint: disable=protected-access
+            for element in data or []
+            if element is not None
+        ]
+        return headers, items
+
+
+def _parse_link_header(headers: dict[str, Any]) -> dict[str, str]:
+    links: dict[str, str] = {}
+    link_header = headers.get("link") if headers else None
+    if not isinstance(link_header, str):
+        return links
+
+    for link in link_header.split(","):
+        parts = [part.strip() for part in link.split(";")]
+        if len(parts) < 2 or not parts[0].startswith("<"):
+            continue
+        for param in parts[1:]:
+            if param.startswith("rel="):
+                links[param[4:].strip('"')] = parts[0][1:-1]
+    return links
+
+
+def _page_number(url: Optional[str]) -> Optional[int]:
+    if not url:
+        return None
+    pages = parse_qs(urlparse(url).query).get("page")
+    if not pages or not pages[0].isdigit():
+        return None
+    return int(pages[0])
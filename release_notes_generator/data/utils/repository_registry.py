@@ -0,0 +1,100 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the RepositoryRegistry class, which fetches every repository of a run at most once.
+"""
+
+import threading
+from typing import Callable, Optional
+
+from github.Repository import Repository
+from github.Requester import Requester
+
+
+class RepositoryRegistry:
+    """
+    Memoize the repositories of a run by their full name ('org/repo').
+
+    A repository not found is remembered as None, so it is not requested again. Concurrent requests of one
+    repository wait for a single fetch, while different repositories are fetched in parallel.
+    """
+
+    def __init__(self, fetch: Callable[[str], Optional[Repository]]):
+        self._fetch = fetch
+        self._repositories: dict[str, Optional[Repository]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def get(self, full_name: str) -> Optional[Repository]:
+        """
+        Get the repository, fetching it on the first request only.
+
+        Parameters:
+            full_name (str): The full name of the repository.
+        Returns:
+            Optional[Repository]: The repository or None when it was not found.
+        """
+        with self._locks_guard:
+            lock = self._locks.setdefault(full_name, threading.Lock())
+        with lock:
+            if full_name not in self._repositories:
+                self._repositories[full_name] = self._fetch(full_name)
+            return self._repositories[full_name]
+
+    def add(self, repository: Repository) -> None:
+        """
+        Register a repository read another way (e.g. by a GraphQL query), so it is not fetched.
+
+        Parameters:
+            repository (Repository): The repository.
+        Returns:
+            None
+        """
+        with self._locks_guard:
+            self._repositories.setdefault(repository.full_name, repository)
+
+    def found(self) -> list[Repository]:
+        """
+        Get the registered repositories which exist.
+
+        Returns:
+            list[Repository]: The repositories, in the order they were registered.
+        """
+        with self._locks_guard:
+            return [repository for repository in self._repositories.values() if repository is not None]
+
+
+def build_lazy_repository(requester: Requester, full_name: str) -> Repository:
+    """
+    Build a repository from its full name without fetching it, as a lazy PyGithub object.
+
+    Its issues and pull requests are read by the repository URL; other attributes complete it from the API.
+
+    Parameters:
+        requester (Requester): The requester of the PyGithub client.
+        full_name (str): The full name of the repository ('org/repo').
+    Returns:
+        Repository: The repository; whether it exists is only known once it is read.
+    """
+    owner, _, name = full_name.partition("/")
+    raw = {
+        "name": name,
+        "full_name": full_name,
+        "owner": {"login": owner},
+        "url": f"{requester.base_url}/repos/{full_name}",
+    }
+    return Repository(requester, {}, raw, completed=False)
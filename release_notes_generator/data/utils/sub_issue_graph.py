@@ -0,0 +1,130 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the SubIssueGraph class, a persisted parent -> sub-issues graph of a previous run.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SubIssueGraph:
+    """
+    Direct sub-issues of every issue of the hierarchy ('org/repo#n'), with the `updatedAt` they were read at.
+
+    Adding or removing a sub-issue updates its parent, so the stored sub-issues of an issue whose `updatedAt`
+    did not change are still valid; an empty list marks an issue without sub-issues.
+    """
+
+    VERSION = 1
+
+    children: dict[str, list[str]] = field(default_factory=dict)
+    updated_at: dict[str, str] = field(default_factory=dict)
+
+    def reachable(self, roots: list[str]) -> list[str]:
+        """
+        Collect the stored issues of the hierarchy below the roots, the roots included.
+
+        Parameters:
+            roots (list[str]): The ids of the top issues.
+        Returns:
+            list[str]: The ids of the stored issues reachable from the roots, in breadth-first order.
+        """
+        found: dict[str, None] = {}
+        to_visit = deque(root for root in roots if root in self.children)
+        while to_visit:
+            issue_id = to_visit.popleft()
+            if issue_id in found:
+                continue
+            found[issue_id] = None
+            to_visit.extend(child for child in self.children[issue_id] if child in self.children)
+        return list(found)
+
+    def reusable(self, current_updated_at: dict[str, Optional[str]]) -> dict[str, list[str]]:
+        """
+        Select the stored sub-issues which are still valid.
+
+        Parameters:
+            current_updated_at (dict[str, Optional[str]]): The current `updatedAt` of the checked issues.
+        Returns:
+            dict[str, list[str]]: The sub-issues of the issues whose `updatedAt` did not change.
+        """
+        return {
+            issue_id: list(self.children[issue_id])
+            for issue_id, updated_at in current_updated_at.items()
+            if updated_at is not None and issue_id in self.children and self.updated_at.get(issue_id) == updated_at
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Write the graph to the file. Failures are logged and do not stop the run.
+
+        Parameters:
+            path (str): The path of the graph file.
+        Returns:
+            None
+        """
+        content = {"version": self.VERSION, "children": self.children, "updated_at": self.updated_at}
+        tmp_path = f"{path}.tmp"
+        try:
+            if directory := os.path.dirname(path):
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as graph_file:
+                json.dump(content, graph_file)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Failed to save sub-issue graph to '%s': %s", path, e)
+            return
+
+        logger.info("Sub-issue graph saved to '%s' (%d issues).", path, len(self.children))
+
+    @staticmethod
+    def load(path: str) -> Optional[SubIssueGraph]:
+        """
+        Read the graph from the file.
+
+        Parameters:
+            path (str): The path of the graph file.
+        Returns:
+            Optional[SubIssueGraph]: The graph or None when the file is missing, unreadable or of another version.
+        """
+        if not os.path.isfile(path):
+            logger.info("No sub-issue graph found at '%s', scanning the full hierarchy.", path)
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as graph_file:
+                content = json.load(graph_file)
+            if content.get("version") != SubIssueGraph.VERSION:
+                logger.info("Sub-issue graph at '%s' has unsupported version, scanning the full hierarchy.", path)
+                return None
+            return SubIssueGraph(
+                children={k: list(v) for k, v in content["children"].items()},
+                updated_at=dict(content["updated_at"]),
+            )
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.warning("Failed to load sub-issue graph from '%s', scanning the full hierarchy: %s", path, e)
+            return None
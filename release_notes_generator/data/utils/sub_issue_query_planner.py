@@ -0,0 +1,222 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+Plan the GraphQL queries of the sub-issue scan within the node limit and the rate limit cost budget of GitHub.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# (org, repo) -> parent issue number -> cursor of its next sub-issues page (None for the first page)
+SubIssueBatch = dict[tuple[str, str], dict[int, Optional[str]]]
+
+# GraphQL error types of a query GitHub refuses to run because of its size
+QUERY_TOO_LARGE_ERROR_TYPES = ("MAX_NODE_LIMIT_EXCEEDED", "RESOURCE_LIMITS_EXCEEDED")
+
+
+class QueryTooLargeError(RuntimeError):
+    """Raised when GitHub refuses a query because it requests too many nodes or resources."""
+
+
+@dataclass(frozen=True)
+class PlannedQuery:
+    """A query with the parents it carries and its estimated size."""
+
+    text: str
+    aliases: dict[str, tuple[str, str, int]]  # alias -> (org, repo, parent_num)
+    batch: SubIssueBatch
+    nodes: int
+    requests: int
+    cost: float
+
+
+class SubIssueQueryPlanner:  # pylint: disable=too-many-instance-attributes
+    """
+    Pack the queued parents into queries sized by an estimate of their node count and rate limit cost.
+
+    GitHub counts the nodes a query may return (at most 500,000) and charges one point per hundred connection
+    requests. Every parent alias requests a page of sub-issues and, for each of them, the count of their own
+    sub-issues. The estimate is calibrated by the cost GitHub reports for the executed queries.
+    """
+
+    def __init__(
+        self,
+        *,
+        per_page: int,
+        max_cost: float,
+        max_nodes: int,
+        max_aliases_per_repo: int,
+        max_repos: int,
+        concurrency: int = 1,
+    ):
+        self._per_page = per_page
+        self._max_cost = max_cost
+        self._max_nodes = max_nodes
+        self._max_aliases_per_repo = max_aliases_per_repo
+        self._max_repos = max_repos
+        self._concurrency = concurrency
+
+        self._calibration = 1.0  # observed / estimated cost of the latest query
+        self._remaining: Optional[int] = None
+
+        self.queries_count: int = 0
+        self.planned_cost_total: float = 0.0
+        self.observed_cost_total: int = 0
+
+    @property
+    def alias_nodes(self) -> int:
+        """Nodes one parent alias may return: a page of its sub-issues."""
+        return self._per_page
+
+    @property
+    def alias_requests(self) -> int:
+        """Connection requests of one parent alias: its sub-issue page and the sub-issue count of each child."""
+        return 1 + self._per_page
+
+    def estimate_cost(self, requests: int) -> float:
+        """Rate limit points of a query with the given number of connection requests."""
+        return max(1.0, requests / 100) * self._calibration
+
+    def plan(self, pending: SubIssueBatch) -> PlannedQuery:
+        """
+        Take the parents of the next query off the queue.
+
+        Parameters:
+            pending (SubIssueBatch): The queued parents with their cursors; the planned ones are removed.
+        Returns:
+            PlannedQuery: The query; it carries at least one parent.
+        """
+        budget = self._max_cost
+        if self._remaining is not None:
+            # the running queries share what is left of the hourly budget
+            budget = min(budget, self._remaining / self._concurrency)
+
+        batch: SubIssueBatch = {}
+        nodes, requests = 0, 0
+        full = False
+        for key in list(pending)[: self._max_repos]:
+            parents = pending[key]
+            for num in list(parents)[: self._max_aliases_per_repo]:
+                fits = (
+                    nodes + self.alias_nodes <= self._max_nodes
+                    and self.estimate_cost(requests + self.alias_requests) <= budget
+                )
+                if batch and not fits:
+                    full = True
+                    break
+                batch.setdefault(key, {})[num] = parents.pop(num)
+                nodes += self.alias_nodes
+                requests += self.alias_requests
+            if not parents:
+                del pending[key]
+            if full:
+                break
+
+        text, aliases = self._build(batch)
+        return PlannedQuery(text, aliases, batch, nodes, requests, self.estimate_cost(requests))
+
+    def observe(self, planned: PlannedQuery, rate_limit: Any) -> None:
+        """
+        Report the planned and the observed cost of an executed query and calibrate the estimate by them.
+
+        Parameters:
+            planned (PlannedQuery): The executed query.
+            rate_limit (Any): The `rateLimit { cost remaining }` of its response, if any.
+        Returns:
+            None
+        """
+        self.queries_count += 1
+        self.planned_cost_total += planned.cost
+        cost = rate_limit.get("cost") if isinstance(rate_limit, dict) else None
+        remaining = rate_limit.get("remaining") if isinstance(rate_limit, dict) else None
+
+        if isinstance(cost, int):
+            self.observed_cost_total += cost
+            self._calibration = max(cost, 1) / max(1.0, planned.requests / 100)
+        if isinstance(remaining, int):
+            self._remaining = remaining
+        logger.debug(
+            "Sub-issue query %d: %d parent(s), planned %d node(s) and %.1f point(s), observed %s point(s), %s left.",
+            self.queries_count,
+            len(planned.aliases),
+            planned.nodes,
+            planned.cost,
+            cost,
+            remaining,
+        )
+
+    def shrink(self, planned: PlannedQuery, pending: SubIssueBatch) -> bool:
+        """
+        Return the parents of a query GitHub refused as too large to the queue and halve the node budget,
+        so they are split over smaller queries.
+
+        Parameters:
+            planned (PlannedQuery): The refused query.
+            pending (SubIssueBatch): The queue to return its parents to.
+        Returns:
+            bool: False when the query carried a single parent and cannot be split.
+        """
+        if len(planned.aliases) <= 1:
+            return False
+        self._max_nodes = max(self.alias_nodes, math.ceil(planned.nodes / 2))
+        for key, parents in planned.batch.items():
+            pending.setdefault(key, {}).update(parents)
+        logger.warning(
+            "Sub-issue query of %d parent(s) was too large, splitting it; node budget lowered to %d.",
+            len(planned.aliases),
+            self._max_nodes,
+        )
+        return True
+
+    def _build(self, batch: SubIssueBatch) -> tuple[str, dict[str, tuple[str, str, int]]]:
+        """Build the query text with one repository block per repository and one alias per parent."""
+        repo_blocks: list[str] = []
+        aliases: dict[str, tuple[str, str, int]] = {}
+
+        for r_idx, ((org, repo), parents) in enumerate(batch.items()):
+            issue_blocks: list[str] = []
+            for p_idx, (parent_num, after) in enumerate(parents.items()):
+                alias = f"i{r_idx}_{p_idx}"
+                aliases[alias] = (org, repo, parent_num)
+                after_part = f', after: "{after}"' if after else ""
+                issue_blocks.append(
+                    f"{alias}: issue(number: {parent_num}) {{\n"
+                    "  number\n"
+                    "  updatedAt\n"
+                    f"  subIssues(first: {self._per_page}{after_part}) {{\n"
+                    "    nodes {\n"
+                    "      number\n"
+                    "      updatedAt\n"
+                    "      repository { owner { login } name }\n"
+                    "      # only count to decide if child is also a parent\n"
+                    "      subIssues(first: 0) { totalCount }\n"
+                    "    }\n"
+                    "    pageInfo { hasNextPage endCursor }\n"
+                    "  }\n"
+                    "}"
+                )
+            issues = " ".join(issue_blocks)
+            repo_blocks.append(f'r{r_idx}: repository(owner: "{org}", name: "{repo}") {{\n   {issues}\n }}')
+
+        # rateLimit reports what the query cost, which calibrates the following plans
+        return f"query Bulk {{ rateLimit {{ cost remaining }} {' '.join(repo_blocks)} }}", aliases
@@ -32,7 +32,7 @@ from release_notes_generator.builder.builder import ReleaseNotesBuilder
 from release_notes_generator.chapters.custom_chapters import CustomChapters
 from release_notes_generator.model.record.record import Record
 from release_notes_generator.record.factory.default_record_factory import DefaultRecordFactory
-from release_notes_generator.utils.github_rate_limiter import GithubRateLimiter
+from release_notes_generator.utils.github_rate_limiter import GithubRateLimiter, install_rate_limit_hook
 from release_notes_generator.utils.record_utils import get_id
 from release_notes_generator.utils.utils import get_change_url
 
@@ -49,6 +49,7 @@ class ReleaseNotesGenerator:
     def __init__(self, github_instance: Github, custom_chapters: CustomChapters):
         self._github_instance = github_instance
         self._rate_limiter = GithubRateLimiter(self._github_instance)
+        install_rate_limit_hook(self._github_instance, self._rate_limiter)
         self._custom_chapters = custom_chapters
 
     @property
@@ -108,8 +109,12 @@ class ReleaseNotesGenerator:
         assert data_filtered_by_release.home_repository is not None, "Repository must not be None"
 
         rls_notes_records: dict[str, Record] = DefaultRecordFactory(
-            github=self._github_instance, home_repository=data_filtered_by_release.home_repository
+            github=self._github_instance,
+            home_repository=data_filtered_by_release.home_repository,
+            rate_limiter=self._rate_limiter,
         ).generate(data=data_filtered_by_release)
+        # records hold snapshots only, release the mined PyGithub objects before rendering
+        del data, data_filtered_by_release
 
         return ReleaseNotesBuilder(
             records=rls_notes_records,
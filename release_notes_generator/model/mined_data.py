@@ -33,7 +33,7 @@ logger = logging.getLogger(__name__)
 
 
 @dataclass
-class MinedData:
+class MinedData:  # pylint: disable=too-many-instance-attributes
     """Class for keeping track of mined GitHub data."""
 
     def __init__(self, repository: Repository):
@@ -46,10 +46,13 @@ class MinedData:
 
         self.issues: dict[Issue, Repository] = {}
         self.pull_requests: dict[PullRequest, Repository] = {}
-        self.commits: dict[Commit, Repository] = {}
+        self._commits: dict[Commit, Repository] = {}
+        self._commits_by_sha: Optional[dict[str, list[Commit]]] = None
         self.compare_commit_shas: set[str] = set()
 
         self.parents_sub_issues: dict[str, list[str]] = {}  # parent issue id -> list of its sub-issues ids
+        # sub-issues received together with the mined issues, same format as parents_sub_issues
+        self.mined_sub_issues: dict[str, list[str]] = {}
         # dictionary of fetched cross issues and their pull requests
         self.pull_requests_of_fetched_cross_issues: dict[str, list[PullRequest]] = {}
 
@@ -58,6 +61,36 @@ class MinedData:
         """Get the home repository."""
         return self._repositories[self._home_repository_full_name]
 
+    @property
+    def commits(self) -> dict[Commit, Repository]:
+        """Get the mined commits and their repositories."""
+        return self._commits
+
+    @commits.setter
+    def commits(self, commits: dict[Commit, Repository]) -> None:
+        """Set the mined commits. Replace the dictionary, do not mutate it, to keep the SHA index valid."""
+        self._commits = commits
+        self._commits_by_sha = None
+
+    def get_commits_by_sha(self, sha: Optional[str]) -> list[Commit]:
+        """
+        Get the mined commits with the given SHA.
+
+        The SHA index is built on the first lookup after the commits are set, so each lookup is O(1).
+
+        Parameters:
+            sha (Optional[str]): The commit SHA, e.g. the merge commit SHA of a pull request.
+        Returns:
+            list[Commit]: The matching commits, empty when none is mined.
+        """
+        if sha is None:
+            return []
+        if self._commits_by_sha is None:
+            self._commits_by_sha = {}
+            for commit in self._commits:
+                self._commits_by_sha.setdefault(commit.sha, []).append(commit)
+        return self._commits_by_sha.get(sha, [])
+
     def add_repository(self, repository: Repository) -> None:
         """Add a repository to the mined data if not already present."""
         if repository.full_name not in self._repositories:
@@ -24,6 +24,7 @@ from github.Commit import Commit
 
 from release_notes_generator.action_inputs import ActionInputs
 from release_notes_generator.model.record.record import Record
+from release_notes_generator.model.snapshot import CommitSnapshot
 
 
 class CommitRecord(Record):
@@ -35,13 +36,13 @@ class CommitRecord(Record):
     def __init__(self, commit: Commit, skip: bool = False):
         super().__init__(skip=skip)
 
-        self._commit: Commit = commit
+        self._snapshot: CommitSnapshot = CommitSnapshot.from_commit(commit)
 
     # properties - override Record properties
 
     @property
     def record_id(self) -> int | str:
-        return self._commit.sha
+        return self._snapshot.sha
 
     @property
     def is_closed(self) -> bool:
@@ -53,7 +54,7 @@ class CommitRecord(Record):
 
     @property
     def author(self) -> str:
-        return self._commit.author.login if self._commit.author else ""
+        return self._snapshot.author or ""
 
     @property
     def assignees(self) -> list[str]:
@@ -67,12 +68,20 @@ class CommitRecord(Record):
     # properties - specific to CommitRecord
 
     @property
-    def commit(self) -> Commit:
+    def commit(self) -> CommitSnapshot:
         """
-        Gets the commits associated with the record.
-        Returns: The commits associated with the record.
+        Gets the commit associated with the record.
+        Returns: The snapshot of the commit associated with the record.
         """
-        return self._commit
+        return self._snapshot
+
+    @property
+    def snapshot(self) -> CommitSnapshot:
+        """
+        Gets the snapshot of the commit associated with the record.
+        Returns: The snapshot of the commit associated with the record.
+        """
+        return self._snapshot
 
     # methods - override Record methods
 
@@ -80,8 +89,8 @@ class CommitRecord(Record):
         row_prefix = f"{ActionInputs.get_duplicity_icon()} " if self.chapter_presence_count() > 1 else ""
 
         # collecting values for formatting
-        commit_message = self._commit.commit.message.replace("\n", " ")
-        row = f"{row_prefix}Commit: {self._commit.sha[:7]}... - {commit_message}"
+        commit_message = self._snapshot.message.replace("\n", " ")
+        row = f"{row_prefix}Commit: {self._snapshot.sha[:7]}... - {commit_message}"
 
         if self.contains_release_notes():
             row = f"{row}\n{self.get_rls_notes()}"
@@ -93,8 +93,7 @@ class HierarchyIssueRecord(IssueRecord):
     @property
     def developers(self) -> list[str]:
         """Unique, sorted list of developers across this issue and all descendants."""
-        issue = self._issue
-        if not issue:
+        if self._snapshot is None:
             return []
 
         devs = set()
@@ -166,7 +165,7 @@ class HierarchyIssueRecord(IssueRecord):
         if self._labels is not None:
             labels.update(self._labels)
         else:
-            labels.update(label.name for label in self._issue.get_labels())
+            labels.update(self.snapshot.labels)
 
         for sub_issue in self._sub_issues.values():
             labels.update(sub_issue.labels)
@@ -174,8 +173,8 @@ class HierarchyIssueRecord(IssueRecord):
         for sub_hierarchy_issue in self._sub_hierarchy_issues.values():
             labels.update(sub_hierarchy_issue.get_labels())
 
-        for pull in self._pull_requests.values():
-            labels.update(label.name for label in pull.get_labels())
+        for pull in self._pull_request_snapshots.values():
+            labels.update(pull.labels)
 
         return list(labels)
 
@@ -225,8 +224,8 @@ class HierarchyIssueRecord(IssueRecord):
     def _collect_format_values(self) -> dict[str, str]:
         """Collect template substitution values for the hierarchy issue row format string."""
         format_values: dict[str, str] = {}
-        format_values["number"] = f"#{self.issue.number}"
-        format_values["title"] = self.issue.title
+        format_values["number"] = f"#{self.snapshot.number}"
+        format_values["title"] = self.snapshot.title
         format_values["author"] = self.author
         format_values["assignees"] = ", ".join(self.assignees)
         format_values["developers"] = ", ".join(self.developers)
@@ -277,8 +276,8 @@ class HierarchyIssueRecord(IssueRecord):
         exclude_labels: list[str] | None,
     ) -> str:
         """Append rendered rows for all qualifying sub-hierarchy issues to *row*."""
-        for sub_hierarchy_issue in sorted(self._sub_hierarchy_issues.values(), key=lambda r: r.issue.number):
-            logger.debug("Rendering sub-hierarchy issue row for #%s", sub_hierarchy_issue.issue.number)
+        for sub_hierarchy_issue in sorted(self._sub_hierarchy_issues.values(), key=lambda r: r.snapshot.number):
+            logger.debug("Rendering sub-hierarchy issue row for #%s", sub_hierarchy_issue.snapshot.number)
             if label_filter and not sub_hierarchy_issue.has_matching_labels(label_filter):
                 continue
             if (
@@ -290,7 +289,7 @@ class HierarchyIssueRecord(IssueRecord):
             if self.is_open and not sub_hierarchy_issue.contains_change_increment():
                 continue
             # Closed parent: render all sub-hierarchy issues regardless of state or change increment
-            logger.debug("Rendering sub-hierarchy issue #%s", sub_hierarchy_issue.issue.number)
+            logger.debug("Rendering sub-hierarchy issue #%s", sub_hierarchy_issue.snapshot.number)
             if self.is_closed and sub_hierarchy_issue.is_open:
                 sub_row = self._build_open_sub_hierarchy_row(sub_hierarchy_issue, label_filter, exclude_labels)
             else:
@@ -309,8 +308,8 @@ class HierarchyIssueRecord(IssueRecord):
             # No sub-issues: violations of hierarchy are reported in service chapters (no data loss)
             return row
         sub_indent = "  " * (self._level + 1)
-        for sub_issue in sorted(self._sub_issues.values(), key=lambda r: r.issue.number):
-            logger.debug("Rendering sub-issue row for issue #%s", sub_issue.issue.number)
+        for sub_issue in sorted(self._sub_issues.values(), key=lambda r: r.snapshot.number):
+            logger.debug("Rendering sub-issue row for issue #%s", sub_issue.snapshot.number)
             if label_filter and not any(lbl in label_filter for lbl in sub_issue.labels):
                 continue
             if exclude_labels and any(lbl in exclude_labels for lbl in sub_issue.labels):
@@ -321,7 +320,7 @@ class HierarchyIssueRecord(IssueRecord):
                 if not sub_issue.contains_change_increment():
                     continue  # skip sub-issues without change increment
             # Closed parent: render all sub-issues regardless of state or change increment
-            logger.debug("Rendering sub-issue #%s", sub_issue.issue.number)
+            logger.debug("Rendering sub-issue #%s", sub_issue.snapshot.number)
             open_icon_prefix = ""
             if self.is_closed and sub_issue.is_open:
                 # Highlight open children under a closed parent to signal incomplete work
@@ -338,7 +337,7 @@ class HierarchyIssueRecord(IssueRecord):
         label_filter: list[str] | None = None,
         exclude_labels: list[str] | None = None,
     ) -> str:
-        logger.debug("Rendering hierarchy issue row for issue #%s", self.issue.number)
+        logger.debug("Rendering hierarchy issue row for issue #%s", self.snapshot.number)
         row_prefix = f"{ActionInputs.get_duplicity_icon()} " if self.chapter_presence_count() > 1 else ""
         indent: str = "  " * self._level
         if self._level > 0:
@@ -27,6 +27,7 @@ from github.PullRequest import PullRequest
 
 from release_notes_generator.action_inputs import ActionInputs
 from release_notes_generator.model.record.record import Record
+from release_notes_generator.model.snapshot import IssueSnapshot, PullRequestSnapshot, CommitSnapshot
 from release_notes_generator.utils.record_utils import (
     get_rls_notes_default,
     get_rls_notes_code_rabbit,
@@ -34,6 +35,7 @@ from release_notes_generator.utils.record_utils import (
 )
 
 
+# pylint: disable=too-many-public-methods
 class IssueRecord(Record):
     """
     A class used to represent an issue record in the release notes.
@@ -47,45 +49,38 @@ class IssueRecord(Record):
     def __init__(self, issue: Issue, issue_labels: Optional[list[str]] = None, skip: bool = False):
         super().__init__(skip=skip)
 
-        self._issue: Issue = issue
         self._labels: Optional[list[str]] = issue_labels if issue_labels is not None else None
 
-        if issue is not None and issue.type is not None:
-            self._issue_type = issue.type.name
-        else:
-            self._issue_type = None
+        # the record keeps the snapshots only, so the mined PyGithub objects can be released once records are built
+        self._snapshot: Optional[IssueSnapshot] = IssueSnapshot.from_issue(issue) if issue is not None else None
+        self._issue_type: Optional[str] = self._snapshot.type_name if self._snapshot is not None else None
 
-        self._pull_requests: dict[int, PullRequest] = {}
-        self._commits: dict[int, dict[str, Commit]] = {}
+        self._pull_request_snapshots: dict[int, PullRequestSnapshot] = {}
+        self._commit_snapshots: dict[int, dict[str, CommitSnapshot]] = {}
 
     # properties - override Record properties
 
     @property
     def record_id(self) -> int | str:
-        return self._issue.number
+        return self.snapshot.number
 
     @property
     def is_closed(self) -> bool:
-        return self._issue.state == self.ISSUE_STATE_CLOSED
+        return self.snapshot.state == self.ISSUE_STATE_CLOSED
 
     @property
     def is_open(self) -> bool:
-        return self._issue.state == self.ISSUE_STATE_OPEN
+        return self.snapshot.state == self.ISSUE_STATE_OPEN
 
     @property
     def author(self) -> str:
-        if not self._issue or not self._issue.user:
+        if self._snapshot is None or not self._snapshot.author:
             return ""
-        return f"@{self._issue.user.login}"
+        return f"@{self._snapshot.author}"
 
     @property
     def assignees(self) -> list[str]:
-        assignees: set[str] = set()
-
-        for assignee in self.issue.assignees or []:
-            assignees.add(f"@{assignee.login}")
-
-        return sorted(assignees)
+        return sorted({f"@{login}" for login in self.snapshot.assignees})
 
     @property
     def developers(self) -> list[str]:
@@ -96,26 +91,34 @@ class IssueRecord(Record):
             devs.add(f"{assignee}")
 
         # Linked PR authors (people who created PRs closing this issue)
-        for pr in self._pull_requests.values():
-            author = getattr(pr.user, "login", None)
-            if author:
-                devs.add(f"@{author}")
+        for pr in self._pull_request_snapshots.values():
+            if pr.author:
+                devs.add(f"@{pr.author}")
 
-            for _cid, commit in self._commits[pr.number].items():
-                if commit.author and getattr(commit.author, "login", None):
-                    devs.add(f"@{commit.author.login}")
+            for commit in self._commit_snapshots[pr.number].values():
+                if commit.author:
+                    devs.add(f"@{commit.author}")
 
         return sorted(devs)
 
     # properties - specific to IssueRecord
 
     @property
-    def issue(self) -> Issue:
+    def issue(self) -> IssueSnapshot:
         """
         Gets the issue associated with the record.
-        Returns: The issue associated with the record.
+        Returns: The snapshot of the issue associated with the record.
+        """
+        return self.snapshot
+
+    @property
+    def snapshot(self) -> IssueSnapshot:
+        """
+        Gets the snapshot of the issue associated with the record.
+        Returns: The snapshot of the issue associated with the record.
         """
-        return self._issue
+        assert self._snapshot is not None, "Issue must not be None"
+        return self._snapshot
 
     @property
     def issue_type(self) -> Optional[str]:
@@ -129,7 +132,7 @@ class IssueRecord(Record):
     # methods - override Record methods
 
     def get_labels(self) -> list[str]:
-        self._labels = [label.name for label in list(self._issue.get_labels())]
+        self._labels = list(self.snapshot.labels)
         return self.labels
 
     def find_issue(self, issue_number: int) -> Optional["IssueRecord"]:
@@ -142,7 +145,7 @@ class IssueRecord(Record):
         Returns:
             IssueRecord: The issue record with that number.
         """
-        if self._issue.number == issue_number:
+        if self.snapshot.number == issue_number:
             return self
 
         return None
@@ -152,9 +155,9 @@ class IssueRecord(Record):
         format_values: dict[str, Any] = {}
 
         # collect format values
-        format_values["type"] = f"{self._issue.type.name if self._issue.type else ''}"
-        format_values["number"] = f"#{self._issue.number}"
-        format_values["title"] = self._issue.title
+        format_values["type"] = self._issue_type or ""
+        format_values["number"] = f"#{self.snapshot.number}"
+        format_values["title"] = self.snapshot.title
         format_values["author"] = self.author
         format_values["assignees"] = ", ".join(self.assignees)
         format_values["developers"] = ", ".join(self.developers)
@@ -184,11 +187,12 @@ class IssueRecord(Record):
         detection_regex, line_marks, cr_active = self._get_rls_notes_setup(line_marks)
 
         # Get release notes from Issue
-        if self._issue.body and detection_regex.search(self._issue.body):
-            release_notes += get_rls_notes_default(self._issue.body, line_marks, detection_regex)
+        issue_body = self.snapshot.body
+        if issue_body and detection_regex.search(issue_body):
+            release_notes += get_rls_notes_default(issue_body, line_marks, detection_regex)
 
         # Iterate over all PRs
-        for pull in self._pull_requests.values():
+        for pull in self._pull_request_snapshots.values():
             if pull.body and detection_regex.search(pull.body):
                 release_notes += get_rls_notes_default(pull.body, line_marks, detection_regex)
             elif pull.body and cr_active:
@@ -202,32 +206,26 @@ class IssueRecord(Record):
 
     # methods - specific to IssueRecord
 
-    def get_pull_request(self, number: int) -> Optional[PullRequest]:
+    def get_pull_request(self, number: int) -> Optional[PullRequestSnapshot]:
         """
         Gets the pull request by its number.
         Parameters:
             number (int): The number of the pull request.
         Returns:
-            Optional[PullRequest]: The pull request or None if not found.
+            Optional[PullRequestSnapshot]: The snapshot of the pull request or None if not found.
         """
-        if number in self._pull_requests:
-            return self._pull_requests[number]
-        return None
+        return self._pull_request_snapshots.get(number)
 
-    def get_commit(self, pr_number: int, commit_sha: str) -> Optional[Commit]:
+    def get_commit(self, pr_number: int, commit_sha: str) -> Optional[CommitSnapshot]:
         """
         Gets the commit by its number.
         Parameters:
              pr_number (int): The number of the pull request.
              commit_sha (str): The commit sha.
         Returns:
-            Optional[Commit]: The commit or None if not found.
+            Optional[CommitSnapshot]: The snapshot of the commit or None if not found.
         """
-        if pr_number in self._pull_requests:
-            pr_commits = self._commits.get(pr_number)
-            if pr_commits and commit_sha in pr_commits:
-                return pr_commits[commit_sha]
-        return None
+        return self._commit_snapshots.get(pr_number, {}).get(commit_sha)
 
     def get_pull_request_numbers(self) -> list[int]:
         """
@@ -235,7 +233,7 @@ class IssueRecord(Record):
         Returns:
             list[int]: A list of pull request numbers.
         """
-        return [pull.number for pull in self._pull_requests.values()]
+        return list(self._pull_request_snapshots)
 
     def register_pull_request(self, pull: PullRequest) -> None:
         """
@@ -244,8 +242,8 @@ class IssueRecord(Record):
             pull (PullRequest): The pull request record to register.
         Returns: None
         """
-        self._pull_requests[pull.number] = pull
-        self._commits[pull.number] = {}
+        self._pull_request_snapshots[pull.number] = PullRequestSnapshot.from_pull_request(pull)
+        self._commit_snapshots[pull.number] = {}
 
     def register_commit(self, pull: PullRequest, commit: Commit) -> None:
         """
@@ -255,13 +253,10 @@ class IssueRecord(Record):
             commit (Commit): The commit record to register.
         Returns: None
         """
-        if pull.number not in self._pull_requests:
+        if pull.number not in self._pull_request_snapshots:
             self.register_pull_request(pull)
 
-        if pull.number not in self._commits:
-            self._commits[pull.number] = {}
-
-        self._commits[pull.number][commit.sha] = commit
+        self._commit_snapshots.setdefault(pull.number, {})[commit.sha] = CommitSnapshot.from_commit(commit)
 
     def pull_requests_count(self) -> int:
         """
@@ -269,7 +264,7 @@ class IssueRecord(Record):
         Returns:
             int: The number of pull requests associated with the issue.
         """
-        return len(self._pull_requests)
+        return len(self._pull_request_snapshots)
 
     def get_pr_links(self) -> list[str]:
         """
@@ -277,10 +272,10 @@ class IssueRecord(Record):
         Returns:
             list[str]: A list of pull request links associated with the issue.
         """
-        if not self._pull_requests:
+        if not self._pull_request_snapshots:
             return []
 
         template = "#{number}"
-        res = [template.format(number=pull.number) for pull in self._pull_requests.values()]
+        res = [template.format(number=number) for number in self._pull_request_snapshots]
 
         return res
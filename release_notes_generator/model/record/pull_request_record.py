@@ -27,8 +27,12 @@ from github.Repository import Repository
 
 from release_notes_generator.action_inputs import ActionInputs
 from release_notes_generator.model.record.record import Record
+from release_notes_generator.model.snapshot import PullRequestSnapshot, CommitSnapshot
 from release_notes_generator.utils.pull_request_utils import extract_issue_numbers_from_body
-from release_notes_generator.utils.record_utils import get_rls_notes_default, get_rls_notes_code_rabbit
+from release_notes_generator.utils.record_utils import (
+    get_rls_notes_default,
+    get_rls_notes_code_rabbit,
+)
 
 
 class PullRequestRecord(Record):
@@ -44,41 +48,37 @@ class PullRequestRecord(Record):
         super().__init__(labels, skip)
 
         self._home_repository: Repository = repo
-        self._pull_request: PullRequest = pull
-        self._commits: dict[str, Commit] = {}
+        # the record keeps the snapshots only, so the mined PyGithub objects can be released once records are built
+        self._snapshot: PullRequestSnapshot = PullRequestSnapshot.from_pull_request(pull)
+        self._commit_snapshots: dict[str, CommitSnapshot] = {}
 
     # properties - override Record properties
 
     @property
     def record_id(self) -> int | str:
-        return self._pull_request.number
+        return self._snapshot.number
 
     @property
     def is_closed(self) -> bool:
         return (
-            self._pull_request.state == self.PR_STATE_CLOSED
-            and self._pull_request.merged_at is None
-            and self._pull_request.closed_at is not None
+            self._snapshot.state == self.PR_STATE_CLOSED
+            and self._snapshot.merged_at is None
+            and self._snapshot.closed_at is not None
         )
 
     @property
     def is_open(self) -> bool:
-        return self._pull_request.state == self.PR_STATE_OPEN
+        return self._snapshot.state == self.PR_STATE_OPEN
 
     @property
     def author(self) -> str:
-        if not self._pull_request or not self._pull_request.user:
+        if not self._snapshot.author:
             return ""
-        return f"@{self._pull_request.user.login}"
+        return f"@{self._snapshot.author}"
 
     @property
     def assignees(self) -> list[str]:
-        assignees = set()
-
-        for assignee in self._pull_request.assignees:
-            assignees.add(f"@{assignee.login}")
-
-        return sorted(assignees)
+        return sorted({f"@{login}" for login in self._snapshot.assignees})
 
     @property
     def developers(self) -> list[str]:
@@ -89,9 +89,9 @@ class PullRequestRecord(Record):
             devs.add(f"{assignee}")
 
         # Linked PR authors (people who created PRs closing this issue)
-        for _cid, commit in self._commits.items():
-            if commit.author and getattr(commit.author, "login", None):
-                devs.add(f"@{commit.author.login}")
+        for commit in self._commit_snapshots.values():
+            if commit.author:
+                devs.add(f"@{commit.author}")
 
         return sorted(devs)
 
@@ -105,18 +105,26 @@ class PullRequestRecord(Record):
             bool: True if the pull request is merged, False otherwise.
         """
         return (
-            self._pull_request.state == self.PR_STATE_CLOSED
-            and self._pull_request.merged_at is not None
-            and self._pull_request.closed_at is not None
+            self._snapshot.state == self.PR_STATE_CLOSED
+            and self._snapshot.merged_at is not None
+            and self._snapshot.closed_at is not None
         )
 
     @property
-    def pull_request(self) -> PullRequest:
+    def pull_request(self) -> PullRequestSnapshot:
         """
         Gets the pull request associated with the record.
-        Returns: The pull request associated with the record.
+        Returns: The snapshot of the pull request associated with the record.
         """
-        return self._pull_request
+        return self._snapshot
+
+    @property
+    def snapshot(self) -> PullRequestSnapshot:
+        """
+        Gets the snapshot of the pull request associated with the record.
+        Returns: The snapshot of the pull request associated with the record.
+        """
+        return self._snapshot
 
     @property
     def contributors(self) -> list[str]:
@@ -126,15 +134,12 @@ class PullRequestRecord(Record):
             list[str]: A sorted list of GitHub usernames of contributors, excluding the main author.
         """
         # TODO - fix in issue #76
-        if not self._pull_request:
-            return []
-
         return []
 
     # methods - override Record methods
 
     def get_labels(self) -> list[str]:
-        self._labels = [label.name for label in list(self._pull_request.get_labels())]
+        self._labels = list(self._snapshot.labels)
         return self.labels
 
     def to_chapter_row(self, add_into_chapters: bool = True) -> str:
@@ -142,8 +147,8 @@ class PullRequestRecord(Record):
         format_values: dict[str, Any] = {}
 
         # collecting values for formatting
-        format_values["number"] = f"#{self._pull_request.number}"
-        format_values["title"] = self._pull_request.title
+        format_values["number"] = f"#{self._snapshot.number}"
+        format_values["title"] = self._snapshot.title
         format_values["author"] = self.author
         format_values["assignees"] = ", ".join(self.assignees)
         format_values["developers"] = ", ".join(self.developers)
@@ -164,30 +169,29 @@ class PullRequestRecord(Record):
     def get_rls_notes(self, line_marks: Optional[list[str]] = None) -> str:
         release_notes = ""
         detection_regex, line_marks, cr_active = self._get_rls_notes_setup(line_marks)
+        body = self._snapshot.body
 
-        if self._pull_request.body and detection_regex.search(self._pull_request.body):
-            release_notes += get_rls_notes_default(self._pull_request.body, line_marks, detection_regex)
-        elif self._pull_request.body and cr_active:
+        if body and detection_regex.search(body):
+            release_notes += get_rls_notes_default(body, line_marks, detection_regex)
+        elif body and cr_active:
             cr_detection_regex: re.Pattern[Any] = re.compile(ActionInputs.get_coderabbit_release_notes_title())
-            if cr_detection_regex.search(self._pull_request.body):
-                release_notes += get_rls_notes_code_rabbit(self._pull_request.body, line_marks, cr_detection_regex)
+            if cr_detection_regex.search(body):
+                release_notes += get_rls_notes_code_rabbit(body, line_marks, cr_detection_regex)
 
         # Return the concatenated release notes
         return release_notes.rstrip()
 
     # methods - specific to PullRequestRecord
 
-    def get_commit(self, sha: str = "0") -> Optional[Commit]:
+    def get_commit(self, sha: str = "0") -> Optional[CommitSnapshot]:
         """
         Gets the commit by the specified sha.
         Parameters:
             sha (str): The sha of the commit to retrieve.
         Returns:
-            Optional[Commit]: None if the commit is not found.
+            Optional[CommitSnapshot]: The snapshot of the commit, None if the commit is not found.
         """
-        if sha in self._commits:
-            return self._commits[sha]
-        return None
+        return self._commit_snapshots.get(sha)
 
     def register_commit(self, commit: Commit) -> None:
         """
@@ -196,7 +200,7 @@ class PullRequestRecord(Record):
             commit (Commit): The commit to register.
         Returns: None
         """
-        self._commits[commit.sha] = commit
+        self._commit_snapshots[commit.sha] = CommitSnapshot.from_commit(commit)
 
     def is_commit_sha_present(self, sha: str) -> bool:
         """
@@ -206,13 +210,13 @@ class PullRequestRecord(Record):
         Returns:
             bool: True if the commit SHA is present, False otherwise.
         """
-        return self._pull_request.merge_commit_sha == sha
+        return self._snapshot.merge_commit_sha == sha
 
     def commits_count(self) -> int:
         """
         Returns the number of commits associated with the pull request.
         """
-        return len(self._commits)
+        return len(self._commit_snapshots)
 
     def contains_issue_mentions(self) -> bool:
         """
@@ -221,4 +225,4 @@ class PullRequestRecord(Record):
         Returns:
             bool: True if the pull request contains issue mentions, False otherwise.
         """
-        return len(extract_issue_numbers_from_body(self._pull_request, self._home_repository)) > 0
+        return len(extract_issue_numbers_from_body(self._snapshot, self._home_repository)) > 0
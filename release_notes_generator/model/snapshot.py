@@ -0,0 +1,233 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains lightweight snapshots of the mined GitHub issues, pull requests and commits.
+
+Snapshots are built once from the payload received while mining; records keep them instead of the PyGithub
+objects. Building never triggers the lazy completion (`_completeIfNotSet`) of PyGithub objects, only the labels
+endpoint is paged when the payload holds no label list, and reading them does not touch the network.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from github.Commit import Commit
+from github.Issue import Issue
+from github.PullRequest import PullRequest
+
+
+@dataclass(frozen=True, slots=True)
+class IssueSnapshot:
+    """Immutable snapshot of the issue fields used by records."""
+
+    number: int
+    title: str
+    state: Optional[str]
+    state_reason: Optional[str]
+    body: Optional[str]
+    author: Optional[str]
+    assignees: tuple[str, ...]
+    labels: tuple[str, ...]
+    type_name: Optional[str]
+    closed_at: Optional[datetime]
+
+    @classmethod
+    def from_issue(cls, issue: Issue) -> "IssueSnapshot":
+        """
+        Build the snapshot from a mined issue.
+
+        Parameters:
+            issue (Issue): The mined issue.
+        Returns:
+            IssueSnapshot: The snapshot of the issue.
+        """
+        raw = _payload(issue)
+        if raw is not None:
+            return cls(
+                number=raw.get("number", 0),
+                title=raw.get("title") or "",
+                state=raw.get("state"),
+                state_reason=raw.get("state_reason"),
+                body=raw.get("body"),
+                author=_login(raw.get("user")),
+                assignees=_logins(raw.get("assignees")),
+                labels=_label_names(issue, raw),
+                type_name=(raw.get("type") or {}).get("name"),
+                closed_at=_datetime(raw.get("closed_at")),
+            )
+
+        issue_type = getattr(issue, "type", None)
+        return cls(
+            number=issue.number,
+            title=issue.title,
+            state=issue.state,
+            state_reason=getattr(issue, "state_reason", None),
+            body=issue.body,
+            author=_login(issue.user),
+            assignees=_logins(issue.assignees),
+            labels=_label_names(issue, raw),
+            type_name=issue_type.name if issue_type is not None else None,
+            closed_at=getattr(issue, "closed_at", None),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PullRequestSnapshot:  # pylint: disable=too-many-instance-attributes
+    """Immutable snapshot of the pull request fields used by records."""
+
+    number: int
+    title: str
+    state: Optional[str]
+    draft: Optional[bool]
+    body: Optional[str]
+    author: Optional[str]
+    assignees: tuple[str, ...]
+    labels: tuple[str, ...]
+    merge_commit_sha: Optional[str]
+    merged_at: Optional[datetime]
+    closed_at: Optional[datetime]
+
+    @classmethod
+    def from_pull_request(cls, pull: PullRequest) -> "PullRequestSnapshot":
+        """
+        Build the snapshot from a mined pull request.
+
+        Parameters:
+            pull (PullRequest): The mined pull request.
+        Returns:
+            PullRequestSnapshot: The snapshot of the pull request.
+        """
+        raw = _payload(pull)
+        if raw is not None:
+            return cls(
+                number=raw.get("number", 0),
+                title=raw.get("title") or "",
+                state=raw.get("state"),
+                draft=raw.get("draft"),
+                body=raw.get("body"),
+                author=_login(raw.get("user")),
+                assignees=_logins(raw.get("assignees")),
+                labels=_label_names(pull, raw),
+                merge_commit_sha=raw.get("merge_commit_sha"),
+                merged_at=_datetime(raw.get("merged_at")),
+                closed_at=_datetime(raw.get("closed_at")),
+            )
+
+        return cls(
+            number=pull.number,
+            title=pull.title,
+            state=pull.state,
+            draft=getattr(pull, "draft", None),
+            body=pull.body,
+            author=_login(pull.user),
+            assignees=_logins(pull.assignees),
+            labels=_label_names(pull, raw),
+            merge_commit_sha=pull.merge_commit_sha,
+            merged_at=pull.merged_at,
+            closed_at=pull.closed_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CommitSnapshot:
+    """Immutable snapshot of the commit fields used by records."""
+
+    sha: str
+    message: str
+    author: Optional[str]
+
+    @classmethod
+    def from_commit(cls, commit: Commit) -> "CommitSnapshot":
+        """
+        Build the snapshot from a mined commit.
+
+        Parameters:
+            commit (Commit): The mined commit.
+        Returns:
+            CommitSnapshot: The snapshot of the commit.
+        """
+        raw = _payload(commit)
+        if raw is not None:
+            return cls(
+                sha=raw.get("sha") or "",
+                message=(raw.get("commit") or {}).get("message") or "",
+                author=_login(raw.get("author")),
+            )
+
+        git_commit = getattr(commit, "commit", None)
+        return cls(
+            sha=commit.sha,
+            message=getattr(git_commit, "message", None) or "",
+            author=_login(commit.author),
+        )
+
+
+def payload_labels(obj: Any) -> Optional[list[str]]:
+    """
+    Return the label names carried in the mined payload of an issue or pull request.
+
+    Parameters:
+        obj: The mined issue or pull request.
+    Returns:
+        Optional[list[str]]: The label names, or None when the payload holds no label list.
+    """
+    raw = _payload(obj)
+    if raw is None or not isinstance(raw.get("labels"), list):
+        return None
+    return list(_names(raw["labels"]))
+
+
+def _payload(obj: Any) -> Optional[dict[str, Any]]:
+    """Return the raw JSON payload of a PyGithub object, without completing it."""
+    raw = getattr(obj, "_rawData", None)
+    return raw if isinstance(raw, dict) else None
+
+
+def _login(user: Any) -> Optional[str]:
+    if user is None:
+        return None
+    if isinstance(user, dict):
+        return user.get("login")
+    return getattr(user, "login", None)
+
+
+def _logins(users: Any) -> tuple[str, ...]:
+    if not isinstance(users, (list, tuple)):
+        return ()
+    return tuple(login for user in users if (login := _login(user)))
+
+
+def _names(labels: Any) -> tuple[str, ...]:
+    if not isinstance(labels, (list, tuple)):
+        return ()
+    return tuple(label["name"] if isinstance(label, dict) else label.name for label in labels)
+
+
+def _label_names(obj: Any, raw: Optional[dict[str, Any]]) -> tuple[str, ...]:
+    if raw is None:
+        return _names(obj.get_labels())
+    if isinstance(raw.get("labels"), list):
+        return _names(raw["labels"])
+    # the payload holds no complete label list, page the labels endpoint
+    return tuple(label.name for label in obj.get_labels())
+
+
+def _datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -20,6 +20,7 @@ DefaultRecordFactory builds both flat and hierarchical issue records (Epics/Feat
 
 import logging
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import cast, Optional
 
 from github import Github
@@ -31,6 +32,7 @@ from release_notes_generator.model.record.commit_record import CommitRecord
 from release_notes_generator.model.record.hierarchy_issue_record import HierarchyIssueRecord
 from release_notes_generator.model.record.issue_record import IssueRecord
 from release_notes_generator.model.mined_data import MinedData
+from release_notes_generator.model.snapshot import IssueSnapshot, payload_labels
 from release_notes_generator.action_inputs import ActionInputs
 from release_notes_generator.model.record.pull_request_record import PullRequestRecord
 from release_notes_generator.model.record.record import Record
@@ -39,8 +41,12 @@ from release_notes_generator.record.factory.record_factory import RecordFactory
 from release_notes_generator.utils.decorators import safe_call_decorator
 from release_notes_generator.utils.github_rate_limiter import GithubRateLimiter
 
-from release_notes_generator.utils.pull_request_utils import get_issues_for_pr, extract_issue_numbers_from_body
-from release_notes_generator.utils.record_utils import get_id, parse_issue_id
+from release_notes_generator.utils.pull_request_utils import (
+    get_issues_for_pr,
+    get_issues_for_prs,
+    extract_issue_numbers_from_body,
+)
+from release_notes_generator.utils.record_utils import get_id, get_label_names, parse_issue_id
 
 logger = logging.getLogger(__name__)
 
@@ -50,13 +56,18 @@ class DefaultRecordFactory(RecordFactory):
     A class used to generate records for release notes.
     """
 
-    def __init__(self, github: Github, home_repository: Repository) -> None:
+    def __init__(
+        self, github: Github, home_repository: Repository, rate_limiter: Optional[GithubRateLimiter] = None
+    ) -> None:
         self._github = github
-        rate_limiter = GithubRateLimiter(github)
+        if rate_limiter is None:
+            rate_limiter = GithubRateLimiter(github)
+        self._rate_limiter = rate_limiter
         self._safe_call = safe_call_decorator(rate_limiter)
         self._home_repository = home_repository
 
         self._records: dict[str, Record] = {}
+        self._pull_linked_issues: dict[int, set[str]] = {}
 
         self.__registered_issues: set[str] = set()
         self.__registered_commits: set[str] = set()
@@ -80,9 +91,22 @@ class DefaultRecordFactory(RecordFactory):
         # dev note: Each issue is now in records dict by its issue number - all on same level - no hierarchy
         #   --> This is useful for population by PRs and commits
 
+        if data.pull_requests:
+            logger.info("Resolving issues linked to Pull Requests...")
+            self._pull_linked_issues = (
+                self._safe_call(get_issues_for_prs)(
+                    pull_numbers=[pull.number for pull in data.pull_requests],
+                    requester=self._github.requester,
+                    rate_limiter=self._rate_limiter,
+                )
+                or {}
+            )
+
         logger.info("Registering Commits to Pull Requests and Pull Requests to Issues...")
-        for pull, repo in data.pull_requests.items():
-            self._register_pull_and_its_commits_to_issue(pull, get_id(pull, repo), data, target_repository=repo)
+        linkages = collect_pull_linkages_parallel(self, data, max_workers=8)
+        missing_issues = self._fetch_missing_linked_issues(linkages, data, max_workers=8)
+        for linkage in linkages:
+            self._register_pull_and_its_commits_to_issue(linkage, data, missing_issues)
 
         if data.pull_requests_of_fetched_cross_issues:
             logger.info("Register cross-repo Pull Requests to its issues")
@@ -120,57 +144,103 @@ class DefaultRecordFactory(RecordFactory):
         self._records[iid] = IssueRecord(issue=issue, skip=skip_record, issue_labels=issue_labels)
         self.__registered_issues.add(iid)
 
-    # pylint: disable=too-many-statements
+    def collect_pull_linkage(self, pull: PullRequest, repo: Repository) -> "PullLinkage":
+        """
+        Collect the linkage data of a pull request. Network calls are allowed, records are not touched.
+
+        Parameters:
+            pull (PullRequest): The pull request.
+            repo (Repository): The repository of the pull request.
+        Returns:
+            PullLinkage: The collected linkage data.
+        """
+        labels = get_label_names(pull)
+        linked_issues = self._get_pull_linked_issues(pull)
+        linked_issues.update(extract_issue_numbers_from_body(pull, repo))
+        return PullLinkage(
+            pull=pull,
+            pid=get_id(pull, repo),
+            repository=repo,
+            labels=tuple(labels),
+            skip=any(item in labels for item in ActionInputs.get_skip_release_notes_labels()),
+            linked_issue_ids=tuple(linked_issues),
+        )
+
+    def _fetch_missing_linked_issues(
+        self, linkages: list["PullLinkage"], data: MinedData, max_workers: int = 8
+    ) -> dict[str, tuple[Issue, Repository]]:
+        """Fetch in parallel, once each, the linked issues which are not among the received issues."""
+        missing_ids: dict[str, int] = {}
+        for linkage in linkages:
+            for issue_id in linkage.linked_issue_ids:
+                if issue_id not in self._records and issue_id not in missing_ids:
+                    missing_ids[issue_id] = linkage.pull.number
+
+        def _fetch(issue_id: str) -> Optional[tuple[Issue, Repository]]:
+            logger.warning(
+                "Detected PR %d linked to issue %s which is not in the list of received issues. Fetching ...",
+                missing_ids[issue_id],
+                issue_id,
+            )
+            # dev note: here we expect that PR links to an issue in the same repository !!!
+            org, repo, num = parse_issue_id(issue_id)
+            r = data.get_repository(f"{org}/{repo}")
+            issue = self._safe_call(r.get_issue)(num) if r is not None else None
+            return (issue, r) if issue is not None else None  # type: ignore[return-value]
+
+        fetched: dict[str, tuple[Issue, Repository]] = {}
+        if not missing_ids:
+            return fetched
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch-linked-issue") as ex:
+            for issue_id, result in zip(missing_ids, ex.map(_fetch, missing_ids)):
+                if result is not None:
+                    fetched[issue_id] = result
+        return fetched
+
     def _register_pull_and_its_commits_to_issue(
-        self, pull: PullRequest, pid: str, data: MinedData, target_repository: Optional[Repository] = None
+        self, linkage: "PullLinkage", data: MinedData, missing_issues: dict[str, tuple[Issue, Repository]]
     ) -> None:
-        pull_labels = [label.name for label in pull.get_labels()]
-        skip_record: bool = any(item in pull_labels for item in ActionInputs.get_skip_release_notes_labels())
-        related_commits = [c for c in data.commits if c.sha == pull.merge_commit_sha]
+        pull = linkage.pull
+        related_commits = data.get_commits_by_sha(pull.merge_commit_sha)
         self.__registered_commits.update(c.sha for c in related_commits)
 
-        pr_repo = target_repository if target_repository is not None else data.home_repository
-
-        merged_linked_issues: set[str] = (
-            self._safe_call(get_issues_for_pr)(pull_number=pull.number, requester=self._github.requester) or set()
-        )
-        merged_linked_issues.update(extract_issue_numbers_from_body(pull, pr_repo))
-        pull_issues: list[str] = list(merged_linked_issues)
         attached_any = False
-        if len(pull_issues) > 0:
-            for issue_id in pull_issues:
-                if issue_id not in self._records:
-                    logger.warning(
-                        "Detected PR %d linked to issue %s which is not in the list of received issues. "
-                        "Fetching ...",
-                        pull.number,
-                        issue_id,
-                    )
-                    # dev note: here we expect that PR links to an issue in the same repository !!!
-                    org, repo, num = parse_issue_id(issue_id)
-                    r = data.get_repository(f"{org}/{repo}")
-                    parent_issue = self._safe_call(r.get_issue)(num) if r is not None else None
-                    if parent_issue is not None:
-                        self._create_record_for_issue(parent_issue, get_id(parent_issue, r))  # type: ignore[arg-type]
-
-                if issue_id in self._records and isinstance(
-                    self._records[issue_id], (SubIssueRecord, HierarchyIssueRecord, IssueRecord)
-                ):
-                    rec = cast(IssueRecord, self._records[issue_id])
-                    rec.register_pull_request(pull)
-                    logger.debug("Registering pull number: %s, title : %s", pull.number, pull.title)
-
-                    for c in related_commits:  # register commits to the PR record
-                        rec.register_commit(pull, c)
-                        logger.debug("Registering commit %s to PR %d", c.sha, pull.number)
-
-                    attached_any = True
+        for issue_id in linkage.linked_issue_ids:
+            if issue_id not in self._records and issue_id in missing_issues:
+                parent_issue, r = missing_issues[issue_id]
+                self._create_record_for_issue(parent_issue, get_id(parent_issue, r))
+
+            if issue_id in self._records and isinstance(
+                self._records[issue_id], (SubIssueRecord, HierarchyIssueRecord, IssueRecord)
+            ):
+                rec = cast(IssueRecord, self._records[issue_id])
+                rec.register_pull_request(pull)
+                logger.debug("Registering pull number: %s, title : %s", pull.number, pull.title)
+
+                for c in related_commits:  # register commits to the PR record
+                    rec.register_commit(pull, c)
+                    logger.debug("Registering commit %s to PR %d", c.sha, pull.number)
+
+                attached_any = True
 
         if not attached_any:
-            self._records[pid] = PullRequestRecord(pull, pr_repo, pull_labels, skip_record)
+            self._records[linkage.pid] = PullRequestRecord(pull, linkage.repository, list(linkage.labels), linkage.skip)
             for c in related_commits:  # register commits to the PR record
-                cast(PullRequestRecord, self._records[pid]).register_commit(c)
-            logger.debug("Created record for PR %s: %s", pid, pull.title)
+                cast(PullRequestRecord, self._records[linkage.pid]).register_commit(c)
+            logger.debug("Created record for PR %s: %s", linkage.pid, pull.title)
+
+    def _get_pull_linked_issues(self, pull: PullRequest) -> set[str]:
+        linked_issues = self._pull_linked_issues.get(pull.number)
+        if linked_issues is None:
+            # not resolved by the batched query, fall back to a single PR query
+            linked_issues = (
+                self._safe_call(get_issues_for_pr)(
+                    pull_number=pull.number, requester=self._github.requester, rate_limiter=self._rate_limiter
+                )
+                or set()
+            )
+        return set(linked_issues)
 
     def _register_cross_repo_prs_to_issue(self, iid: str, prs: list[PullRequest]) -> None:
         if iid not in self.__registered_issues:
@@ -181,10 +251,16 @@ class DefaultRecordFactory(RecordFactory):
             cast(IssueRecord, self._records[iid]).register_pull_request(pr)
 
     def _get_issue_labels_mix_with_type(self, issue: Issue) -> list[str]:
-        labels: list[str] = [label.name for label in issue.get_labels()]
+        labels = payload_labels(issue)
+        if labels is not None:
+            # labels and type came with the mined payload, no need to page the labels endpoint
+            type_name = IssueSnapshot.from_issue(issue).type_name
+        else:
+            labels = [label.name for label in issue.get_labels()]
+            type_name = issue.type.name if issue.type is not None else None
 
-        if issue.type is not None:
-            issue_type = issue.type.name.lower()
+        if type_name is not None:
+            issue_type = type_name.lower()
             if issue_type not in labels:
                 labels.append(issue_type)
 
@@ -297,6 +373,31 @@ class DefaultRecordFactory(RecordFactory):
         return IssueRecord(issue=issue, skip=skip_record, issue_labels=issue_labels)
 
 
+@dataclass(frozen=True)
+class PullLinkage:
+    """Immutable linkage data of a pull request, collected before it is registered to the records."""
+
+    pull: PullRequest
+    pid: str
+    repository: Repository
+    labels: tuple[str, ...]
+    skip: bool
+    linked_issue_ids: tuple[str, ...]
+
+
+def collect_pull_linkages_parallel(gen, data, max_workers: int = 8) -> list[PullLinkage]:
+    """
+    Collect the linkage data of all pull requests in parallel with no side effects on `gen` records.
+    Returns: [PullLinkage] in the order of `data.pull_requests`
+    """
+    pulls_items = list(data.pull_requests.items())  # snapshot
+    if not pulls_items:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="collect-pr-link") as ex:
+        return list(ex.map(lambda pr: gen.collect_pull_linkage(*pr), pulls_items))
+
+
 def build_issue_records_parallel(gen, data, max_workers: int = 8) -> dict[str, "Record"]:
     """
     Build issue records in parallel with no side effects on `gen`.
@@ -51,6 +51,11 @@ SERVICE_CHAPTER_ORDER = "service-chapter-order"
 SERVICE_CHAPTER_EXCLUDE = "service-chapter-exclude"
 GLOBAL_EXCLUDE_KEY = "*"
 PRINT_EMPTY_CHAPTERS = "print-empty-chapters"
+HTTP_CACHE_DIR = "http-cache-dir"
+HTTP_CACHE_MAX_SIZE_MB = "http-cache-max-size-mb"
+MINING_STATE_FILE = "mining-state-file"
+SUB_ISSUE_GRAPH_FILE = "sub-issue-graph-file"
+LOCAL_REPOSITORY_PATH = "local-repository-path"
 
 # Super chapter fallback heading
 UNCATEGORIZED_CHAPTER_TITLE: str = "Uncategorized"
@@ -96,3 +101,148 @@ query {{
   }}
 }}
 """
+
+# GitHub GraphQL limits the number of nodes a single query may request
+GRAPHQL_MAX_NODES = 500_000
+ISSUES_FOR_PRS_BATCH_MAX = 100
+ISSUES_FOR_PRS_BATCH: str = """
+query {{
+  repository(owner: "{owner}", name: "{name}") {{
+{pull_requests}
+  }}
+}}
+"""
+ISSUES_FOR_PRS_BATCH_ALIAS: str = """
+    pr{number}: pullRequest(number: {number}) {{
+      closingIssuesReferences(userLinkedOnly: false, first: {first}){{
+        nodes{{
+          number
+        }}
+      }}
+    }}"""
+
+# Issue mining via GraphQL: issues updated since the release and open issues are paged as two aliased streams.
+# GitHub charges a rate limit point per 100 connection requests: each issue requests its assignees and labels and,
+# when the hierarchy is mined, its sub-issue page and the sub-issue count of each child (2 + 1 + 100 = 103).
+# The page size keeps one query of both streams within ISSUES_MINING_MAX_COST points (100 issues without sub-issues,
+# 48 with them); the nodes stay far below GRAPHQL_MAX_NODES.
+ISSUES_MINING_PAGE_SIZE = 100
+ISSUES_MINING_SUB_ISSUES_PAGE_SIZE = 100
+ISSUES_MINING_MAX_COST = 100
+# issue fields read by the records, shared by the mining query and the batched fetch of missing issues
+ISSUE_FIELDS_FRAGMENT: str = """
+fragment IssueFields on Issue {
+  number
+  title
+  body
+  state
+  stateReason
+  url
+  createdAt
+  updatedAt
+  closedAt
+  author { login }
+  assignees(first: 100) { totalCount nodes { login } }
+  labels(first: 100) { totalCount nodes { name } }
+  issueType { name }
+}
+"""
+ISSUES_MINING_QUERY: str = """
+query MineIssues(
+  $owner: String!, $name: String!, $since: DateTime, $first: Int!,
+  $withUpdated: Boolean!, $afterUpdated: String, $withOpen: Boolean!, $afterOpen: String,
+  $withSubIssues: Boolean!, $firstSubIssues: Int!
+) {
+  repository(owner: $owner, name: $name) {
+    updated: issues(
+      first: $first, after: $afterUpdated, filterBy: {since: $since}, orderBy: {field: CREATED_AT, direction: DESC}
+    ) @include(if: $withUpdated) {
+      ...IssuePage
+    }
+    open: issues(
+      first: $first, after: $afterOpen, states: [OPEN], orderBy: {field: CREATED_AT, direction: DESC}
+    ) @include(if: $withOpen) {
+      ...IssuePage
+    }
+  }
+}
+
+fragment IssuePage on IssueConnection {
+  pageInfo { hasNextPage endCursor }
+  nodes {
+    ...IssueFields
+    subIssues(first: $firstSubIssues) @include(if: $withSubIssues) {
+      totalCount
+      nodes {
+        number
+        repository { owner { login } name }
+        subIssues(first: 0) { totalCount }
+      }
+    }
+  }
+}
+""" + ISSUE_FIELDS_FRAGMENT
+# max count of issues resolved by one batched GraphQL query
+ISSUES_FETCH_BATCH_SIZE = 50
+
+# Cross-references of issues, read from their timeline; the pull requests are shaped as the REST payload.
+# Nodes per query: 10 issues x 100 references x (100 assignees + 100 labels) = 200 000, below GRAPHQL_MAX_NODES.
+CROSS_REFERENCES_FETCH_BATCH_SIZE = 10
+CROSS_REFERENCES_PAGE_SIZE = 100
+PULL_REQUEST_FIELDS_FRAGMENT: str = """
+fragment PullRequestFields on PullRequest {
+  number
+  title
+  body
+  state
+  url
+  createdAt
+  updatedAt
+  closedAt
+  mergedAt
+  mergeCommit { oid }
+  baseRefName
+  repository { owner { login } name }
+  author { login }
+  assignees(first: 100) { totalCount nodes { login } }
+  labels(first: 100) { totalCount nodes { name } }
+}
+"""
+
+# Pull requests which merged the commits of a comparison, read from `associatedPullRequests` of each commit.
+# Nodes per query: 50 commits x 5 pull requests x (100 assignees + 100 labels) = 50 000, below GRAPHQL_MAX_NODES.
+COMMIT_PULLS_FETCH_BATCH_SIZE = 50
+ASSOCIATED_PULL_REQUESTS_PAGE_SIZE = 5
+# Author logins of commits read from a local clone; no connection is read, so the query costs a single point.
+COMMIT_AUTHORS_FETCH_BATCH_SIZE = 100
+
+# Freshness checks of the cached sub-issue graph read only `updatedAt`, so no connection adds to the query cost.
+UPDATED_AT_FETCH_BATCH_SIZE = 100
+
+# Compare mode checks the repository, both tags and the release of the previous tag in one query before mining.
+COMPARE_PREFLIGHT_QUERY: str = """
+query ComparePreflight($owner: String!, $name: String!, $fromRef: String!, $toRef: String!, $fromTag: String!) {
+  repository(owner: $owner, name: $name) {
+    databaseId
+    name
+    nameWithOwner
+    owner { login }
+    isPrivate
+    url
+    defaultBranchRef { name }
+    fromRef: ref(qualifiedName: $fromRef) { target { oid } }
+    toRef: ref(qualifiedName: $toRef) { target { oid } }
+    release(tagName: $fromTag) {
+      databaseId
+      tagName
+      name
+      description
+      isDraft
+      isPrerelease
+      createdAt
+      publishedAt
+      url
+    }
+  }
+}
+"""
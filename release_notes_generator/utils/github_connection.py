@@ -0,0 +1,66 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module makes the connection of a PyGithub client safe for concurrent requests.
+"""
+
+import logging
+import threading
+from typing import Any
+
+from github import Github
+
+logger = logging.getLogger(__name__)
+
+# attributes the PyGithub connection keeps between `request()` and `getresponse()`
+_REQUEST_ATTRIBUTES = ("verb", "url", "input", "headers", "stream")
+
+
+def _thread_local_attribute(pending_request: threading.local, name: str) -> property:
+    def getter(_self: Any) -> Any:
+        return getattr(pending_request, name)
+
+    def setter(_self: Any, value: Any) -> None:
+        setattr(pending_request, name, value)
+
+    return property(getter, setter)
+
+
+def install_thread_safe_connection(github: Github) -> None:
+    """
+    Make the requests of the PyGithub client safe to send from multiple threads.
+
+    PyGithub shares one connection object per client and keeps the request being sent in its attributes between
+    `request()` and `getresponse()`, so two threads can swap their requests. The connection class of this client's
+    requester is replaced by a subclass keeping those attributes per thread; the session and its pool stay shared.
+
+    Parameters:
+        github (Github): The PyGithub client.
+    Returns:
+        None
+    """
+    requester = github.requester
+    base_class = getattr(requester, "_Requester__connectionClass", None)
+    if not isinstance(base_class, type):
+        logger.warning("Unknown PyGithub connection class, concurrent requests are not made thread-safe.")
+        return
+
+    # a thread sends its request and reads the response in a row, so one thread-local store serves all connections
+    pending_request = threading.local()
+    attributes = {name: _thread_local_attribute(pending_request, name) for name in _REQUEST_ATTRIBUTES}
+    thread_safe_class = type(f"ThreadSafe{base_class.__name__}", (base_class,), attributes)
+    setattr(requester, "_Requester__connectionClass", thread_safe_class)
@@ -18,23 +18,96 @@
 This module contains the GithubRateLimiter class which is responsible for rate limiting the GitHub API calls.
 """
 
+import inspect
 import logging
+import threading
 import time
 from datetime import datetime
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Mapping
 from github import Github
+from github.Requester import Requester
 
 logger = logging.getLogger(__name__)
 
+HEADER_RATE_REMAINING = "X-RateLimit-Remaining"
+HEADER_RATE_RESET = "X-RateLimit-Reset"
+HEADER_RATE_RESOURCE = "X-RateLimit-Resource"
+
+# rate limit resources (buckets) of GitHub; REST calls use `core`, GraphQL queries `graphql`
+CORE_RESOURCE = "core"
+GRAPHQL_RESOURCE = "graphql"
+
 
 class GithubRateLimiter:
     """
     A class used to rate limit the GitHub API calls.
+
+    The remaining budget of each rate limit resource (`core` for REST, `graphql` for GraphQL) is shared by
+    all callers (threads included) and is kept up to date from the `X-RateLimit-*` response headers, keyed
+    by `X-RateLimit-Resource` (see `install_rate_limit_hook`). The `/rate_limit` endpoint is polled only when
+    no fresh header data is known, by one caller at a time.
     """
 
+    MIN_REMAINING_CALLS = 5
+
     def __init__(self, github_client: Github):
         self.github_client: Github = github_client
 
+        self._lock = threading.Lock()
+        # notified when a poll of `/rate_limit` finished
+        self._poll_done = threading.Condition(self._lock)
+        self._budgets: dict[str, tuple[int, float]] = {}  # resource -> (remaining, reset time)
+        self._polling: set[str] = set()  # resources being polled
+        self._polls_count: int = 0
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """Getter for the last known count of remaining REST (core) calls."""
+        return self.budget(CORE_RESOURCE)[0]
+
+    @property
+    def reset_time(self) -> Optional[float]:
+        """Getter for the last known reset time of the REST (core) budget as a Unix timestamp."""
+        return self.budget(CORE_RESOURCE)[1]
+
+    @property
+    def polls_count(self) -> int:
+        """Getter for the number of `/rate_limit` requests made by the limiter."""
+        return self._polls_count
+
+    def budget(self, resource: str) -> tuple[Optional[int], Optional[float]]:
+        """
+        Get the last known budget of a rate limit resource.
+
+        @param resource: The rate limit resource, e.g. `core` or `graphql`.
+        @return: The remaining calls and the reset time, None when unknown.
+        """
+        with self._lock:
+            remaining, reset_time = self._budgets.get(resource, (None, None))
+        return remaining, reset_time
+
+    def update_from_headers(self, headers: Mapping[str, Any]) -> None:
+        """
+        Update the shared budget of the response's rate limit resource from its headers.
+
+        @param headers: The response headers.
+        @return: None
+        """
+        normalized = {str(k).lower(): v for k, v in headers.items()}
+        raw_remaining = normalized.get(HEADER_RATE_REMAINING.lower())
+        raw_reset = normalized.get(HEADER_RATE_RESET.lower())
+        if raw_remaining is None or raw_reset is None:
+            return
+        try:
+            remaining = int(float(str(raw_remaining)))
+            reset_time = float(str(raw_reset))
+        except ValueError:
+            return
+        resource = str(normalized.get(HEADER_RATE_RESOURCE.lower(), CORE_RESOURCE)).lower()
+
+        with self._lock:
+            self._budgets[resource] = (remaining, reset_time)
+
     def __call__(self, method: Callable) -> Callable:
         """
         Decorator to rate limit the GitHub API calls.
@@ -44,33 +117,125 @@ class GithubRateLimiter:
         """
 
         def wrapped_method(*args, **kwargs) -> Optional[Any]:
+            self.wait_if_needed()
+            return method(*args, **kwargs)
+
+        return wrapped_method
+
+    def wait_if_needed(self, resource: str = CORE_RESOURCE) -> None:
+        """
+        Sleep until the rate limit reset time when the remaining budget is almost exhausted.
+
+        @param resource: The rate limit resource of the following call, `core` (REST) by default.
+        @return: None
+        """
+        remaining_calls, reset_time = self._get_budget(resource)
+
+        if remaining_calls < self.MIN_REMAINING_CALLS:
+            logger.info("Rate limit almost reached. Sleeping until reset time.")
+            sleep_time = reset_time - (now := time.time())
+            while sleep_time <= 0:
+                # Note: received values can be in the past, so the time shift to 1st positive value is needed
+                reset_time += 3600  # Add 1 hour in seconds
+                sleep_time = reset_time - now
+
+            total_sleep_time = sleep_time + 5  # Total sleep time including the additional 5 seconds
+            hours, remainder = divmod(total_sleep_time, 3600)
+            minutes, seconds = divmod(remainder, 60)
+
+            logger.info(
+                "Sleeping for %s hours, %s minutes, and %s seconds until %s.",
+                hours,
+                minutes,
+                seconds,
+                datetime.fromtimestamp(reset_time).strftime("%Y-%m-%d %H:%M:%S"),
+            )
+            time.sleep(sleep_time + 5)  # Sleep for the calculated time plus 5 seconds
+
+            with self._lock:
+                # the budget is renewed after the reset, force a re-check on next call
+                self._budgets.pop(resource, None)
+        else:
+            logger.debug("Rate limiter: Remaining calls: %s, Reset time: %s", remaining_calls, reset_time)
+
+    def _get_budget(self, resource: str) -> tuple[int, float]:
+        with self._poll_done:
+            while True:
+                budget = self._budgets.get(resource)
+                if budget is not None and budget[1] > time.time():
+                    return budget
+                if resource not in self._polling:
+                    break
+                # another caller polls the same resource, its result is used
+                self._poll_done.wait()
+            self._polling.add(resource)
+
+        try:
+            logger.debug("Rate limiter: no fresh rate limit headers of '%s', polling /rate_limit.", resource)
             rate_limit_overview = self.github_client.get_rate_limit()
-            remaining_calls = rate_limit_overview.rate.remaining
-            reset_time = rate_limit_overview.rate.reset.timestamp()
-
-            if remaining_calls < 5:
-                logger.info("Rate limit almost reached. Sleeping until reset time.")
-                sleep_time = reset_time - (now := time.time())
-                while sleep_time <= 0:
-                    # Note: received values can be in the past, so the time shift to 1st positive value is needed
-                    reset_time += 3600  # Add 1 hour in seconds
-                    sleep_time = reset_time - now
-
-                total_sleep_time = sleep_time + 5  # Total sleep time including the additional 5 seconds
-                hours, remainder = divmod(total_sleep_time, 3600)
-                minutes, seconds = divmod(remainder, 60)
-
-                logger.info(
-                    "Sleeping for %s hours, %s minutes, and %s seconds until %s.",
-                    hours,
-                    minutes,
-                    seconds,
-                    datetime.fromtimestamp(reset_time).strftime("%Y-%m-%d %H:%M:%S"),
-                )
-                time.sleep(sleep_time + 5)  # Sleep for the calculated time plus 5 seconds
+            if resource == CORE_RESOURCE:
+                rate = rate_limit_overview.rate
             else:
-                logger.debug("Rate limiter: Remaining calls: %s, Reset time: %s", remaining_calls, reset_time)
+                rate = getattr(rate_limit_overview.resources, resource)
+            budget = (rate.remaining, rate.reset.timestamp())
+        finally:
+            with self._poll_done:
+                self._polling.discard(resource)
+                self._poll_done.notify_all()
 
-            return method(*args, **kwargs)
+        with self._lock:
+            self._polls_count += 1
+            self._budgets[resource] = budget
+        return budget
 
-        return wrapped_method
+
+def install_rate_limit_hook(github: Github, rate_limiter: GithubRateLimiter) -> None:
+    """
+    Report the rate limit headers of every response of the PyGithub client to the limiter.
+
+    PyGithub keeps the headers of its latest response only, without their resource, so REST and GraphQL responses
+    cannot be told apart there. A response hook is registered on the session of this client's connection instead.
+
+    @param github: The PyGithub client.
+    @param rate_limiter: The limiter to report the response headers to.
+    @return: None
+    """
+    requester = github.requester
+    base_class = getattr(requester, "_Requester__connectionClass", None)
+    if not inspect.isclass(base_class):
+        logger.warning("Unknown PyGithub connection class, the rate limit headers of REST responses are not tracked.")
+        return
+
+    def _report(response: Any, *_args: Any, **_kwargs: Any) -> None:
+        rate_limiter.update_from_headers(response.headers)
+
+    def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+        base_class.__init__(self, *args, **kwargs)
+        self.session.hooks["response"].append(_report)
+
+    hooked_class = type(f"RateLimited{base_class.__name__}", (base_class,), {"__init__": __init__})
+    setattr(requester, "_Requester__connectionClass", hooked_class)
+    # the connection is created on the first request, one created already gets the hook too
+    if (connection := getattr(requester, "_Requester__connection", None)) is not None:
+        connection.session.hooks["response"].append(_report)
+
+
+def graphql_query(
+    requester: Requester, query: str, variables: dict[str, Any], rate_limiter: Optional[GithubRateLimiter] = None
+) -> dict[str, Any]:
+    """
+    Run a GraphQL query through the PyGithub requester within the `graphql` rate limit budget.
+
+    @param requester: The PyGithub requester.
+    @param query: The query text.
+    @param variables: The query variables.
+    @param rate_limiter: The limiter to wait on and to report the response headers to, if any.
+    @return: The response payload.
+    @raise GithubException: When the query fails.
+    """
+    if rate_limiter is not None:
+        rate_limiter.wait_if_needed(GRAPHQL_RESOURCE)
+    headers, payload = requester.graphql_query(query, variables)
+    if rate_limiter is not None:
+        rate_limiter.update_from_headers(headers)
+    return payload
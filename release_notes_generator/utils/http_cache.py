@@ -0,0 +1,358 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""
+This module contains the persistent on-disk HTTP response cache.
+
+Cached GET responses are revalidated with conditional requests (`If-None-Match` / `If-Modified-Since`).
+GitHub answers unchanged resources with `304 Not Modified`, which does not count against the rate limit,
+and the cached body is served instead. Only responses with an `ETag` are stored: the server compares it with
+the representation it would send to the current credentials, so the entries are shared by all tokens (the
+`GITHUB_TOKEN` of a workflow changes on every run).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import requests
+from github import Github
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+logger = logging.getLogger(__name__)
+
+META_SUFFIX = ".json"
+BODY_SUFFIX = ".body"
+
+# headers describing the transfer of the original response, not valid for the stored (decoded) body
+_TRANSFER_HEADERS = ("content-encoding", "content-length", "transfer-encoding", "connection")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A response stored in the cache."""
+
+    url: str
+    headers: dict[str, str]
+    body: bytes
+
+    @property
+    def etag(self) -> Optional[str]:
+        """Getter for the ETag validator."""
+        return CaseInsensitiveDict(self.headers).get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        """Getter for the Last-Modified validator."""
+        return CaseInsensitiveDict(self.headers).get("Last-Modified")
+
+
+class HttpCache:
+    """
+    A size-bounded, least-recently-used on-disk store of HTTP responses.
+
+    Every entry is kept as a metadata file (URL and headers) and a body file named by the request key.
+    The store is safe to use from multiple threads and survives between runs.
+    """
+
+    def __init__(self, directory: str, max_size_bytes: int):
+        self._directory = directory
+        self._max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        # key -> entry size in bytes, ordered from least to most recently used
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    @property
+    def hits(self) -> int:
+        """Getter for the number of responses served from the cache after revalidation."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Getter for the number of cacheable requests answered with a full response."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Getter for the number of entries removed to keep the cache within its size limit."""
+        return self._evictions
+
+    @property
+    def size_bytes(self) -> int:
+        """Getter for the total size of the stored entries."""
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    @staticmethod
+    def make_key(request: requests.PreparedRequest) -> str:
+        """
+        Build the cache key of a request.
+
+        The key covers the URL and the media type. The credentials are not part of it, so the entries
+        survive the token change between runs; a response is served only after the server revalidated its ETag.
+
+        Parameters:
+            request (requests.PreparedRequest): The request to build the key for.
+        Returns:
+            str: The hexadecimal cache key.
+        """
+        headers = request.headers
+        material = "\n".join([request.url or "", headers.get("Accept", "")])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Read an entry and mark it as most recently used.
+
+        Parameters:
+            key (str): The cache key.
+        Returns:
+            Optional[CachedResponse]: The stored response or None when it is not cached.
+        """
+        with self._lock:
+            if key not in self._index:
+                return None
+            try:
+                with open(self._path(key, META_SUFFIX), "r", encoding="utf-8") as meta_file:
+                    meta = json.load(meta_file)
+                with open(self._path(key, BODY_SUFFIX), "rb") as body_file:
+                    body = body_file.read()
+                os.utime(self._path(key, META_SUFFIX))
+            except (OSError, ValueError) as e:
+                logger.warning("HTTP cache: dropping unreadable entry %s: %s", key, e)
+                self._remove(key)
+                return None
+
+            self._index.move_to_end(key)
+            return CachedResponse(url=meta.get("url", ""), headers=meta.get("headers", {}), body=body)
+
+    def put(self, key: str, response: requests.Response) -> None:
+        """
+        Store a response and evict the least recently used entries over the size limit.
+
+        Parameters:
+            key (str): The cache key.
+            response (requests.Response): The received response.
+        Returns:
+            None
+        """
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _TRANSFER_HEADERS}
+        meta = json.dumps({"url": response.url, "headers": headers}).encode("utf-8")
+        body = response.content or b""
+        size = len(meta) + len(body)
+        if size > self._max_size_bytes:
+            logger.debug("HTTP cache: response of %s is larger than the cache, not stored.", response.url)
+            return
+
+        with self._lock:
+            try:
+                self._write_atomic(self._path(key, BODY_SUFFIX), body)
+                self._write_atomic(self._path(key, META_SUFFIX), meta)
+            except OSError as e:
+                logger.warning("HTTP cache: failed to store response of %s: %s", response.url, e)
+                self._remove(key)
+                return
+
+            self._size_bytes += size - self._index.get(key, 0)
+            self._index[key] = size
+            self._index.move_to_end(key)
+            self._evict()
+
+    def record_hit(self) -> None:
+        """Count a response served from the cache."""
+        with self._lock:
+            self._hits += 1
+
+    def record_miss(self) -> None:
+        """Count a cacheable request answered with a full response."""
+        with self._lock:
+            self._misses += 1
+
+    def _load_index(self) -> None:
+        keys = {
+            name[: -len(suffix)]
+            for name in os.listdir(self._directory)
+            for suffix in (META_SUFFIX, BODY_SUFFIX)
+            if name.endswith(suffix)
+        }
+        entries: list[tuple[float, str, int]] = []
+        for key in keys:
+            try:
+                with open(self._path(key, META_SUFFIX), "r", encoding="utf-8") as meta_file:
+                    json.load(meta_file)
+                meta_stat = os.stat(self._path(key, META_SUFFIX))
+                body_size = os.path.getsize(self._path(key, BODY_SUFFIX))
+            except (OSError, ValueError) as e:
+                # a store interrupted between its two files or a damaged entry is never served, its files are dropped
+                logger.debug("HTTP cache: dropping incomplete entry %s: %s", key, e)
+                self._remove(key)
+                continue
+            entries.append((meta_stat.st_mtime, key, meta_stat.st_size + body_size))
+
+        for _mtime, key, size in sorted(entries):
+            self._index[key] = size
+            self._size_bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._index and self._size_bytes > self._max_size_bytes:
+            self._remove(next(iter(self._index)))
+            self._evictions += 1
+
+    def _remove(self, key: str) -> None:
+        self._size_bytes -= self._index.pop(key, 0)
+        for suffix in (META_SUFFIX, BODY_SUFFIX):
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self._directory, key + suffix)
+
+    @staticmethod
+    def _write_atomic(path: str, content: bytes) -> None:
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_path, path)
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """
+    A transport adapter revalidating GET requests against the HttpCache.
+
+    Other methods, streamed downloads and requests which already carry their own validators are passed through.
+    """
+
+    def __init__(self, cache: HttpCache, **kwargs: Any):
+        self._cache = cache
+        super().__init__(**kwargs)
+
+    def send(  # pylint: disable=too-many-positional-arguments
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: float | tuple[float, float] | tuple[float, None] | None = None,
+        verify: bool | str = True,
+        cert: bytes | str | tuple[bytes | str, bytes | str] | None = None,
+        proxies: Mapping[str, str] | None = None,
+    ) -> requests.Response:
+        if (
+            request.method != "GET"
+            or stream
+            or "If-None-Match" in request.headers
+            or "If-Modified-Since" in request.headers
+        ):
+            return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        key = HttpCache.make_key(request)
+        cached = self._cache.get(key)
+        if cached is not None:
+            if cached.etag:
+                request.headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request.headers["If-Modified-Since"] = cached.last_modified
+
+        response = super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+        if response.status_code == 304 and cached is not None:
+            self._cache.record_hit()
+            return self._build_cached_response(cached, response)
+
+        self._cache.record_miss()
+        if response.status_code == 200 and "ETag" in response.headers:
+            self._cache.put(key, response)
+        return response
+
+    @staticmethod
+    def _build_cached_response(cached: CachedResponse, not_modified: requests.Response) -> requests.Response:
+        """Turn the 304 answer into a full response with the cached body and the fresh (e.g. rate limit) headers."""
+        headers = CaseInsensitiveDict(cached.headers)
+        for name, value in not_modified.headers.items():
+            if name.lower() not in _TRANSFER_HEADERS:
+                headers[name] = value
+
+        not_modified.status_code = 200
+        not_modified.reason = "OK"
+        not_modified.headers = headers
+        not_modified._content = cached.body  # pylint: disable=protected-access
+        not_modified.encoding = get_encoding_from_headers(headers) or "utf-8"
+        return not_modified
+
+
+def mount_http_cache(session: requests.Session, cache: HttpCache) -> requests.Session:
+    """
+    Mount the caching adapter for both HTTP schemes of the session.
+
+    Parameters:
+        session (requests.Session): The session to mount the adapter on.
+        cache (HttpCache): The cache to use.
+    Returns:
+        requests.Session: The same session, for chaining.
+    """
+    adapter = CachingHTTPAdapter(cache)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def install_http_cache(github: Github, cache: HttpCache) -> None:
+    """
+    Route all REST requests of the PyGithub client through the cache.
+
+    PyGithub offers no per-instance hook for its transport. `Requester.injectConnectionClasses` is global and turns
+    off connection reuse, so the connection class of this client's requester is replaced by a caching subclass.
+
+    Parameters:
+        github (Github): The PyGithub client.
+        cache (HttpCache): The cache to use.
+    Returns:
+        None
+    """
+    requester = github.requester
+    base_class = getattr(requester, "_Requester__connectionClass")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        base_class.__init__(self, *args, **kwargs)
+        self.adapter = CachingHTTPAdapter(
+            cache,
+            max_retries=self.retry,
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
+        self.session.mount(f"{self.protocol}://", self.adapter)
+
+    caching_class = type(f"Caching{base_class.__name__}", (base_class,), {"__init__": __init__})
+    setattr(requester, "_Requester__connectionClass", caching_class)
@@ -18,8 +18,10 @@
 This module contains utility functions for extracting and fetching issue numbers from pull requests.
 """
 
+import logging
 import re
 from functools import lru_cache
+from typing import Optional
 
 from github import GithubException
 from github.Requester import Requester
@@ -27,15 +29,26 @@ from github.PullRequest import PullRequest
 from github.Repository import Repository
 
 from release_notes_generator.action_inputs import ActionInputs
-from release_notes_generator.utils.constants import ISSUES_FOR_PRS, LINKED_ISSUES_MAX
+from release_notes_generator.model.snapshot import PullRequestSnapshot
+from release_notes_generator.utils.constants import (
+    ISSUES_FOR_PRS,
+    LINKED_ISSUES_MAX,
+    ISSUES_FOR_PRS_BATCH,
+    ISSUES_FOR_PRS_BATCH_ALIAS,
+    ISSUES_FOR_PRS_BATCH_MAX,
+    GRAPHQL_MAX_NODES,
+)
+from release_notes_generator.utils.github_rate_limiter import GithubRateLimiter, graphql_query
 
+logger = logging.getLogger(__name__)
 
-def extract_issue_numbers_from_body(pr: PullRequest, repository: Repository) -> set[str]:
+
+def extract_issue_numbers_from_body(pr: PullRequest | PullRequestSnapshot, repository: Repository) -> set[str]:
     """
     Extracts the numbers of the issues mentioned in the body of the pull request.
 
     Parameters:
-        pr (PullRequest): The pull request to extract numbers from.
+        pr (PullRequest | PullRequestSnapshot): The pull request to extract numbers from.
 
     Returns:
         Set of issue numbers mentioned in the pull request body.
@@ -54,7 +67,9 @@ def extract_issue_numbers_from_body(pr: PullRequest, repository: Repository) ->
 
 
 @lru_cache(maxsize=1024)
-def get_issues_for_pr(pull_number: int, requester: Requester) -> set[str]:
+def get_issues_for_pr(
+    pull_number: int, requester: Requester, rate_limiter: Optional[GithubRateLimiter] = None
+) -> set[str]:
     """Fetch closing issue numbers for a PR via GitHub GraphQL and return them as a set."""
     owner = ActionInputs.get_github_owner()
     name = ActionInputs.get_github_repo_name()
@@ -70,7 +85,7 @@ def get_issues_for_pr(pull_number: int, requester: Requester) -> set[str]:
     }
 
     try:
-        headers, payload = requester.graphql_query(query, headers)
+        payload = graphql_query(requester, query, headers, rate_limiter)
     except GithubException as e:
         # e.status (int), e.data (dict/str) often contains useful details
         raise RuntimeError(f"GitHub HTTP error {getattr(e, 'status', '?')}: {getattr(e, 'data', e)}") from e
@@ -90,3 +105,70 @@ def get_issues_for_pr(pull_number: int, requester: Requester) -> set[str]:
         f"{owner}/{name}#{node['number']}"
         for node in payload["data"]["repository"]["pullRequest"]["closingIssuesReferences"]["nodes"]
     }
+
+
+def get_issues_for_prs_batch_size() -> int:
+    """
+    Get the count of PRs resolved by one batched GraphQL query.
+
+    Each PR alias requests the PR node and up to LINKED_ISSUES_MAX closing issues. The batch is capped
+    by the GraphQL node limit and by ISSUES_FOR_PRS_BATCH_MAX, which keeps the query cost at 1 point.
+    """
+    nodes_per_pull = 1 + LINKED_ISSUES_MAX
+    return max(1, min(ISSUES_FOR_PRS_BATCH_MAX, (GRAPHQL_MAX_NODES - 1) // nodes_per_pull))
+
+
+def get_issues_for_prs(
+    pull_numbers: list[int], requester: Requester, rate_limiter: Optional[GithubRateLimiter] = None
+) -> dict[int, set[str]]:
+    """
+    Fetch closing issue numbers for many PRs via batched GitHub GraphQL queries.
+
+    Parameters:
+        pull_numbers: Numbers of the pull requests in the home repository.
+        requester: The PyGithub requester used to send the queries.
+        rate_limiter: The limiter keeping the queries within the GraphQL budget, if any.
+
+    Returns:
+        Mapping of PR number to the set of its closing issue ids. PRs from a failed batch are not
+        present in the mapping, so the caller can fall back to `get_issues_for_pr`.
+    """
+    owner = ActionInputs.get_github_owner()
+    name = ActionInputs.get_github_repo_name()
+    numbers = sorted(set(pull_numbers))
+    batch_size = get_issues_for_prs_batch_size()
+    result: dict[int, set[str]] = {}
+
+    for i in range(0, len(numbers), batch_size):
+        batch = numbers[i : i + batch_size]
+        query = ISSUES_FOR_PRS_BATCH.format(
+            owner=owner,
+            name=name,
+            pull_requests="".join(
+                ISSUES_FOR_PRS_BATCH_ALIAS.format(number=number, first=LINKED_ISSUES_MAX) for number in batch
+            ),
+        )
+
+        try:
+            payload = graphql_query(requester, query, {}, rate_limiter)
+        except GithubException as e:
+            logger.warning(
+                "Batched closing issues query for %d PR(s) failed (HTTP %s): %s",
+                len(batch),
+                getattr(e, "status", "?"),
+                getattr(e, "data", e),
+            )
+            continue
+
+        repository = payload.get("data", {}).get("repository") if isinstance(payload, dict) else None
+        if not isinstance(repository, dict):
+            logger.warning("Malformed batched closing issues response for %d PR(s).", len(batch))
+            continue
+
+        for number in batch:
+            pull_node = repository.get(f"pr{number}")
+            nodes = pull_node["closingIssuesReferences"]["nodes"] if pull_node else []
+            result[number] = {f"{owner}/{name}#{node['number']}" for node in nodes}
+
+    logger.debug("Resolved closing issues for %d PR(s) in %d batch(es).", len(result), -(-len(numbers) // batch_size))
+    return result
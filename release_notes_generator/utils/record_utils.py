@@ -29,6 +29,7 @@ from github.PullRequest import PullRequest
 from github.Repository import Repository
 
 from release_notes_generator.action_inputs import ActionInputs
+from release_notes_generator.model.snapshot import payload_labels
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +86,24 @@ def format_issue_id(org: str, repo: str, number: int) -> str:
     return f"{org}/{repo}#{number}"
 
 
+def get_label_names(obj: Issue | PullRequest) -> list[str]:
+    """
+    Get the label names of an issue or pull request.
+
+    The labels received with the mined payload are used; the labels endpoint is paged only when
+    the payload does not hold them.
+
+    Parameters:
+        obj: The issue or pull request.
+    Returns:
+        list[str]: The label names.
+    """
+    labels = payload_labels(obj)
+    if labels is not None:
+        return labels
+    return [label.name for label in obj.get_labels()]
+
+
 def get_rls_notes_default(body: str, line_marks: list[str], detection_regex: re.Pattern[str]) -> str:
     """
     Extracts release notes from the pull request body based on the provided line marks and detection regex.
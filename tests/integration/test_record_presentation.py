@@ -79,7 +79,7 @@ def test_release_notes_extraction_from_issue_and_pr_body(
     mocker.patch.object(DataMiner, "mine_data", return_value=data)
     mocker.patch(
         "release_notes_generator.record.factory.default_record_factory.get_issues_for_pr",
-        side_effect=lambda pull_number, requester: (
+        side_effect=lambda pull_number, requester, rate_limiter=None: (
             {"org/repo#1"} if pull_number == 10 else {"org/repo#2"}
         ),
     )
@@ -60,17 +60,24 @@ def mock_safe_call_decorator(_rate_limiter):
     def wrapper(fn):
         if fn.__name__ == "get_issues_for_pr":
             return mock_get_issues_for_pr
+        if fn.__name__ == "get_issues_for_prs":
+            return mock_get_issues_for_prs
         return fn
 
     return wrapper
 
 
-def mock_get_issues_for_pr(pull_number: int, requester: Requester) -> set[int]:
+def mock_get_issues_for_pr(pull_number: int, requester: Requester, rate_limiter=None) -> set[int]:
     # if pull_number == 150:
     #     return [451]
     return set()
 
 
+def mock_get_issues_for_prs(pull_numbers: list[int], requester: Requester, rate_limiter=None) -> dict[int, set[str]]:
+    # nothing resolved in batch, records fall back to single PR queries
+    return {}
+
+
 # Fixtures for Custom Chapters
 @pytest.fixture
 def mock_user(mocker):
@@ -1145,14 +1152,14 @@ def record_with_hierarchy_issues(request):
 
     rec_feature_issue = HierarchyIssueRecord(request.getfixturevalue("mock_open_hierarchy_issue_feature"))  # nr:201
     rec_feature_issue.level = 1
-    rec_epic_issue.sub_hierarchy_issues[rec_feature_issue.issue.number] = rec_feature_issue
+    rec_epic_issue.sub_hierarchy_issues[rec_feature_issue.snapshot.number] = rec_feature_issue
 
     rec_task_issue = SubIssueRecord(request.getfixturevalue("mock_closed_issue_type_task"))  # nr:202
-    rec_feature_issue.sub_issues[rec_task_issue.issue.number] = rec_task_issue
+    rec_feature_issue.sub_issues[rec_task_issue.snapshot.number] = rec_task_issue
 
     # add sub_issue
     rec_sub_issue_no_type = SubIssueRecord(request.getfixturevalue("mock_closed_issue_type_none"))  # nr:204
-    rec_feature_issue.sub_issues[rec_sub_issue_no_type.issue.number] = rec_sub_issue_no_type
+    rec_feature_issue.sub_issues[rec_sub_issue_no_type.snapshot.number] = rec_sub_issue_no_type
 
     # add pr to sub_issue
     sub_issue_merged_pr = request.getfixturevalue("mock_pull_merged_with_rls_notes_102")  # nr:205
@@ -1162,7 +1169,7 @@ def record_with_hierarchy_issues(request):
     rec_sub_issue_no_type.register_pull_request(sub_issue_merged_pr)
 
     rec_bug_issue = SubIssueRecord(request.getfixturevalue("mock_closed_issue_type_bug"))  # nr:203
-    rec_feature_issue.sub_issues[rec_bug_issue.issue.number] = rec_bug_issue
+    rec_feature_issue.sub_issues[rec_bug_issue.snapshot.number] = rec_bug_issue
 
     # not description keyword used - registration simulate API way (relation)
     rec_task_issue.register_pull_request(request.getfixturevalue("mock_pull_closed_with_rls_notes_101"))
@@ -15,12 +15,13 @@
 #
 import pytest
 import time
+from dataclasses import replace
 from github import Github
 
 from release_notes_generator.builder.builder import ReleaseNotesBuilder
 from release_notes_generator.chapters.custom_chapters import CustomChapters
 from release_notes_generator.record.factory.default_record_factory import DefaultRecordFactory
-from tests.unit.conftest import mock_safe_call_decorator, MockLabel
+from tests.unit.conftest import mock_safe_call_decorator
 
 # pylint: disable=pointless-string-statement
 """
@@ -1081,8 +1082,7 @@ def test_build_closed_issue_with_more_custom_labels_duplicity_reduction_on(
 ):
     expected_release_notes = RELEASE_NOTES_DATA_CUSTOM_CHAPTERS_MORE_LABELS_DUPLICITY_REDUCTION_ON
     rec = record_with_issue_closed_two_pulls
-    rec.issue.labels.append(MockLabel("enhancement"))
-    rec.issue.title = "I1+bug-enhancement"
+    rec._snapshot = replace(rec.snapshot, title="I1+bug-enhancement", labels=rec.snapshot.labels + ("enhancement",))
     mocker.patch("release_notes_generator.builder.builder.ActionInputs.get_print_empty_chapters", return_value=False)
     mocker.patch("release_notes_generator.builder.builder.ActionInputs.get_hierarchy", return_value=hierarchy_value)
 
@@ -1223,7 +1223,7 @@ def test_build_reopened_issue(
 ):
     expected_release_notes = RELEASE_NOTES_NO_DATA_NO_WARNING_NO_EMPTY_CHAPTERS
     rec = record_with_issue_open_no_pull
-    rec.issue.state_reason = "reopened"
+    rec._snapshot = replace(rec.snapshot, state_reason="reopened")
     mocker.patch("release_notes_generator.builder.builder.ActionInputs.get_print_empty_chapters", return_value=False)
     mocker.patch("release_notes_generator.builder.builder.ActionInputs.get_hierarchy", return_value=hierarchy_value)
 
@@ -1244,7 +1244,7 @@ def test_build_closed_not_planned_issue(
 ):
     expected_release_notes = RELEASE_NOTES_DATA_SERVICE_CHAPTERS_CLOSED_ISSUE_NO_PR_NO_USER_LABELS
     rec = record_with_issue_closed_no_pull
-    rec.issue.state_reason = "not_planned"
+    rec._snapshot = replace(rec.snapshot, state_reason="not_planned")
     mocker.patch("release_notes_generator.builder.builder.ActionInputs.get_print_empty_chapters", return_value=False)
     mocker.patch("release_notes_generator.builder.builder.ActionInputs.get_hierarchy", return_value=hierarchy_value)
 
@@ -1287,7 +1287,7 @@ def test_build_closed_issue_with_prs_without_user_label(
     expected_release_notes = RELEASE_NOTES_DATA_CLOSED_ISSUE_WITH_PR_WITHOUT_USER_LABELS
     rec = record_with_issue_closed_two_pulls
     rec._labels = {"label1", "label2"}
-    rec.issue.title = "I1"
+    rec._snapshot = replace(rec.snapshot, title="I1")
     mocker.patch("release_notes_generator.builder.builder.ActionInputs.get_print_empty_chapters", return_value=False)
     mocker.patch("release_notes_generator.builder.builder.ActionInputs.get_hierarchy", return_value=hierarchy_value)
 
@@ -1368,7 +1368,7 @@ def test_build_closed_pr_without_issue_non_draft(
 ):
     expected_release_notes = RELEASE_NOTES_DATA_SERVICE_CHAPTERS_CLOSED_PR_NO_ISSUE_NO_USER_LABELS
     rec = pull_request_record_closed
-    rec.pull_request.draft = False
+    rec._snapshot = replace(rec.snapshot, draft=False)
     mocker.patch("release_notes_generator.builder.builder.ActionInputs.get_print_empty_chapters", return_value=False)
     mocker.patch("release_notes_generator.builder.builder.ActionInputs.get_hierarchy", return_value=hierarchy_value)
 
@@ -14,6 +14,8 @@
 #
 
 
+import tracemalloc
+from copy import deepcopy
 from unittest.mock import MagicMock
 from datetime import datetime, timedelta
 
@@ -33,6 +35,7 @@ def test_filter_no_release(mocker):
     data.since = datetime(2023, 1, 1)
     data.release = None
     data.compare_commit_shas = set()
+    data.mined_sub_issues = {}
     data.issues = [MagicMock(closed_at=None), MagicMock(closed_at=None)]
     data.pull_requests = [MagicMock(merged_at=None), MagicMock(merged_at=None)]
     data.commits = [MagicMock(commit=MagicMock(author=MagicMock(date=None)))]
@@ -59,6 +62,7 @@ def test_filter_with_release(mocker):
     data.release = MagicMock()
     data.since = datetime(2023, 1, 1)
     data.compare_commit_shas = set()
+    data.mined_sub_issues = {}
 
     # Mock issues, pull requests, and commits
     data.issues = {
@@ -103,6 +107,7 @@ def test_filter_compare_mode_passes_prs_through():
     data.release = MagicMock()
     data.since = datetime(2026, 5, 14)
     data.compare_commit_shas = {"sha_abc"}
+    data.mined_sub_issues = {}
     data.issues = {}
     data.commits = {}
     old_pr = MagicMock()
@@ -123,6 +128,7 @@ def test_filter_compare_mode_passes_commits_through():
     data.release = MagicMock()
     data.since = datetime(2026, 5, 14)
     data.compare_commit_shas = {"sha_abc"}
+    data.mined_sub_issues = {}
     data.issues = {}
     data.pull_requests = {}
     old_commit = MagicMock()
@@ -141,6 +147,7 @@ def test_filter_compare_mode_passes_multiple_prs_and_commits():
     data.release = MagicMock()
     data.since = datetime(2026, 5, 14)
     data.compare_commit_shas = {"sha1", "sha2"}
+    data.mined_sub_issues = {}
     data.issues = {}
     old_date = datetime(2026, 5, 14) - timedelta(days=30)
     data.pull_requests = {
@@ -165,6 +172,7 @@ def test_filter_timestamp_mode_filters_old_prs():
     data.release = MagicMock()
     data.since = datetime(2026, 5, 14)
     data.compare_commit_shas = set()
+    data.mined_sub_issues = {}
     data.issues = {}
     data.commits = {}
     old_pr = MagicMock()
@@ -185,6 +193,7 @@ def test_filter_timestamp_mode_keeps_recent_prs():
     data.release = MagicMock()
     data.since = datetime(2026, 5, 14)
     data.compare_commit_shas = set()
+    data.mined_sub_issues = {}
     data.issues = {}
     data.commits = {}
     new_pr = MagicMock()
@@ -196,3 +205,44 @@ def test_filter_timestamp_mode_keeps_recent_prs():
     filtered = FilterByRelease().filter(data)
 
     assert new_pr in filtered.pull_requests
+
+
+class _HeavyGithubObject:
+    """Stand-in for a PyGithub object carrying its raw JSON payload."""
+
+    def __init__(self, number: int):
+        self.number = number
+        self.closed_at = None
+        self.raw_data = {"body": "x" * 2_000, "labels": [{"name": f"label-{i}"} for i in range(20)]}
+
+
+def _peak_allocated(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_filter_no_release_shares_objects_and_memory():
+    repo = MagicMock(spec=Repository)
+    repo.full_name = "org/repo"
+    data = MinedData(repo)
+    data.issues = {_HeavyGithubObject(i): repo for i in range(500)}
+    data.pull_requests = {_HeavyGithubObject(i): repo for i in range(500)}
+    data.commits = {_HeavyGithubObject(i): repo for i in range(500)}
+
+    filtered = FilterByRelease().filter(data)
+
+    # structural copy: new dicts sharing the same mined objects
+    assert filtered.issues == data.issues and filtered.issues is not data.issues
+    assert all(a is b for a, b in zip(filtered.pull_requests, data.pull_requests))
+    assert all(a is b for a, b in zip(filtered.commits, data.commits))
+
+    # memory benchmark: peak allocation of the first-release path vs. the former deep copy
+    peak_deepcopy = _peak_allocated(
+        lambda: [deepcopy(data.issues), deepcopy(data.pull_requests), deepcopy(data.commits)]
+    )
+    peak_filter = _peak_allocated(lambda: FilterByRelease().filter(data))
+    assert peak_filter * 20 < peak_deepcopy
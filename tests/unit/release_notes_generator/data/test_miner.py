@@ -14,10 +14,12 @@
 # limitations under the License.
 #
 from copy import deepcopy
+import json
+import time
 from types import SimpleNamespace
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from github import Github, GithubException
@@ -27,8 +29,13 @@ from github.Issue import Issue
 from github.PullRequest import PullRequest
 from github.Repository import Repository
 
+from release_notes_generator.data.filter import FilterByRelease
 from release_notes_generator.data.miner import DataMiner
 from release_notes_generator.data.utils.bulk_sub_issue_collector import BulkSubIssueCollector
+from release_notes_generator.data.utils.graphql_compare_preflight import ComparePreflight
+from release_notes_generator.data.utils.local_git_repository import LocalGitError
+from release_notes_generator.data.utils.mining_state import MiningState
+from release_notes_generator.data.utils.sub_issue_graph import SubIssueGraph
 from release_notes_generator.model.mined_data import MinedData
 from tests.unit.conftest import FakeRepo
 
@@ -52,6 +59,10 @@ class ChildBulkSubIssueCollector(BulkSubIssueCollector):
 
         return []
 
+    def scan_hierarchy(self, parent_ids: list[str], known: Optional[dict[str, list[str]]] = None) -> dict[str, list[str]]:
+        self.scan_sub_issues_for_parents(parent_ids)
+        return self.parents_sub_issues
+
 
 def _identity(fn):
     return fn
@@ -349,9 +360,92 @@ def test_scan_sub_issues_for_parents(mocker, mock_repo, mined_data_simple):
     assert {} == prs_of_fetched_cross_repo_issues
 
 
+def test_scan_sub_issues_for_parents_passes_known_sub_issues_to_collector(mocker):
+    miner = DataMiner(mocker.Mock(), mocker.Mock())
+    collector = mocker.Mock(spec=BulkSubIssueCollector)
+    collector.scan_hierarchy.return_value = {"org/repo#1": []}
+    mocker.patch.object(miner, "_make_bulk_sub_issue_collector", return_value=collector)
+    known = {"org/repo#1": []}
+
+    result = miner._scan_sub_issues_for_parents(["org/repo#1", "org/repo#5"], known=known)
+
+    assert result == {"org/repo#1": []}
+    collector.scan_hierarchy.assert_called_once_with(["org/repo#1", "org/repo#5"], known=known)
+    collector.scan_sub_issues_for_parents.assert_not_called()
+
+
+def test_scan_sub_issues_for_parents_reuses_unchanged_part_of_stored_graph(mocker, tmp_path):
+    graph_file = str(tmp_path / "graph.json")
+    SubIssueGraph(
+        children={"org/repo#1": ["org/repo#2", "org/repo#3"], "org/repo#2": [], "org/repo#3": ["org/repo#4"]},
+        updated_at={"org/repo#1": "T1", "org/repo#2": "T2", "org/repo#3": "T3"},
+    ).save(graph_file)
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_sub_issue_graph_file", return_value=graph_file)
+    fetcher = mocker.patch("release_notes_generator.data.miner.GraphQLIssueFetcher")
+    fetcher.return_value.fetch_updated_at.return_value = {"org/repo#1": "T1", "org/repo#2": "T2", "org/repo#3": "T3-new"}
+    collector = mocker.Mock(spec=BulkSubIssueCollector)
+    collector.updated_at = {"org/repo#3": "T3-new", "org/repo#5": "T5"}
+    collector.scan_hierarchy.return_value = {
+        "org/repo#1": ["org/repo#2", "org/repo#3"],
+        "org/repo#2": [],
+        "org/repo#3": ["org/repo#5"],
+        "org/repo#5": [],
+    }
+    miner = DataMiner(mocker.Mock(), mocker.Mock())
+    mocker.patch.object(miner, "_make_bulk_sub_issue_collector", return_value=collector)
+
+    result = miner._scan_sub_issues_for_parents(["org/repo#1"], known={})
+
+    fetcher.return_value.fetch_updated_at.assert_called_once_with(["org/repo#1", "org/repo#2", "org/repo#3"])
+    # the updated org/repo#3 is scanned again, its unchanged parent and sibling are reused
+    collector.scan_hierarchy.assert_called_once_with(
+        ["org/repo#1"], known={"org/repo#1": ["org/repo#2", "org/repo#3"], "org/repo#2": []}
+    )
+    assert SubIssueGraph.load(graph_file) == SubIssueGraph(
+        children=result,
+        updated_at={"org/repo#1": "T1", "org/repo#2": "T2", "org/repo#3": "T3-new", "org/repo#5": "T5"},
+    )
+
+
+def test_get_issues_mined_via_graphql(mocker, mock_repo):
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_published_at", return_value=False)
+    since = datetime(2024, 6, 1)
+    graphql_miner = mocker.Mock(sub_issues={"org/repo#1": []})
+    graphql_miner.mine.return_value = [mocker.Mock(spec=Issue, number=1)]
+    mocker.patch("release_notes_generator.data.miner.GraphQLIssueMiner", return_value=graphql_miner)
+    miner = DataMiner(mocker.Mock(), mocker.Mock())
+    data = MinedData(mock_repo)
+    data.release = mocker.Mock(spec=GitRelease, created_at=since)
+
+    miner._get_issues(data)
+
+    graphql_miner.mine.assert_called_once_with("org", "repo", since, with_open=True)
+    assert [i.number for i in data.issues] == [1]
+    assert data.mined_sub_issues == {"org/repo#1": []}
+    mock_repo.get_issues.assert_not_called()
+
+
+def test_get_issues_falls_back_to_rest_when_graphql_fails(mocker, mock_repo):
+    graphql_miner = mocker.Mock()
+    graphql_miner.mine.side_effect = GithubException(502, "Bad gateway", None)
+    mocker.patch("release_notes_generator.data.miner.GraphQLIssueMiner", return_value=graphql_miner)
+    mock_repo.get_issues.return_value = [mocker.Mock(spec=Issue, number=7)]
+    miner = DataMiner(mocker.Mock(), mocker.Mock())
+    miner._safe_call = decorator_mock
+    data = MinedData(mock_repo)
+
+    miner._get_issues(data)
+
+    assert [i.number for i in data.issues] == [7]
+    assert data.mined_sub_issues == {}
+    mock_repo.get_issues.assert_called_once()
+
+
 def test_fetch_all_repositories_in_cache(mocker, mock_repo, mined_data_simple):
     gh = mocker.Mock()
     gh.get_repo.return_value = mock_repo
+    gh.requester.base_url = "https://api.github.com"
+    fetch = mocker.patch.object(DataMiner, "_fetch_repository", side_effect=fake_fetch_repository)
 
     # miner setup
     miner = DataMiner(gh, mocker.Mock())
@@ -366,21 +460,71 @@ def test_fetch_all_repositories_in_cache(mocker, mock_repo, mined_data_simple):
     mocker.patch.object(miner, "_fetch_missing_issues", return_value={})
     mocker.patch.object(miner, "_fetch_prs_for_fetched_cross_issues", return_value={})
 
-    mocker.patch.object(miner, "_fetch_repository", side_effect=fake_fetch_repository)
-
     fetched_issues, prs_of_fetched_cross_repo_issues = miner.mine_missing_sub_issues(mined_data_simple)
 
-    assert 4 == len(mined_data_simple._repositories.keys())
+    # the repositories of the hierarchy are registered lazily, without an existence check
+    assert 5 == len(mined_data_simple._repositories.keys())
     assert "org/repo" in mined_data_simple._repositories
     assert "org_1/another_repo" in mined_data_simple._repositories
     assert "org_2/another_repo" in mined_data_simple._repositories
     assert "org_3/another_repo" in mined_data_simple._repositories
+    assert "o/r" in mined_data_simple._repositories
+    fetch.assert_not_called()
 
     # No additional calls to get_issues
     assert {} == fetched_issues
     assert {} == prs_of_fetched_cross_repo_issues
 
 
+def test_repository_is_fetched_once_per_run(mocker, mock_repo):
+    gh = mocker.Mock()
+    gh.requester.base_url = "https://api.github.com"
+    gh.get_repo.side_effect = lambda full_name: mock_repo if full_name == "org/repo" else None
+    mock_repo.get_issues.return_value = []
+    mock_repo.get_pulls.return_value = []
+    mock_repo.get_commits.return_value = []
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_github_repository", return_value="org/repo")
+    miner = DataMiner(gh, mocker.Mock())
+    miner._safe_call = lambda f: f
+    mocker.patch.object(miner, "get_latest_release", return_value=None)
+
+    assert miner.check_repository_exists()
+    data = miner.mine_data()
+    data.parents_sub_issues = {"org/repo#1": ["gone/repo#2"], "org/repo#3": ["gone/repo#4"]}
+    miner._fetch_all_repositories_in_cache(data)
+    miner._fetch_all_repositories_in_cache(data)
+
+    # only the home repository is checked, the hierarchy ones are built lazily
+    assert [c.args[0] for c in gh.get_repo.call_args_list] == ["org/repo"]
+    assert data.home_repository is mock_repo
+    assert data.get_repository("gone/repo").url == "https://api.github.com/repos/gone/repo"
+
+
+def test_fetch_all_repositories_in_cache_builds_hierarchy_repositories_lazily(mocker, mock_repo):
+    gh = mocker.Mock()
+    gh.requester.base_url = "https://api.github.com"
+    miner = DataMiner(gh, mocker.Mock())
+    miner._safe_call = lambda f: f
+
+    data = MinedData(mock_repo)
+    # 50 repositories across 5 organizations, each referenced by several parents and sub-issues
+    data.parents_sub_issues = {
+        f"org{n % 5}/repo{n}#{i}": [f"org{(n + 1) % 5}/repo{(n + 1) % 50}#{i}", "org/repo#1"]
+        for n in range(50)
+        for i in range(3)
+    }
+
+    miner._fetch_all_repositories_in_cache(data)
+
+    gh.get_repo.assert_not_called()
+    gh.requester.requestJsonAndCheck.assert_not_called()
+    repository = data.get_repository("org3/repo8")
+    assert (repository.full_name, repository.owner.login, repository.name) == ("org3/repo8", "org3", "repo8")
+    assert repository.url == "https://api.github.com/repos/org3/repo8"
+    assert data.get_repository("org/repo") is mock_repo
+    assert miner.get_repository("org3/repo8") is repository
+
+
 def test_fetch_missing_issues(mocker, mock_repo, mined_data_simple, mock_issue_closed_i1_bug):
     def fake_get_issue(num):
         if num == 1:
@@ -473,6 +617,32 @@ def test_fetch_missing_issues_no_fetch(mocker, mock_repo, mined_data_simple, moc
     assert {} == prs_of_fetched_cross_repo_issues
 
 
+def test_fetch_missing_issues_uses_batched_graphql_fetch(mocker, mock_repo, mined_data_simple, mock_issue_closed_i1_bug):
+    gh = mocker.Mock()
+    miner = DataMiner(gh, mocker.Mock())
+    miner._safe_call = lambda f: f
+    mock_repo.get_issue.return_value = deepcopy(mock_issue_closed_i1_bug)
+
+    not_closed = deepcopy(mock_issue_closed_i1_bug)
+    not_closed.closed_at = None
+    fetcher = mocker.patch("release_notes_generator.data.miner.GraphQLIssueFetcher")
+    # issue 3 is in a failed batch and is left to the REST fetch
+    fetcher.return_value.fetch.return_value = {"org/repo#1": mock_issue_closed_i1_bug, "org/repo#2": not_closed}
+    mined_data_simple.parents_sub_issues = {
+        "org/repo#1": ["org/repo#2", "org/repo#3"],
+        "org/repo#2": [],
+        "org/repo#3": [],
+    }
+    mined_data_simple.since = datetime(2020, 1, 1)
+
+    fetched_issues = miner._fetch_missing_issues(mined_data_simple)
+
+    assert sorted(fetcher.return_value.fetch.call_args.args[0]) == ["org/repo#1", "org/repo#2", "org/repo#3"]
+    mock_repo.get_issue.assert_called_once_with(3)
+    assert len(fetched_issues) == 2
+    assert "org/repo#2" not in mined_data_simple.parents_sub_issues  # open issue is removed as REST fetch would
+
+
 def test_fetch_prs_for_fetched_cross_issues(mocker, mock_repo):
     # Miner with safe_call bypassed
     gh = mocker.Mock()
@@ -522,6 +692,27 @@ def test_fetch_prs_for_fetched_cross_issues(mocker, mock_repo):
     warn_mock.assert_called_once()
 
 
+def test_fetch_prs_for_fetched_cross_issues_uses_batched_timeline_query(mocker, mock_repo):
+    miner = DataMiner(mocker.Mock(), mocker.Mock())
+    pr_obj = mocker.Mock(spec=PullRequest)
+    fetcher = mocker.patch("release_notes_generator.data.miner.GraphQLIssueFetcher")
+    # issue 11 is not resolved by the batched query and its REST timeline is read
+    fetcher.return_value.fetch_cross_referencing_pulls.return_value = {"org/repo#10": [pr_obj]}
+
+    issue_resolved = mocker.Mock(spec=Issue)
+    issue_resolved.number = 10
+    issue_left = mocker.Mock(spec=Issue)
+    issue_left.number = 11
+    issue_left.get_timeline.return_value = []
+
+    result = miner._fetch_prs_for_fetched_cross_issues({issue_resolved: mock_repo, issue_left: mock_repo})
+
+    assert result == {"org/repo#10": [pr_obj], "org/repo#11": []}
+    fetcher.return_value.fetch_cross_referencing_pulls.assert_called_once_with(["org/repo#10", "org/repo#11"])
+    issue_resolved.get_timeline.assert_not_called()
+    issue_left.get_timeline.assert_called_once()
+
+
 # --- _extract_pr_numbers_from_commits ---
 
 
@@ -574,13 +765,16 @@ def test_extract_pr_numbers_multiline_message(mocker):
 
 def _make_compare_miner(mocker, mock_repo, *, from_tag="v2.6.3", to_tag="v2.6.4",
                         created_at=datetime(2026, 5, 7), published_at=None, prefer_published=False,
-                        compare_commits=None, get_pull_side_effect=None, total_commits=None):
+                        compare_commits=None, get_pull_side_effect=None, total_commits=None, local_path=""):
     """Wire a DataMiner for compare-mode mine_data calls."""
     mocker.patch("release_notes_generator.action_inputs.ActionInputs.is_from_tag_name_defined", return_value=True)
     mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_from_tag_name", return_value=from_tag)
     mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_tag_name", return_value=to_tag)
     mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_github_repository", return_value="org/repo")
     mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_published_at", return_value=prefer_published)
+    mocker.patch(
+        "release_notes_generator.action_inputs.ActionInputs.get_local_repository_path", return_value=local_path
+    )
 
     release_mock = mocker.Mock(spec=GitRelease)
     release_mock.created_at = created_at
@@ -622,6 +816,87 @@ def test_mine_data_compare_mode_uses_compare_api(mocker, mock_repo):
     assert data.compare_commit_shas == {"abc123"}
 
 
+def test_mine_data_compare_mode_uses_single_preflight_query(mocker, mock_repo):
+    release_mock = mocker.Mock(spec=GitRelease)
+    release_mock.created_at = datetime(2026, 5, 1)
+    release_mock.published_at = None
+    release_mock.tag_name = "v2.6.3"
+    preflight = mocker.patch("release_notes_generator.data.miner.GraphQLComparePreflight")
+    preflight.return_value.run.return_value = ComparePreflight(
+        mock_repo, {"v2.6.3": "sha-from", "v2.6.4": "sha-to"}, release_mock
+    )
+
+    miner = _make_compare_miner(mocker, mock_repo)
+    assert miner.check_repository_exists()
+    data = miner.mine_data()
+
+    preflight.return_value.run.assert_called_once_with("org/repo", "v2.6.3", "v2.6.4")
+    miner.github_instance.get_repo.assert_not_called()
+    mock_repo.get_release.assert_not_called()
+    mock_repo.get_git_ref.assert_not_called()
+    mock_repo.compare.assert_called_once_with("v2.6.3", "v2.6.4")
+    assert data.release is release_mock
+    assert data.since == datetime(2026, 5, 1)
+
+
+def test_mine_data_compare_mode_preflight_exits_on_missing_tag(mocker, mock_repo):
+    preflight = mocker.patch("release_notes_generator.data.miner.GraphQLComparePreflight")
+    preflight.return_value.run.return_value = ComparePreflight(
+        mock_repo, {"v2.6.3": "sha-from", "v2.6.4": None}, mocker.Mock(spec=GitRelease)
+    )
+
+    miner = _make_compare_miner(mocker, mock_repo)
+    with pytest.raises(SystemExit):
+        miner.mine_data()
+
+    mock_repo.compare.assert_not_called()
+
+
+def test_check_repository_exists_compare_mode_preflight_not_found(mocker, mock_repo):
+    preflight = mocker.patch("release_notes_generator.data.miner.GraphQLComparePreflight")
+    preflight.return_value.run.return_value = ComparePreflight(repository=None)
+
+    miner = _make_compare_miner(mocker, mock_repo)
+
+    assert not miner.check_repository_exists()
+    miner.github_instance.get_repo.assert_not_called()
+
+
+def test_mine_data_compare_mode_reads_local_clone(mocker, mock_repo):
+    local_commit = mocker.Mock()
+    local_commit.sha = "local1"
+    local_commit.commit.message = "Direct push"
+    local_repo = mocker.patch("release_notes_generator.data.miner.LocalGitRepository")
+    local_repo.return_value.commits_between.return_value = [local_commit]
+    local_repo.return_value.link_author_logins.side_effect = lambda commits: commits
+
+    miner = _make_compare_miner(mocker, mock_repo, local_path="/work/repo")
+    data = miner.mine_data()
+
+    assert local_repo.call_args.args[0] == "/work/repo"
+    local_repo.return_value.commits_between.assert_called_once_with("v2.6.3", "v2.6.4")
+    mock_repo.compare.assert_not_called()
+    mock_repo.get_git_ref.assert_not_called()
+    assert data.compare_commit_shas == {"local1"}
+    assert list(data.commits) == [local_commit]
+    # only the direct commits, which end up in the notes, have their authors linked
+    local_repo.return_value.link_author_logins.assert_called_once_with([local_commit])
+
+
+def test_mine_data_compare_mode_falls_back_to_compare_api(mocker, mock_repo):
+    commit_mock = mocker.Mock()
+    commit_mock.sha = "abc123"
+    commit_mock.commit.message = "Bump version"
+    local_repo = mocker.patch("release_notes_generator.data.miner.LocalGitRepository")
+    local_repo.return_value.commits_between.side_effect = LocalGitError("shallow clone")
+
+    miner = _make_compare_miner(mocker, mock_repo, compare_commits=[commit_mock], local_path="/work/repo")
+    data = miner.mine_data()
+
+    mock_repo.compare.assert_called_once_with("v2.6.3", "v2.6.4")
+    assert data.compare_commit_shas == {"abc123"}
+
+
 def test_mine_data_compare_mode_fetches_prs_by_number(mocker, mock_repo):
     commit_mock = mocker.Mock()
     commit_mock.sha = "abc123"
@@ -655,6 +930,32 @@ def test_mine_data_compare_mode_multiple_prs(mocker, mock_repo):
     assert len(data.pull_requests) == 2
 
 
+def test_mine_data_compare_mode_resolves_prs_via_graphql(mocker, mock_repo):
+    rebased_1, rebased_2, direct, referenced = mocker.Mock(), mocker.Mock(), mocker.Mock(), mocker.Mock()
+    rebased_1.sha, rebased_2.sha, direct.sha, referenced.sha = "sha1", "sha2", "sha3", "sha4"
+    rebased_1.commit.message = "Add parser"  # rebase merge of PR 10, no reference in the subject
+    rebased_2.commit.message = "Edited subject"
+    direct.commit.message = "Direct push"
+    referenced.commit.message = "Port fix (#30)"  # resolution failed, the subject is used
+    pr10 = mocker.Mock(spec=PullRequest)
+    pr10.number = 10
+    pr30 = mocker.Mock(spec=PullRequest)
+    pr30.number = 30
+    resolver = mocker.patch("release_notes_generator.data.miner.GraphQLCommitPullResolver")
+    resolver.return_value.resolve.return_value = {"sha1": [pr10], "sha2": [pr10], "sha3": []}
+
+    miner = _make_compare_miner(mocker, mock_repo, compare_commits=[rebased_1, rebased_2, direct, referenced],
+                                get_pull_side_effect=lambda n: pr30 if n == 30 else None)
+    data = miner.mine_data()
+
+    resolver.return_value.resolve.assert_called_once_with(
+        "org", "repo", ["sha1", "sha2", "sha3", "sha4"], base_ref=data.home_repository.default_branch
+    )
+    mock_repo.get_pull.assert_called_once_with(30)
+    assert list(data.pull_requests) == [pr10, pr30]
+    assert list(data.commits) == [direct]
+
+
 def test_mine_data_compare_mode_leaves_issues_empty(mocker, mock_repo):
     miner = _make_compare_miner(mocker, mock_repo, compare_commits=[])
     data = miner.mine_data()
@@ -770,6 +1071,36 @@ def test_mine_data_timestamp_mode_uses_get_commits(mocker, mock_repo):
     mock_repo.compare.assert_not_called()
 
 
+@pytest.mark.parametrize("local_result", [[], LocalGitError("shallow clone")])
+def test_mine_data_timestamp_mode_reads_commits_from_local_clone(mocker, mock_repo, local_result):
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.is_from_tag_name_defined", return_value=False)
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_github_repository", return_value="org/repo")
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_local_repository_path", return_value="/work")
+    local_repo = mocker.patch("release_notes_generator.data.miner.LocalGitRepository")
+    if isinstance(local_result, Exception):
+        local_repo.return_value.commits_since.side_effect = local_result
+    else:
+        local_repo.return_value.commits_since.return_value = local_result
+    local_repo.return_value.link_author_logins.side_effect = lambda commits: commits
+    mock_repo.default_branch = "main"
+    mock_repo.get_issues.return_value = []
+    mock_repo.get_pulls.return_value = []
+    mock_repo.get_commits.return_value = []
+
+    github_mock = mocker.Mock(spec=Github)
+    github_mock.get_repo.return_value = mock_repo
+
+    miner = DataMiner(github_mock, mocker.Mock())
+    miner._safe_call = decorator_mock
+    mocker.patch.object(miner, "get_latest_release", return_value=None)
+
+    miner.mine_data()
+
+    local_repo.return_value.commits_since.assert_called_once_with("main", None, None)
+    # an empty history is a valid answer, only a failure falls back to the API listing
+    assert mock_repo.get_commits.called == isinstance(local_result, Exception)
+
+
 def test_mine_data_timestamp_mode_compare_shas_empty(mocker, mock_repo):
     mocker.patch("release_notes_generator.action_inputs.ActionInputs.is_from_tag_name_defined", return_value=False)
     mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_github_repository", return_value="org/repo")
@@ -789,6 +1120,104 @@ def test_mine_data_timestamp_mode_compare_shas_empty(mocker, mock_repo):
     assert data.compare_commit_shas == set()
 
 
+
+def test_mine_data_timestamp_mode_stops_pulls_pagination_at_release(mocker, mock_repo):
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.is_from_tag_name_defined", return_value=False)
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_github_repository", return_value="org/repo")
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_published_at", return_value=False)
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_hierarchy", return_value=False)
+    since = datetime(2024, 6, 1)
+    release = mocker.Mock(spec=GitRelease, created_at=since, published_at=since)
+
+    def make_pull(number, updated_at, merged_at=None, closed_at=None):
+        return mocker.Mock(
+            spec=PullRequest, number=number, updated_at=updated_at, merged_at=merged_at, closed_at=closed_at
+        )
+
+    # sorted by `updated` descending, as requested from the API
+    pulls = [
+        make_pull(5, datetime(2024, 6, 10), merged_at=datetime(2024, 6, 9), closed_at=datetime(2024, 6, 9)),
+        make_pull(4, datetime(2024, 6, 5), closed_at=datetime(2024, 5, 1)),  # updated only, closed before
+        make_pull(3, datetime(2024, 6, 2), merged_at=datetime(2024, 6, 2), closed_at=datetime(2024, 6, 2)),
+        make_pull(2, datetime(2024, 5, 20), merged_at=datetime(2024, 5, 20), closed_at=datetime(2024, 5, 20)),
+        make_pull(1, datetime(2024, 1, 1), merged_at=datetime(2024, 1, 1), closed_at=datetime(2024, 1, 1)),
+    ]
+    consumed = []
+
+    def paginated(**_kwargs):
+        for pull in pulls:
+            consumed.append(pull.number)
+            yield pull
+
+    mock_repo.get_issues.return_value = []
+    mock_repo.get_commits.return_value = []
+    mock_repo.get_pulls.side_effect = paginated
+
+    github_mock = mocker.Mock(spec=Github)
+    github_mock.get_repo.return_value = mock_repo
+    miner = DataMiner(github_mock, mocker.Mock())
+    miner._safe_call = decorator_mock
+    mocker.patch.object(miner, "get_latest_release", return_value=release)
+
+    data = miner.mine_data()
+
+    assert mock_repo.get_pulls.call_args.kwargs["sort"] == "updated"
+    assert mock_repo.get_pulls.call_args.kwargs["direction"] == "desc"
+    assert consumed == [5, 4, 3, 2]  # iteration stopped at the first PR updated before the release
+    assert [p.number for p in data.pull_requests] == [5, 4, 3]
+
+    # the filtered result matches filtering of the full listing
+    full = MinedData(mock_repo)
+    full.release = release
+    full.since = since
+    full.pull_requests = {p: mock_repo for p in pulls}
+    filtered_full = FilterByRelease().filter(full)
+    filtered_bounded = FilterByRelease().filter(data)
+    assert [p.number for p in filtered_bounded.pull_requests] == [p.number for p in filtered_full.pull_requests]
+
+def test_mine_data_timestamp_mode_runs_listings_concurrently(mocker, mock_repo, caplog):
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.is_from_tag_name_defined", return_value=False)
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_github_repository", return_value="org/repo")
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_published_at", return_value=False)
+    since = datetime(2024, 6, 1)
+    release = mocker.Mock(spec=GitRelease, created_at=since, published_at=since)
+
+    def slow_listing(result):
+        def listing(**_kwargs):
+            time.sleep(0.2)
+            return result
+
+        return listing
+
+    issue = mocker.Mock(spec=Issue, number=1, html_url="https://github.com/org/repo/issues/1")
+    commit = mocker.Mock(spec=Commit, sha="abc")
+    pull = mocker.Mock(spec=PullRequest, number=2, updated_at=datetime(2024, 6, 2))
+    mock_repo.get_issues.side_effect = slow_listing([issue])
+    mock_repo.get_pulls.side_effect = slow_listing([pull])
+    mock_repo.get_commits.side_effect = slow_listing([commit])
+
+    github_mock = mocker.Mock(spec=Github)
+    github_mock.get_repo.return_value = mock_repo
+    miner = DataMiner(github_mock, mocker.Mock())
+    miner._safe_call = decorator_mock
+    mocker.patch.object(miner, "get_latest_release", return_value=release)
+    mocker.patch.object(miner, "_mine_issues_via_graphql", return_value=None)
+
+    caplog.set_level("INFO", logger="release_notes_generator.data.miner")
+    started = time.perf_counter()
+    data = miner.mine_data()
+    elapsed = time.perf_counter() - started
+
+    # two issue listings, the PR listing and the commit listing run at the same time instead of 0.8s in a row
+    assert elapsed < 0.6
+    assert mock_repo.get_issues.call_count == 2
+    assert list(data.issues) == [issue]
+    assert list(data.pull_requests) == [pull]
+    assert list(data.commits) == [commit]
+    assert "Since-time listings finished in" in caplog.text
+    assert "Issue listings finished in" in caplog.text
+
+
 # --- compare mode tag-ref existence validation ---
 
 
@@ -871,3 +1300,218 @@ def test_mine_data_compare_mode_network_error_on_tag_validation_exits(mocker, mo
     logged_messages = " ".join(str(call) for call in error_mock.call_args_list)
     assert "Connection timed out" in logged_messages
     mock_repo.compare.assert_not_called()
+
+
+# --- incremental mining from the persisted state ---
+
+
+class _FakeGithubServer:
+    """In-memory listings of a repository, answering like the REST API."""
+
+    def __init__(self, mocker):
+        self.requester = mocker.Mock(base_url="https://api.github.com")
+        self.issues: dict[int, dict] = {}
+        self.pulls: dict[int, dict] = {}
+        self.commits: list[dict] = []  # oldest first
+        self.calls: list[str] = []
+
+    @staticmethod
+    def _ts(value: datetime) -> str:
+        return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def add_issue(self, number: int, state: str, updated_at: datetime, title: str = "") -> None:
+        self.issues[number] = {
+            "number": number,
+            "title": title or f"Issue {number}",
+            "state": state,
+            "updated_at": self._ts(updated_at),
+            "url": f"https://api.github.com/repos/org/repo/issues/{number}",
+            "html_url": f"https://github.com/org/repo/issues/{number}",
+        }
+
+    def add_pull(self, number: int, state: str, updated_at: datetime, base: str = "main") -> None:
+        self.pulls[number] = {
+            "number": number,
+            "state": state,
+            "updated_at": self._ts(updated_at),
+            "base": {"ref": base},
+            "url": f"https://api.github.com/repos/org/repo/pulls/{number}",
+            "html_url": f"https://github.com/org/repo/pull/{number}",
+        }
+
+    def add_commit(self, sha: str, date: datetime) -> None:
+        self.commits.append(
+            {
+                "sha": sha,
+                "url": f"https://api.github.com/repos/org/repo/commits/{sha}",
+                "commit": {
+                    "message": sha,
+                    "author": {"date": self._ts(date)},
+                    "committer": {"date": self._ts(date)},
+                },
+            }
+        )
+
+    def get_issues(self, state: str, since: Optional[datetime] = None):
+        self.calls.append(f"issues:{state}:{since is not None}")
+        return [
+            Issue(self.requester, {}, raw, completed=False)
+            for raw in sorted(self.issues.values(), key=lambda r: r["number"], reverse=True)
+            if (state == "all" or raw["state"] == state) and (since is None or raw["updated_at"] >= self._ts(since))
+        ]
+
+    def get_pulls(self, state: str, sort: str, direction: str, base: Optional[str] = None):
+        self.calls.append(f"pulls:{state}")
+        for raw in sorted(self.pulls.values(), key=lambda r: r["updated_at"], reverse=True):
+            if (state == "all" or raw["state"] == state) and (base is None or raw["base"]["ref"] == base):
+                yield PullRequest(self.requester, {}, raw, completed=False)
+
+    def get_commits(self, since: Optional[datetime] = None):
+        self.calls.append("commits")
+        return [
+            Commit(self.requester, {}, raw, completed=False)
+            for raw in reversed(self.commits)
+            if since is None or raw["commit"]["committer"]["date"] >= self._ts(since)
+        ]
+
+    def compare(self, base: str, head: str):
+        self.calls.append(f"compare:{base}...{head}")
+        shas = [raw["sha"] for raw in self.commits]
+        new = self.commits[shas.index(base) + 1 :] if base in shas else []
+        return SimpleNamespace(
+            status="ahead" if new else "identical",
+            commits=[Commit(self.requester, {}, raw, completed=False) for raw in new],
+        )
+
+
+def _make_state_miner(mocker, server: _FakeGithubServer, since: datetime, state_file: str) -> DataMiner:
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.is_from_tag_name_defined", return_value=False)
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_github_repository", return_value="org/repo")
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_published_at", return_value=False)
+    mocker.patch("release_notes_generator.action_inputs.ActionInputs.get_mining_state_file", return_value=state_file)
+    repo = mocker.Mock(spec=Repository, full_name="org/repo", default_branch="main")
+    for name in ("get_issues", "get_pulls", "get_commits", "compare"):
+        getattr(repo, name).side_effect = getattr(server, name)
+
+    github_mock = mocker.Mock(spec=Github)
+    github_mock.get_repo.return_value = repo
+    github_mock.requester = server.requester
+    miner = DataMiner(github_mock, mocker.Mock())
+    miner._safe_call = decorator_mock
+    release = mocker.Mock(spec=GitRelease, created_at=since, published_at=since, tag_name="v1.0.0")
+    mocker.patch.object(miner, "get_latest_release", return_value=release)
+    return miner
+
+
+def _numbers(data: MinedData) -> tuple[list[int], list[int], list[str]]:
+    return (
+        [i.number for i in data.issues],
+        [p.number for p in data.pull_requests],
+        [c.sha for c in data.commits],
+    )
+
+
+def test_mine_data_incremental_run_matches_cold_run(mocker, tmp_path):
+    since = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    old = datetime(2024, 6, 5, tzinfo=timezone.utc)
+    server = _FakeGithubServer(mocker)
+    server.add_issue(1, "closed", old)
+    server.add_issue(2, "open", datetime(2024, 1, 1, tzinfo=timezone.utc))  # long-lived open issue
+    server.add_issue(3, "closed", datetime(2024, 1, 1, tzinfo=timezone.utc))  # closed before release
+    server.add_pull(10, "closed", old)
+    server.add_pull(11, "closed", old + timedelta(hours=1))
+    server.add_commit("c0", datetime(2024, 5, 1, tzinfo=timezone.utc))
+    server.add_commit("c1", old)
+    state_file = str(tmp_path / "mining-state.json")
+
+    first = _make_state_miner(mocker, server, since, state_file).mine_data()
+    # issues updated since the release first, then the remaining open ones
+    assert _numbers(first) == ([1, 2], [11, 10], ["c1"])
+
+    # changes between the runs
+    now = datetime.now(timezone.utc)
+    server.add_issue(2, "closed", now, title="Closed now")
+    server.add_issue(4, "closed", now)
+    server.add_pull(11, "open", now)  # reopened
+    server.add_pull(12, "closed", now)
+    server.add_pull(13, "closed", now, base="develop")
+    server.add_commit("c2", now)
+    server.calls.clear()
+
+    incremental = _make_state_miner(mocker, server, since, state_file).mine_data()
+
+    assert sorted(server.calls) == ["compare:c1...main", "issues:all:True", "pulls:all"]
+    assert [i.title for i in incremental.issues if i.number == 2] == ["Closed now"]
+
+    cold = _make_state_miner(mocker, server, since, "").mine_data()
+    assert _numbers(incremental) == _numbers(cold) == ([4, 2, 1], [12, 10], ["c2", "c1"])
+
+    # the merged state becomes the base of the next run
+    server.calls.clear()
+    _make_state_miner(mocker, server, since, state_file).mine_data()
+    assert "compare:c2...main" in server.calls
+    assert now - timedelta(minutes=10) < datetime.fromisoformat(
+        json.loads(open(state_file, encoding="utf-8").read())["high_water_mark"]
+    )
+
+
+def test_incremental_mining_reads_updated_issues_via_graphql(mocker):
+    since = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    mark = datetime(2024, 6, 10, tzinfo=timezone.utc)
+    server = _FakeGithubServer(mocker)
+    for number in (1, 2):
+        server.add_issue(number, "open", datetime(2024, 6, 5, tzinfo=timezone.utc))
+    server.add_commit("c1", datetime(2024, 6, 5, tzinfo=timezone.utc))
+    # committed after the release, authored before it: FilterByRelease drops it, so the merge does too
+    server.commits.append(
+        {
+            "sha": "c2",
+            "url": "https://api.github.com/repos/org/repo/commits/c2",
+            "commit": {
+                "message": "c2",
+                "author": {"date": "2024-05-01T00:00:00Z"},
+                "committer": {"date": "2024-06-11T00:00:00Z"},
+            },
+        }
+    )
+    server.add_commit("c3", datetime(2024, 6, 11, tzinfo=timezone.utc))
+    state = MiningState(
+        repository="org/repo",
+        since=since,
+        high_water_mark=mark,
+        head_sha="c1",
+        issues=[dict(server.issues[1]), dict(server.issues[2])],
+        commits=[server.commits[0]],
+        sub_issues={"org/repo#1": ["org/repo#5"], "org/repo#2": ["org/repo#6"], "other/repo#9": []},
+    )
+    server.add_issue(2, "closed", datetime(2024, 6, 11, tzinfo=timezone.utc))
+    updated = Issue(server.requester, {}, server.issues[2], completed=False)
+    graphql_miner = mocker.Mock(sub_issues={"org/repo#2": ["org/repo#7"]})
+    graphql_miner.mine.return_value = [updated]
+    mocker.patch("release_notes_generator.data.miner.GraphQLIssueMiner", return_value=graphql_miner)
+    miner = _make_state_miner(mocker, server, since, "")
+    data = MinedData(miner.get_repository("org/repo"))
+    data.since = since
+
+    miner._handle_incremental_since_time_mode(data.home_repository, data, state)
+
+    graphql_miner.mine.assert_called_once_with("org", "repo", mark, with_open=False)
+    assert "issues:all:True" not in server.calls
+    assert _numbers(data) == ([2, 1], [], ["c3", "c1"])
+    # the updated parent takes the mined sub-issues, the other keeps the stored ones
+    assert data.mined_sub_issues == {"org/repo#1": ["org/repo#5"], "org/repo#2": ["org/repo#7"]}
+
+
+def test_mine_data_state_of_other_release_runs_full_mining(mocker, tmp_path):
+    server = _FakeGithubServer(mocker)
+    server.add_issue(1, "closed", datetime(2024, 6, 5, tzinfo=timezone.utc))
+    server.add_commit("c1", datetime(2024, 6, 5, tzinfo=timezone.utc))
+    state_file = str(tmp_path / "mining-state.json")
+    _make_state_miner(mocker, server, datetime(2024, 6, 1, tzinfo=timezone.utc), state_file).mine_data()
+    server.calls.clear()
+
+    data = _make_state_miner(mocker, server, datetime(2024, 5, 1, tzinfo=timezone.utc), state_file).mine_data()
+
+    assert "commits" in server.calls
+    assert not any(call.startswith("compare") for call in server.calls)
+    assert _numbers(data) == ([1], [], ["c1"])
@@ -15,18 +15,22 @@
 #
 
 import json
+import re
+import threading
 import pytest
 
 from release_notes_generator.data.utils.bulk_sub_issue_collector import (
     BulkSubIssueCollector,
     CollectorConfig,
 )
+from release_notes_generator.data.utils.sub_issue_query_planner import QueryTooLargeError
 
 
 class DummyResponse:
-    def __init__(self, data, status=200):
+    def __init__(self, data, status=200, headers=None):
         self._data = data
         self.status_code = status
+        self.headers = headers or {}
 
     def raise_for_status(self):
         if self.status_code >= 400:
@@ -147,6 +151,17 @@ def test_parent_with_children_and_new_parent_detection():
     assert "org/repo#2" not in col.parents_sub_issues or col.parents_sub_issues["org/repo#2"] in ([], [])
 
 
+def test_updated_at_of_read_issues_is_recorded():
+    parent = gql_parent_block(1, nodes=[dict(gql_child(2), updatedAt="T2"), gql_child(3)])
+    parent["updatedAt"] = "T1"
+    col, session = make_collector([DummyResponse(wrap_issue({"r0": {"i0_0": parent}}))])
+
+    col.scan_sub_issues_for_parents(["org/repo#1"])
+
+    assert col.updated_at == {"org/repo#1": "T1", "org/repo#2": "T2"}
+    assert "updatedAt" in json.loads(session.requests[0]["data"])["query"]
+
+
 def test_pagination_accumulates_children_and_uses_cursor():
     resp1 = wrap_issue(
         {
@@ -265,3 +280,217 @@ def test_graphql_errors_line_coverage(caplog):
             col.scan_sub_issues_for_parents(["org/repo#123"])
     assert "GraphQL errors" in str(ei.value)
     assert any("GraphQL errors" in r.message for r in caplog.records)
+
+
+def test_rate_limit_headers_are_forwarded_to_rate_limiter(mocker):
+    rate_limiter = mocker.Mock()
+    headers = {"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "1700000000"}
+    cfg = CollectorConfig(gentle_pacing_seconds=0.0)
+    session = DummySession([DummyResponse(wrap_issue({"r0": {"i0_0": gql_parent_block(1, [])}}), headers=headers)])
+    col = BulkSubIssueCollector(token="t", cfg=cfg, session=session, rate_limiter=rate_limiter)
+
+    col.scan_sub_issues_for_parents(["org/repo#1"])
+
+    rate_limiter.wait_if_needed.assert_called_once()
+    rate_limiter.update_from_headers.assert_called_once_with(headers)
+
+
+class CostReportingSession:
+    """Answers every query with childless parents, reports `cost` per parent and counts concurrent posts."""
+
+    def __init__(self, cost_per_parent=1, remaining=5000, delay=0.0, max_parents=None):
+        self.cost_per_parent = cost_per_parent
+        self.remaining = remaining
+        self.delay = delay
+        self.max_parents = max_parents
+        self.parents_per_query = []
+        self.refused = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def post(self, url, headers=None, data=None, verify=None, timeout=None):
+        query = json.loads(data)["query"]
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        threading.Event().wait(self.delay)  # time.sleep is patched out
+        with self._lock:
+            self.in_flight -= 1
+
+        answer = {}
+        parents = 0
+        for repo_alias, block in re.findall(r"(r\d+): repository\(.*?\) \{(.*?)\n \}", query, re.S):
+            answer[repo_alias] = {
+                alias: gql_parent_block(int(number), nodes=[])
+                for alias, number in re.findall(r"(i\d+_\d+): issue\(number: (\d+)\)", block)
+            }
+            parents += len(answer[repo_alias])
+        if self.max_parents is not None and parents > self.max_parents:
+            with self._lock:
+                self.refused += 1
+            return DummyResponse({"errors": [{"type": "MAX_NODE_LIMIT_EXCEEDED", "message": "Too many nodes"}]})
+        with self._lock:
+            self.parents_per_query.append(parents)
+        answer["rateLimit"] = {"cost": parents * self.cost_per_parent, "remaining": self.remaining}
+        return DummyResponse({"data": answer})
+
+
+def _parents(repos, per_repo):
+    return [f"org/repo{r}#{n}" for r in range(repos) for n in range(1, per_repo + 1)]
+
+
+def test_queries_run_concurrently():
+    session = CostReportingSession(cost_per_parent=50, delay=0.02)
+    cfg = CollectorConfig(gentle_pacing_seconds=0.0, max_workers=4, max_query_cost=2)
+    col = BulkSubIssueCollector(token="t", cfg=cfg, session=session)
+
+    assert col.scan_sub_issues_for_parents(_parents(repos=12, per_repo=2)) == []
+
+    assert set(col.parents_sub_issues) == set(_parents(repos=12, per_repo=2))
+    assert session.parents_per_query == [1] * 24  # one costly parent fills the query budget
+    assert 1 < session.max_in_flight <= 4
+
+
+def test_parents_per_query_follow_the_observed_cost():
+    session = CostReportingSession(cost_per_parent=3)
+    cfg = CollectorConfig(gentle_pacing_seconds=0.0, max_workers=1, max_query_cost=31, max_repos_per_request=40)
+    col = BulkSubIssueCollector(token="t", cfg=cfg, session=session)
+
+    col.scan_sub_issues_for_parents(_parents(repos=40, per_repo=3))
+
+    # the estimate packs 30 parents of ~1 point, then the observed 3 points per parent leave room for 10
+    assert session.parents_per_query == [30] + [10] * 9
+
+
+def test_low_remaining_points_shrink_the_queries():
+    session = CostReportingSession(cost_per_parent=1, remaining=17)
+    cfg = CollectorConfig(gentle_pacing_seconds=0.0, max_workers=2, max_query_cost=30, max_repos_per_request=40)
+    col = BulkSubIssueCollector(token="t", cfg=cfg, session=session)
+
+    col.scan_sub_issues_for_parents(_parents(repos=40, per_repo=3))
+
+    assert session.parents_per_query[:2] == [29, 29]  # planned before any cost was reported
+    assert max(session.parents_per_query[2:]) == 8  # 17 remaining points shared by 2 workers
+    assert sum(session.parents_per_query) == 120
+
+
+def test_query_over_node_limit_is_split():
+    session = CostReportingSession(max_parents=10)
+    cfg = CollectorConfig(gentle_pacing_seconds=0.0, max_workers=1, max_retries=3)
+    col = BulkSubIssueCollector(token="t", cfg=cfg, session=session)
+
+    col.scan_sub_issues_for_parents(_parents(repos=1, per_repo=30))
+
+    assert set(col.parents_sub_issues) == set(_parents(repos=1, per_repo=30))
+    assert session.refused == 2  # 29 and 14 parents, without retries
+    assert session.parents_per_query == [7, 7, 7, 7, 2]
+
+
+def test_single_parent_over_node_limit_raises():
+    session = CostReportingSession(max_parents=0)
+    col = BulkSubIssueCollector(token="t", cfg=CollectorConfig(gentle_pacing_seconds=0.0), session=session)
+
+    with pytest.raises(QueryTooLargeError):
+        col.scan_sub_issues_for_parents(["org/repo#1"])
+    assert session.refused == 1
+
+
+class HierarchySession:
+    """Answers the queries from a tree of issue ids, paging the sub-issues with offset cursors."""
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.queries = []
+        self.queried = []
+
+    def post(self, url, headers=None, data=None, verify=None, timeout=None):
+        query = json.loads(data)["query"]
+        self.queries.append(query)
+        answer = {}
+        for repo_alias, org, repo, block in re.findall(
+            r'(r\d+): repository\(owner: "(.*?)", name: "(.*?)"\) \{(.*?)\n \}', query, re.S
+        ):
+            answer[repo_alias] = {}
+            issue_pattern = r'(i\d+_\d+): issue\(number: (\d+)\).*?subIssues\(first: (\d+)(?:, after: "(\d+)")?'
+            for alias, number, first, after in re.findall(issue_pattern, block, re.S):
+                self.queried.append(f"{org}/{repo}#{number}")
+                children = self.tree.get(f"{org}/{repo}#{number}", [])
+                start = int(after or 0)
+                end = start + int(first)
+                nodes = []
+                for child_id in children[start:end]:
+                    child_org, rest = child_id.split("/")
+                    child_repo, child_num = rest.split("#")
+                    nodes.append(gql_child(int(child_num), child_org, child_repo, len(self.tree.get(child_id, []))))
+                answer[repo_alias][alias] = gql_parent_block(int(number), nodes, end < len(children), str(end))
+        return DummyResponse({"data": answer})
+
+
+def test_scan_hierarchy_resolves_known_parents_without_querying():
+    session = HierarchySession({"org/repo#5": [], "org2/repo#3": ["org2/repo#6"]})
+    col = BulkSubIssueCollector(token="t", cfg=CollectorConfig(gentle_pacing_seconds=0.0), session=session)
+    known = {
+        "org/repo#1": ["org/repo#2", "org2/repo#3"],  # #2 is a leaf, org2/repo#3 has own sub-issues
+        "org/repo#2": [],
+        "org/repo#4": [],
+    }
+
+    result = col.scan_hierarchy(["org/repo#1", "org/repo#4", "org/repo#5"], known=known)
+
+    # only the parent without known sub-issues and the child with own sub-issues reach the API
+    assert sorted(session.queried) == ["org/repo#5", "org2/repo#3"]
+    assert result == {
+        "org/repo#5": [],
+        "org/repo#1": ["org/repo#2", "org2/repo#3"],
+        "org/repo#2": [],
+        "org/repo#4": [],
+        "org2/repo#3": ["org2/repo#6"],
+        "org2/repo#6": [],
+    }
+
+
+def test_scan_hierarchy_overlaps_levels_in_shared_queries():
+    # epic #1 has two pages of children; its first page already reveals the sub-epic #2
+    tree = {
+        "org/repo#1": ["org/repo#2", "org/repo#3"],
+        "org/repo#2": ["org/repo#4"],
+        "org/repo#4": ["org/repo#5"],
+    }
+    session = HierarchySession(tree)
+    cfg = CollectorConfig(gentle_pacing_seconds=0.0, per_page=1, max_workers=1)
+    col = BulkSubIssueCollector(token="t", cfg=cfg, session=session)
+
+    result = col.scan_hierarchy(["org/repo#1"])
+
+    # the second page of #1 and the first page of #2 travel in one query
+    assert 'after: "1"' in session.queries[1] and "issue(number: 2)" in session.queries[1]
+    assert len(session.queries) == 3
+    assert result == {
+        "org/repo#1": ["org/repo#2", "org/repo#3"],
+        "org/repo#2": ["org/repo#4"],
+        "org/repo#3": [],
+        "org/repo#4": ["org/repo#5"],
+        "org/repo#5": [],
+    }
+
+
+def test_scan_hierarchy_matches_level_by_level_scan():
+    tree = {f"org/repo#{n}": [f"org/repo#{2 * n}", f"org/repo#{2 * n + 1}"] for n in range(1, 32)}
+    tree["org/repo#3"].append("other/repo#1")
+    tree["other/repo#1"] = ["other/repo#2"]
+    cfg = CollectorConfig(gentle_pacing_seconds=0.0, per_page=1)
+
+    level_col = BulkSubIssueCollector(token="t", cfg=cfg, session=HierarchySession(tree))
+    expected: dict[str, list[str]] = {}
+    parents = ["org/repo#1"]
+    while parents:
+        next_parents = level_col.scan_sub_issues_for_parents(parents)
+        expected.update(level_col.parents_sub_issues)
+        parents = next_parents
+
+    session = HierarchySession(tree)
+    result = BulkSubIssueCollector(token="t", cfg=cfg, session=session).scan_hierarchy(["org/repo#1"])
+
+    assert result == expected
+    assert len(result) == 65
@@ -0,0 +1,117 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+
+from github import GithubException
+
+from release_notes_generator.data.utils.graphql_commit_pull_resolver import GraphQLCommitPullResolver
+
+
+def _pull_node(number, state="MERGED", owner="org", repo="repo", base="main"):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "body": "Release Notes:\n- Note",
+        "state": state,
+        "url": f"https://github.com/{owner}/{repo}/pull/{number}",
+        "createdAt": "2024-06-01T10:00:00Z",
+        "updatedAt": "2024-06-02T10:00:00Z",
+        "closedAt": "2024-06-02T10:00:00Z",
+        "mergedAt": "2024-06-02T10:00:00Z",
+        "mergeCommit": {"oid": f"merge{number}"},
+        "baseRefName": base,
+        "repository": {"owner": {"login": owner}, "name": repo},
+        "author": {"login": "alice"},
+        "assignees": {"totalCount": 0, "nodes": []},
+        "labels": {"totalCount": 1, "nodes": [{"name": "bug"}]},
+    }
+
+
+def _answer(pulls_by_sha):
+    """Answer the aliased commit queries from the associated pull requests of each SHA."""
+
+    def graphql_query(query, variables):
+        assert variables["owner"] == "org" and variables["name"] == "repo"
+        assert "fragment PullRequestFields on PullRequest" in query
+        repository = {}
+        for alias, index in re.findall(r"(c(\d+)): object\(oid: \$oid\d+\)", query):
+            nodes = pulls_by_sha.get(variables[f"oid{index}"], [])
+            repository[alias] = {"associatedPullRequests": {"totalCount": len(nodes), "nodes": nodes}}
+        return {}, {"data": {"repository": repository}}
+
+    return graphql_query
+
+
+def test_resolve_batches_commits_and_keeps_merged_pulls_of_repository(mocker):
+    requester = mocker.Mock()
+    requester.base_url = "https://api.github.com"
+    requester.graphql_query.side_effect = _answer(
+        {
+            "sha1": [_pull_node(10)],
+            "sha2": [_pull_node(10)],  # rebase merge: every commit belongs to the same pull request
+            "sha3": [_pull_node(11, state="OPEN"), _pull_node(12, owner="fork")],
+        }
+    )
+    resolver = GraphQLCommitPullResolver(requester, batch_size=2)
+
+    resolved = resolver.resolve("org", "repo", ["sha1", "sha2", "sha3", "sha1"], base_ref="main")
+
+    assert resolver.queries_count == requester.graphql_query.call_count == 2
+    assert set(resolved) == {"sha1", "sha2", "sha3"}
+    assert resolved["sha3"] == []
+    pull = resolved["sha1"][0]
+    assert (pull.number, pull.state, pull.merge_commit_sha, pull.user.login) == (10, "closed", "merge10", "alice")
+    assert pull.base.ref == "main"
+    assert pull.body.startswith("Release Notes:")
+    assert [label.name for label in pull.labels] == ["bug"]
+
+
+def test_resolve_leaves_out_failed_batches_and_truncated_commits(mocker):
+    requester = mocker.Mock()
+    requester.base_url = "https://api.github.com"
+    answer = _answer({"sha1": [_pull_node(10)]})
+
+    def graphql_query(query, variables):
+        if variables["oid0"] == "sha2":
+            raise GithubException(502, {"message": "Bad gateway"}, None)
+        _, payload = answer(query, variables)
+        if variables["oid0"] == "sha3":  # more associated pull requests than one page
+            payload["data"]["repository"]["c0"]["associatedPullRequests"]["totalCount"] = 9
+        return {}, payload
+
+    requester.graphql_query.side_effect = graphql_query
+    resolver = GraphQLCommitPullResolver(requester, batch_size=1)
+
+    resolved = resolver.resolve("org", "repo", ["sha1", "sha2", "sha3"], base_ref="main")
+
+    assert list(resolved) == ["sha1"]
+    assert resolver.resolve("org", "repo", []) == {}
+
+
+def test_resolve_keeps_pulls_merged_into_base_or_by_a_compared_commit(mocker):
+    requester = mocker.Mock()
+    requester.base_url = "https://api.github.com"
+    # sha1 went through a feature branch (PR 20) before PR 10 merged it into main
+    into_feature = _pull_node(20, base="feature")
+    # PR 21 was merged into a release branch by sha2 itself
+    into_release = _pull_node(21, base="release/1.x")
+    into_release["mergeCommit"] = {"oid": "sha2"}
+    requester.graphql_query.side_effect = _answer({"sha1": [into_feature, _pull_node(10)], "sha2": [into_release]})
+
+    resolved = GraphQLCommitPullResolver(requester).resolve("org", "repo", ["sha1", "sha2"], base_ref="main")
+
+    assert [p.number for p in resolved["sha1"]] == [10]
+    assert [p.number for p in resolved["sha2"]] == [21]
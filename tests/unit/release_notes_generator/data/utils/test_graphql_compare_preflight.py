@@ -0,0 +1,96 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from datetime import datetime, timezone
+
+from github import GithubException, UnknownObjectException
+
+from release_notes_generator.data.utils.graphql_compare_preflight import GraphQLComparePreflight
+
+
+def _requester(mocker, repository=None, side_effect=None):
+    requester = mocker.Mock()
+    requester.base_url = "https://api.github.com"
+    requester.graphql_query.return_value = ({}, {"data": {"repository": repository}})
+    requester.graphql_query.side_effect = side_effect
+    return requester
+
+
+REPOSITORY = {
+    "databaseId": 7,
+    "name": "repo",
+    "nameWithOwner": "org/repo",
+    "owner": {"login": "org"},
+    "isPrivate": False,
+    "url": "https://github.com/org/repo",
+    "defaultBranchRef": {"name": "main"},
+    "fromRef": {"target": {"oid": "aaa"}},
+    "toRef": None,
+    "release": {
+        "databaseId": 11,
+        "tagName": "v1.0.0",
+        "name": "1.0.0",
+        "description": "notes",
+        "isDraft": False,
+        "isPrerelease": False,
+        "createdAt": "2026-05-01T10:00:00Z",
+        "publishedAt": "2026-05-02T10:00:00Z",
+        "url": "https://github.com/org/repo/releases/tag/v1.0.0",
+    },
+}
+
+
+def test_run_reads_repository_tags_and_release_in_one_query(mocker):
+    requester = _requester(mocker, REPOSITORY)
+
+    preflight = GraphQLComparePreflight(requester).run("org/repo", "v1.0.0", "v1.1.0")
+
+    requester.graphql_query.assert_called_once()
+    variables = requester.graphql_query.call_args.args[1]
+    assert (variables["fromRef"], variables["toRef"], variables["fromTag"]) == (
+        "refs/tags/v1.0.0",
+        "refs/tags/v1.1.0",
+        "v1.0.0",
+    )
+    assert preflight.tag_shas == {"v1.0.0": "aaa", "v1.1.0": None}
+    assert preflight.repository.full_name == "org/repo"
+    assert preflight.repository.default_branch == "main"
+    assert preflight.repository.url == "https://api.github.com/repos/org/repo"
+    assert preflight.release.tag_name == "v1.0.0"
+    assert preflight.release.published_at == datetime(2026, 5, 2, 10, tzinfo=timezone.utc)
+
+
+def test_run_reports_missing_repository_and_release(mocker):
+    not_found = _requester(mocker, side_effect=UnknownObjectException(404, {}, {}))
+    assert GraphQLComparePreflight(not_found).run("org/missing", "a", "b").repository is None
+
+    without_release = _requester(mocker, {**REPOSITORY, "release": None})
+    assert GraphQLComparePreflight(without_release).run("org/repo", "a", "b").release is None
+
+
+def test_run_reports_draft_release_as_missing(mocker):
+    draft = _requester(mocker, {**REPOSITORY, "release": {**REPOSITORY["release"], "isDraft": True}})
+
+    preflight = GraphQLComparePreflight(draft).run("org/repo", "v1.0.0", "v1.1.0")
+
+    # as `get_release(tag)`, which lists published releases only
+    assert preflight.release is None
+    assert preflight.repository.full_name == "org/repo"
+
+
+def test_run_returns_none_on_failure(mocker):
+    requester = _requester(mocker, side_effect=GithubException(502, "bad gateway", {}))
+
+    assert GraphQLComparePreflight(requester).run("org/repo", "a", "b") is None
@@ -0,0 +1,161 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+from datetime import datetime, timezone
+
+from github import GithubException, UnknownObjectException
+
+from release_notes_generator.data.utils.graphql_issue_fetcher import GraphQLIssueFetcher
+
+
+def _node(number):
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "Body",
+        "state": "CLOSED",
+        "stateReason": "COMPLETED",
+        "url": f"https://github.com/org/repo/issues/{number}",
+        "createdAt": "2024-06-01T10:00:00Z",
+        "updatedAt": "2024-06-02T10:00:00Z",
+        "closedAt": "2024-06-02T10:00:00Z",
+        "author": {"login": "alice"},
+        "assignees": {"totalCount": 0, "nodes": []},
+        "labels": {"totalCount": 1, "nodes": [{"name": "bug"}]},
+        "issueType": {"name": "Task"},
+    }
+
+
+def _answer(existing: set[tuple[str, str, int]]):
+    """Answer the aliased queries from the set of existing issues."""
+
+    def graphql_query(query, variables):
+        data = {}
+        repositories = re.findall(r"(r(\d+)): repository\(owner: \$owner\d+, name: \$name\d+\) \{ (.*?) \}\n", query)
+        for alias, index, issues in repositories:
+            owner, name = variables[f"owner{index}"], variables[f"name{index}"]
+            data[alias] = {}
+            for issue_alias, number in re.findall(r"(i(\d+)): issue\(number: \d+\)", issues):
+                key = (owner, name, int(number))
+                data[alias][issue_alias] = _node(int(number)) if key in existing else None
+        if any(node is None for issues in data.values() for node in issues.values()):
+            # GitHub reports every unresolved issue as a NOT_FOUND error
+            payload = {"data": data, "errors": [{"type": "NOT_FOUND", "message": "Could not resolve to an Issue"}]}
+            raise UnknownObjectException(404, payload, None)
+        return {}, {"data": data}
+
+    return graphql_query
+
+
+def test_fetch_groups_ids_into_batched_queries(mocker):
+    requester = mocker.Mock()
+    requester.base_url = "https://api.github.com"
+    existing = {("org", "repo", 1), ("org", "repo", 2), ("org", "repo", 3), ("org", "other", 7)}
+    requester.graphql_query.side_effect = _answer(existing)
+    fetcher = GraphQLIssueFetcher(requester, batch_size=3)
+
+    fetched = fetcher.fetch(["org/repo#1", "org/repo#2", "org/other#7", "org/repo#3", "org/repo#4"])
+
+    assert fetcher.queries_count == 2
+    assert requester.graphql_query.call_count == 2
+    assert set(fetched) == {"org/repo#1", "org/repo#2", "org/repo#3", "org/repo#4", "org/other#7"}
+    assert fetched["org/repo#4"] is None  # does not exist
+    issue = fetched["org/other#7"]
+    assert issue.number == 7
+    assert issue.closed_at == datetime(2024, 6, 2, 10, 0, tzinfo=timezone.utc)
+    assert [label.name for label in issue.labels] == ["bug"]
+    assert issue.repository_url == "https://api.github.com/repos/org/other"
+
+
+def test_fetch_leaves_out_ids_of_failed_batch(mocker):
+    requester = mocker.Mock()
+    requester.base_url = "https://api.github.com"
+    answer = _answer({("org", "repo", 1), ("org", "repo", 2)})
+
+    def graphql_query(query, variables):
+        if "i2:" in query:
+            raise GithubException(502, {"message": "Bad gateway"}, None)
+        return answer(query, variables)
+
+    requester.graphql_query.side_effect = graphql_query
+    fetcher = GraphQLIssueFetcher(requester, batch_size=1)
+
+    fetched = fetcher.fetch(["org/repo#1", "org/repo#2", "not-an-id"])
+
+    assert list(fetched) == ["org/repo#1"]
+    assert fetcher.queries_count == 2
+
+
+def _pull_node(number, repo="repo"):
+    return {
+        "__typename": "PullRequest",
+        "number": number,
+        "title": f"PR {number}",
+        "body": "Fixes org/repo#1",
+        "state": "MERGED",
+        "url": f"https://github.com/org/{repo}/pull/{number}",
+        "createdAt": "2024-06-01T10:00:00Z",
+        "updatedAt": "2024-06-02T10:00:00Z",
+        "closedAt": "2024-06-02T10:00:00Z",
+        "mergedAt": "2024-06-02T10:00:00Z",
+        "mergeCommit": {"oid": f"sha{number}"},
+        "repository": {"owner": {"login": "org"}, "name": repo},
+        "author": {"login": "alice"},
+        "assignees": {"totalCount": 0, "nodes": []},
+        "labels": {"totalCount": 1, "nodes": [{"name": "enhancement"}]},
+    }
+
+
+def test_fetch_cross_referencing_pulls(mocker):
+    requester = mocker.Mock()
+    requester.base_url = "https://api.github.com"
+    timelines = {
+        1: {"totalCount": 3, "nodes": [{"source": _pull_node(5, "other")}, {"source": {"__typename": "Issue"}}, {}]},
+        2: {"totalCount": 0, "nodes": []},
+        3: {"totalCount": 150, "nodes": [{"source": _pull_node(6)}]},  # more than one page
+    }
+
+    def graphql_query(query, variables):
+        assert "itemTypes: [CROSS_REFERENCED_EVENT]" in query
+        assert "fragment PullRequestFields on PullRequest" in query
+        issues = {f"i{n}": {"timelineItems": timeline} for n, timeline in timelines.items()}
+        return {}, {"data": {"r0": issues}}
+
+    requester.graphql_query.side_effect = graphql_query
+    fetcher = GraphQLIssueFetcher(requester)
+
+    fetched = fetcher.fetch_cross_referencing_pulls(["org/repo#1", "org/repo#2", "org/repo#3"])
+
+    assert set(fetched) == {"org/repo#1", "org/repo#2"}
+    assert fetched["org/repo#2"] == []
+    pull = fetched["org/repo#1"][0]
+    assert (pull.number, pull.state, pull.merge_commit_sha) == (5, "closed", "sha5")
+    assert pull.url == "https://api.github.com/repos/org/other/pulls/5"
+    assert [label.name for label in pull.labels] == ["enhancement"]
+    assert requester.graphql_query.call_count == 1
+
+
+def test_fetch_updated_at(mocker):
+    requester = mocker.Mock()
+    requester.base_url = "https://api.github.com"
+    requester.graphql_query.side_effect = _answer({("org", "repo", 1), ("org", "other", 7)})
+    fetcher = GraphQLIssueFetcher(requester)
+
+    fetched = fetcher.fetch_updated_at(["org/repo#1", "org/repo#2", "org/other#7"])
+
+    assert fetched == {"org/repo#1": "2024-06-02T10:00:00Z", "org/repo#2": None, "org/other#7": "2024-06-02T10:00:00Z"}
+    assert requester.graphql_query.call_count == 1
+    assert "{ updatedAt }" in requester.graphql_query.call_args.args[0]
@@ -0,0 +1,194 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from copy import deepcopy
+
+from datetime import datetime, timezone
+
+import pytest
+
+from release_notes_generator.data.utils.graphql_issue_miner import GraphQLIssueMiner
+
+
+def _node(number, state="CLOSED", labels=("bug",), sub_issues=None, label_total=None, issue_type="Bug"):
+    children = sub_issues or []
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "Body",
+        "state": state,
+        "stateReason": "COMPLETED" if state == "CLOSED" else None,
+        "url": f"https://github.com/org/repo/issues/{number}",
+        "createdAt": "2024-06-01T10:00:00Z",
+        "updatedAt": "2024-06-02T10:00:00Z",
+        "closedAt": "2024-06-02T10:00:00Z" if state == "CLOSED" else None,
+        "author": {"login": "alice"},
+        "assignees": {"totalCount": 1, "nodes": [{"login": "bob"}]},
+        "labels": {
+            "totalCount": label_total if label_total is not None else len(labels),
+            "nodes": [{"name": name} for name in labels],
+        },
+        "issueType": {"name": issue_type} if issue_type else None,
+        "subIssues": {
+            "totalCount": len(children),
+            "nodes": [
+                {
+                    "number": child_number,
+                    "repository": {"owner": {"login": child_org}, "name": "repo"},
+                    "subIssues": {"totalCount": child_count},
+                }
+                for child_org, child_number, child_count in children
+            ],
+        },
+    }
+
+
+def _page(nodes, has_next=False, cursor=None):
+    return {"pageInfo": {"hasNextPage": has_next, "endCursor": cursor}, "nodes": nodes}
+
+
+def _requester(mocker, *responses):
+    requester = mocker.Mock(base_url="https://api.github.com")
+    requester.graphql_query.side_effect = [({}, {"data": {"repository": r}}) for r in responses]
+    return requester
+
+
+def test_mine_pages_updated_and_open_streams(mocker):
+    requester = _requester(
+        mocker,
+        {"updated": _page([_node(5), _node(4)], True, "u1"), "open": _page([_node(9, "OPEN")], True, "o1")},
+        {"updated": _page([_node(3)]), "open": _page([_node(4), _node(2, "OPEN")])},
+    )
+    rate_limiter = mocker.Mock()
+    miner = GraphQLIssueMiner(requester, rate_limiter)
+
+    issues = miner.mine("org", "repo", datetime(2024, 6, 1, tzinfo=timezone.utc))
+
+    # updated stream first, then the remaining open issues, de-duplicated by number
+    assert [i.number for i in issues] == [5, 4, 3, 9, 2]
+    assert miner.pages_count == 2
+    assert rate_limiter.wait_if_needed.call_count == 2
+    first_vars = requester.graphql_query.call_args_list[0].args[1]
+    second_vars = requester.graphql_query.call_args_list[1].args[1]
+    assert first_vars["since"] == "2024-06-01T00:00:00+00:00"
+    assert (first_vars["afterUpdated"], first_vars["afterOpen"]) == (None, None)
+    assert (second_vars["afterUpdated"], second_vars["afterOpen"]) == ("u1", "o1")
+
+
+def test_mine_without_since_uses_single_stream(mocker):
+    requester = _requester(mocker, {"updated": _page([_node(1)])})
+
+    issues = GraphQLIssueMiner(requester).mine("org", "repo", None)
+
+    assert [i.number for i in issues] == [1]
+    variables = requester.graphql_query.call_args.args[1]
+    assert variables["withUpdated"] is True
+    assert variables["withOpen"] is False
+
+
+def test_mine_updated_only_skips_open_stream(mocker):
+    requester = _requester(mocker, {"updated": _page([_node(1)])})
+
+    since = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+    issues = GraphQLIssueMiner(requester).mine("org", "repo", since, with_open=False)
+
+    assert [i.number for i in issues] == [1]
+    assert requester.graphql_query.call_args.args[1]["withOpen"] is False
+
+
+def test_mine_without_hierarchy_skips_sub_issues(mocker):
+    node = _node(1)
+    del node["subIssues"]  # left out of the response by the @include directive
+    requester = _requester(mocker, {"updated": _page([node])})
+    miner = GraphQLIssueMiner(requester, with_sub_issues=False)
+
+    issues = miner.mine("org", "repo", None)
+
+    assert [i.number for i in issues] == [1]
+    assert requester.graphql_query.call_args.args[1]["withSubIssues"] is False
+    assert miner.sub_issues == {}
+
+
+@pytest.mark.parametrize(
+    "with_sub_issues, streams, expected",
+    [(False, 2, 100), (True, 1, 97), (True, 2, 48)],
+)
+def test_page_size_keeps_query_within_cost_budget(mocker, with_sub_issues, streams, expected):
+    miner = GraphQLIssueMiner(mocker.Mock(), with_sub_issues=with_sub_issues)
+
+    assert miner.page_size(streams) == expected
+
+
+def test_mine_sizes_pages_by_active_streams(mocker):
+    requester = _requester(
+        mocker,
+        {"updated": _page([_node(5)]), "open": _page([_node(9, "OPEN")], True, "o1")},
+        {"open": _page([_node(8, "OPEN")])},
+    )
+
+    GraphQLIssueMiner(requester).mine("org", "repo", datetime(2024, 6, 1, tzinfo=timezone.utc))
+
+    assert [c.args[1]["first"] for c in requester.graphql_query.call_args_list] == [48, 97]
+
+
+def test_mined_issue_has_rest_shaped_payload(mocker):
+    requester = _requester(mocker, {"updated": _page([_node(7)])})
+
+    issue = GraphQLIssueMiner(requester).mine("org", "repo", None)[0]
+
+    assert issue.url == "https://api.github.com/repos/org/repo/issues/7"
+    assert issue.html_url == "https://github.com/org/repo/issues/7"
+    assert issue.state == "closed"
+    assert issue.user.login == "alice"
+    assert [a.login for a in issue.assignees] == ["bob"]
+    assert [label.name for label in issue.labels] == ["bug"]
+    assert issue.type.name == "Bug"
+    assert issue.closed_at == datetime(2024, 6, 2, 10, 0, tzinfo=timezone.utc)
+    requester.requestJsonAndCheck.assert_not_called()
+
+
+def test_truncated_labels_are_left_out_of_payload(mocker):
+    requester = _requester(mocker, {"updated": _page([_node(7, label_total=150)])})
+
+    issue = GraphQLIssueMiner(requester).mine("org", "repo", None)[0]
+
+    assert "labels" not in issue._rawData
+
+
+def test_mine_collects_first_level_sub_issues(mocker):
+    truncated = _node(6, sub_issues=[("org", 7, 0), ("org", 8, 0)])
+    truncated["subIssues"]["totalCount"] = 150  # one sub-issue page does not cover all children
+    requester = _requester(
+        mocker,
+        {"updated": _page([_node(1, sub_issues=[("org", 2, 0), ("org2", 3, 4)]), _node(5), truncated])},
+    )
+    miner = GraphQLIssueMiner(requester)
+
+    miner.mine("org", "repo", None)
+
+    assert miner.sub_issues == {
+        "org/repo#1": ["org/repo#2", "org2/repo#3"],
+        "org/repo#2": [],
+        "org/repo#5": [],
+    }
+
+
+def test_mine_malformed_response_raises(mocker):
+    requester = mocker.Mock(base_url="https://api.github.com")
+    requester.graphql_query.return_value = ({}, {"data": None})
+
+    with pytest.raises(ValueError):
+        GraphQLIssueMiner(requester).mine("org", "repo", None)
@@ -0,0 +1,160 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import re
+import shutil
+import subprocess
+from datetime import datetime, timezone
+
+import pytest
+from github import GithubException
+
+from release_notes_generator.data.utils.local_git_repository import LocalGitError, LocalGitRepository
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(path, *args, email="dev@example.com", date="2026-01-01T10:00:00+00:00"):
+    env = {
+        "GIT_AUTHOR_NAME": "Dev",
+        "GIT_AUTHOR_EMAIL": email,
+        "GIT_AUTHOR_DATE": date,
+        "GIT_COMMITTER_NAME": "Dev",
+        "GIT_COMMITTER_EMAIL": "dev@example.com",
+        "GIT_COMMITTER_DATE": date,
+        "HOME": str(path),
+        "PATH": "/usr/bin:/bin:/usr/local/bin",
+    }
+    subprocess.run(["git", "-C", str(path), *args], check=True, capture_output=True, env=env)
+
+
+@pytest.fixture
+def clone(tmp_path, mocker):
+    _git(tmp_path, "init", "-q", "-b", "master")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "Initial commit")
+    _git(tmp_path, "tag", "v1.0.0")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "Fix parser (#12)",
+         email="42+octo@users.noreply.github.com", date="2026-02-01T10:00:00+00:00")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "Bump version\n\nRelease body", date="2026-03-01T10:00:00+00:00")
+    _git(tmp_path, "tag", "-a", "v1.1.0", "-m", "Release 1.1.0")
+    _git(tmp_path, "checkout", "-q", "v1.0.0")  # a detached checkout, as of a tag
+    requester = mocker.Mock()
+    requester.base_url = "https://ghe.example.com/api/v3"
+    # linking authors fails unless a test answers the author queries
+    requester.graphql_query.side_effect = GithubException(502, {"message": "Bad gateway"}, None)
+    return LocalGitRepository(str(tmp_path), requester, "org/repo", "https://ghe.example.com/org/repo")
+
+
+def _sha(path, rev):
+    return subprocess.run(
+        ["git", "-C", str(path), "rev-parse", rev], check=True, capture_output=True, encoding="utf-8"
+    ).stdout.strip()
+
+
+def _answer_authors(logins):
+    """Answer the aliased author queries; a SHA missing from `logins` is unknown to GitHub."""
+
+    def graphql_query(query, variables):
+        assert "author { user { login } }" in query
+        repository = {}
+        for alias, index in re.findall(r"(c(\d+)): object\(oid: \$oid\d+\)", query):
+            sha = variables[f"oid{index}"]
+            user = {"login": logins[sha]} if logins.get(sha) else None
+            repository[alias] = {"author": {"user": user}} if sha in logins else None
+        return {}, {"data": {"repository": repository}}
+
+    return graphql_query
+
+
+def test_commits_between_reads_range_as_rest_commits(clone):
+    commits = clone.commits_between("v1.0.0", "v1.1.0")
+
+    assert [c.commit.message for c in commits] == ["Fix parser (#12)", "Bump version\n\nRelease body"]
+    assert commits[0].author.login == "octo"
+    assert commits[1].author is None
+    assert commits[0].commit.author.email == "42+octo@users.noreply.github.com"
+    assert commits[1].parents[0].sha == commits[0].sha
+    assert commits[0].html_url == f"https://ghe.example.com/org/repo/commit/{commits[0].sha}"
+    assert commits[0].url == f"https://ghe.example.com/api/v3/repos/org/repo/commits/{commits[0].sha}"
+
+
+def test_reading_commits_does_not_query_github(clone):
+    clone.commits_between("v1.0.0", "v1.1.0")
+    clone.commits_since("master", None)
+
+    clone._requester.graphql_query.assert_not_called()
+
+
+def test_link_author_logins_resolves_only_given_commits(clone, tmp_path):
+    head, fix = _sha(tmp_path, "v1.1.0^{commit}"), _sha(tmp_path, "v1.1.0~1")
+    # the fix commit is unknown to GitHub (e.g. not pushed yet), its noreply address is used
+    clone._requester.graphql_query.side_effect = _answer_authors({head: "dev-account"})
+    commits = clone.commits_since("master", None)
+
+    linked = clone.link_author_logins(commits[:2])
+
+    assert [c.sha for c in linked] == [head, fix]
+    assert linked[0].author.login == "dev-account"
+    assert linked[1].author.login == "octo"
+    (_, variables), _ = clone._requester.graphql_query.call_args
+    assert sorted(v for k, v in variables.items() if k.startswith("oid")) == sorted([head, fix])
+
+
+def test_commits_since_reads_branch_newest_first(clone):
+    since = datetime(2026, 1, 15, tzinfo=timezone.utc)
+
+    assert [c.commit.message for c in clone.commits_since("master", since)] == [
+        "Bump version\n\nRelease body",
+        "Fix parser (#12)",
+    ]
+    assert len(clone.commits_since("master", None)) == 3
+
+
+def test_commits_since_lists_rewritten_history_as_api(clone, tmp_path):
+    _git(tmp_path, "checkout", "-q", "-b", "hotfix", "v1.0.0")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "Fix typo", date="2026-01-05T10:00:00+00:00")
+    _git(tmp_path, "checkout", "-q", "master")
+    # cherry-picked: authored in January, committed after the release
+    _git(tmp_path, "cherry-pick", "--allow-empty", "hotfix", date="2026-04-10T10:00:00+00:00")
+    # rebased from a stale branch: committed before the release, the committer dates are not monotonic anymore
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "Rebased feature", date="2026-01-20T10:00:00+00:00")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "Update docs", date="2026-04-20T10:00:00+00:00")
+    since = datetime(2026, 4, 1, tzinfo=timezone.utc)
+    # the API lists every commit of the branch committed at or after the moment, wherever it sits in the history
+    log = subprocess.run(
+        ["git", "-C", str(tmp_path), "log", "--format=%H %cI", "master"], check=True, capture_output=True, text=True
+    ).stdout.split("\n")
+    listed = [sha for sha, date in (line.split() for line in log if line) if datetime.fromisoformat(date) >= since]
+
+    assert [c.commit.message for c in clone.commits_since("master", since, "v1.1.0")] == ["Update docs", "Fix typo"]
+    assert [c.sha for c in clone.commits_since("master", since, "v1.1.0")] == listed
+    assert [c.sha for c in clone.commits_since("master", since, "v9.9.9")] == listed
+
+
+def test_commits_since_raises_on_missing_branch(clone):
+    with pytest.raises(LocalGitError, match="develop"):
+        clone.commits_since("develop", None)
+
+
+def test_commits_between_raises_on_missing_tag(clone):
+    with pytest.raises(LocalGitError, match="v9.9.9"):
+        clone.commits_between("v1.0.0", "v9.9.9")
+
+
+def test_commits_between_raises_outside_clone(tmp_path, mocker):
+    repository = LocalGitRepository(str(tmp_path / "missing"), mocker.Mock(), "org/repo", "https://github.com/org/repo")
+
+    with pytest.raises(LocalGitError):
+        repository.commits_between("a", "b")
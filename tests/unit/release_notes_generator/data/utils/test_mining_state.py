@@ -0,0 +1,81 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from copy import deepcopy
+
+import json
+from datetime import datetime, timezone
+
+from release_notes_generator.data.utils.mining_state import MiningState
+
+SINCE = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+def _state() -> MiningState:
+    return MiningState(
+        repository="org/repo",
+        since=SINCE,
+        high_water_mark=datetime(2024, 6, 10, 12, 0, tzinfo=timezone.utc),
+        head_sha="abc",
+        issues=[{"number": 1, "title": "Issue 1", "updated_at": "2024-06-02T00:00:00Z"}],
+        pull_requests=[{"number": 2, "title": "PR 2", "state": "closed"}],
+        commits=[{"sha": "abc", "commit": {"message": "Fix"}}],
+        sub_issues={"org/repo#1": ["org/repo#3"], "org/repo#3": []},
+    )
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "state" / "mining.json")
+    _state().save(path)
+
+    loaded = MiningState.load(path)
+
+    assert loaded == _state()
+    assert loaded.matches("org/repo", SINCE)
+    assert not loaded.matches("org/repo", datetime(2024, 7, 1, tzinfo=timezone.utc))
+    assert not loaded.matches("org/other", SINCE)
+
+
+def test_build_objects_from_stored_payloads(mocker):
+    state = _state()
+    requester = mocker.Mock()
+
+    issue = state.build_issues(requester)[0]
+    pull = state.build_pull_requests(requester)[0]
+    commit = state.build_commits(requester)[0]
+
+    assert (issue.number, issue.title) == (1, "Issue 1")
+    assert issue.updated_at == datetime(2024, 6, 2, tzinfo=timezone.utc)
+    assert (pull.number, pull.state) == (2, "closed")
+    assert commit.sha == "abc"
+    requester.requestJsonAndCheck.assert_not_called()
+
+
+def test_load_missing_file_returns_none(tmp_path):
+    assert MiningState.load(str(tmp_path / "missing.json")) is None
+
+
+def test_load_other_version_returns_none(tmp_path):
+    path = tmp_path / "mining.json"
+    path.write_text(json.dumps({"version": MiningState.VERSION + 1}), encoding="utf-8")
+
+    assert MiningState.load(str(path)) is None
+
+
+def test_load_corrupted_file_returns_none(tmp_path):
+    path = tmp_path / "mining.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert MiningState.load(str(path)) is None
@@ -0,0 +1,148 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import time
+
+from github.Commit import Commit
+from github.PaginatedList import PaginatedList
+
+from release_notes_generator.data.utils.parallel_paginator import ParallelPaginator
+
+URL = "/repos/org/repo/commits"
+BASE = "https://api.github.com"
+
+
+class _PagedServer:
+    """Answers the listing with `pages` pages of `per_page` commits and counts concurrent requests."""
+
+    def __init__(self, pages: int, per_page: int = 3, numbered_links: bool = True, delay: float = 0.0):
+        self.pages = pages
+        self.per_page = per_page
+        self.numbered_links = numbered_links
+        self.delay = delay
+        self.requested: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def request(self, verb, url, parameters=None, headers=None):
+        assert verb == "GET"
+        if parameters is None:  # a followed next link
+            page = int(url.rsplit("cursor=", 1)[1])
+        else:
+            assert parameters["since"] == "2024-06-01"
+            page = parameters.get("page", 1)
+
+        with self._lock:
+            self.requested.append(page)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+
+        response_headers = {}
+        if page < self.pages:
+            if self.numbered_links:
+                response_headers["link"] = (
+                    f'<{BASE}{URL}?since=2024-06-01&page={page + 1}>; rel="next", '
+                    f'<{BASE}{URL}?since=2024-06-01&page={self.pages}>; rel="last"'
+                )
+            else:
+                response_headers["link"] = f'<{BASE}{URL}?cursor={page + 1}>; rel="next"'
+        data = [{"sha": f"{page}-{i}"} for i in range(self.per_page)]
+        return response_headers, data
+
+
+def _listing(mocker, server: _PagedServer) -> PaginatedList:
+    requester = mocker.Mock()
+    requester.per_page = 30
+    requester.base_url = BASE
+    requester.requestJsonAndCheck.side_effect = server.request
+    return PaginatedList(Commit, requester, URL, {"since": "2024-06-01"})
+
+
+def _shas(pages: int, per_page: int = 3) -> list[str]:
+    return [f"{page}-{i}" for page in range(1, pages + 1) for i in range(per_page)]
+
+
+def test_pages_are_fetched_concurrently_and_yielded_in_order(mocker):
+    server = _PagedServer(pages=12, delay=0.02)
+
+    commits = ParallelPaginator(max_workers=4).collect(_listing(mocker, server))
+
+    assert [c.sha for c in commits] == _shas(12)
+    assert sorted(server.requested) == list(range(1, 13))
+    assert 1 < server.max_in_flight <= 4
+
+
+def test_single_page_listing(mocker):
+    server = _PagedServer(pages=1)
+
+    commits = ParallelPaginator().collect(_listing(mocker, server))
+
+    assert [c.sha for c in commits] == _shas(1)
+    assert server.requested == [1]
+
+
+def test_cursor_links_are_followed_sequentially(mocker):
+    server = _PagedServer(pages=3, numbered_links=False)
+
+    commits = ParallelPaginator().collect(_listing(mocker, server))
+
+    assert [c.sha for c in commits] == _shas(3)
+    assert server.requested == [1, 2, 3]
+    assert server.max_in_flight == 1
+
+
+def test_stopping_early_leaves_remaining_pages_unrequested(mocker):
+    server = _PagedServer(pages=50, delay=0.01)
+
+    iterator = ParallelPaginator(max_workers=2).iterate(_listing(mocker, server))
+    first = [next(iterator) for _ in range(4)]
+    iterator.close()
+
+    assert [c.sha for c in first] == _shas(2)[:4]
+    assert len(server.requested) <= 5
+
+
+def test_rate_limiter_is_consulted_per_page(mocker):
+    server = _PagedServer(pages=3)
+    rate_limiter = mocker.Mock()
+
+    ParallelPaginator(rate_limiter).collect(_listing(mocker, server))
+
+    assert rate_limiter.wait_if_needed.call_count == 3
+
+
+def test_listing_without_known_internals_is_iterated_sequentially():
+    class _OtherRelease(PaginatedList):
+        """A PaginatedList of a PyGithub release keeping its request under other private names."""
+
+        def __init__(self, items):
+            self._items = items
+
+        def __iter__(self):
+            yield from self._items
+
+    assert ParallelPaginator().collect(_OtherRelease([1, 2, 3])) == [1, 2, 3]
+
+
+def test_plain_iterables_pass_through():
+    paginator = ParallelPaginator()
+
+    assert paginator.collect([1, 2, 3]) == [1, 2, 3]
+    assert paginator.collect(None) == []
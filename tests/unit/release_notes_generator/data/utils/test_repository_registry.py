@@ -0,0 +1,59 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from release_notes_generator.data.utils.repository_registry import RepositoryRegistry
+from tests.unit.conftest import FakeRepo
+
+
+def test_get_fetches_each_repository_once(mocker):
+    fetch = mocker.Mock(side_effect=lambda full_name: FakeRepo(full_name) if full_name != "org/gone" else None)
+    registry = RepositoryRegistry(fetch)
+
+    first = registry.get("org/repo")
+
+    assert registry.get("org/repo") is first
+    assert registry.get("org/gone") is None
+    assert registry.get("org/gone") is None
+    assert [c.args[0] for c in fetch.call_args_list] == ["org/repo", "org/gone"]
+    assert registry.found() == [first]
+
+
+def test_add_registers_repository_without_fetch(mocker):
+    fetch = mocker.Mock()
+    registry = RepositoryRegistry(fetch)
+    repo = FakeRepo("org/repo")
+
+    registry.add(repo)
+
+    assert registry.get("org/repo") is repo
+    fetch.assert_not_called()
+
+
+def test_concurrent_requests_share_one_fetch(mocker):
+    def _fetch(full_name):
+        threading.Event().wait(0.05)  # the other requests arrive while this fetch is running
+        return FakeRepo(full_name)
+
+    fetch = mocker.Mock(side_effect=_fetch)
+    registry = RepositoryRegistry(fetch)
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        repos = list(ex.map(registry.get, ["org/repo"] * 8 + ["org/other"] * 8))
+
+    assert fetch.call_count == 2
+    assert len({id(r) for r in repos}) == 2
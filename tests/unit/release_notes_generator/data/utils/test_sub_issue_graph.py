@@ -0,0 +1,64 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+from release_notes_generator.data.utils.sub_issue_graph import SubIssueGraph
+
+
+def _graph() -> SubIssueGraph:
+    return SubIssueGraph(
+        children={
+            "org/repo#1": ["org/repo#2", "org2/repo#3"],
+            "org/repo#2": [],
+            "org2/repo#3": ["org2/repo#4"],
+            "org2/repo#4": [],
+            "org/repo#9": [],
+        },
+        updated_at={"org/repo#1": "T1", "org/repo#2": "T2", "org2/repo#3": "T3", "org2/repo#4": "T4"},
+    )
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "state" / "graph.json")
+    _graph().save(path)
+
+    assert SubIssueGraph.load(path) == _graph()
+
+
+def test_load_rejects_missing_unsupported_or_broken_file(tmp_path):
+    path = tmp_path / "graph.json"
+    assert SubIssueGraph.load(str(path)) is None
+
+    path.write_text(json.dumps({"version": 0, "children": {}, "updated_at": {}}), encoding="utf-8")
+    assert SubIssueGraph.load(str(path)) is None
+
+    path.write_text("{not json", encoding="utf-8")
+    assert SubIssueGraph.load(str(path)) is None
+
+
+def test_reachable_walks_stored_hierarchy_below_roots():
+    assert _graph().reachable(["org/repo#1", "org/repo#404"]) == [
+        "org/repo#1",
+        "org/repo#2",
+        "org2/repo#3",
+        "org2/repo#4",
+    ]
+
+
+def test_reusable_keeps_only_unchanged_issues():
+    current = {"org/repo#1": "T1", "org/repo#2": "T2-new", "org2/repo#3": None, "org2/repo#4": "T4", "o/r#5": "T5"}
+
+    assert _graph().reusable(current) == {"org/repo#1": ["org/repo#2", "org2/repo#3"], "org2/repo#4": []}
@@ -0,0 +1,82 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from release_notes_generator.data.utils.sub_issue_query_planner import SubIssueQueryPlanner
+
+
+def _planner(**overrides):
+    options = {"per_page": 100, "max_cost": 100, "max_nodes": 100_000, "max_aliases_per_repo": 100, "max_repos": 20}
+    options.update(overrides)
+    return SubIssueQueryPlanner(**options)
+
+
+def test_plan_packs_small_repositories_into_one_query():
+    pending = {("org", f"repo{r}"): {1: None, 2: "CUR"} for r in range(5)}
+
+    planned = _planner().plan(pending)
+
+    assert pending == {}
+    assert len(planned.aliases) == 10
+    assert planned.aliases["i4_1"] == ("org", "repo4", 2)
+    assert 'r4: repository(owner: "org", name: "repo4")' in planned.text
+    assert 'subIssues(first: 100, after: "CUR")' in planned.text
+    assert "rateLimit { cost remaining }" in planned.text
+    assert (planned.nodes, planned.requests) == (1000, 1010)
+    assert planned.cost == 10.1
+
+
+def test_plan_stops_at_node_budget_and_alias_caps():
+    pending = {("org", "big"): {n: None for n in range(1, 8)}, ("org", "small"): {1: None}}
+
+    planned = _planner(per_page=10, max_nodes=50, max_aliases_per_repo=3).plan(pending)
+
+    assert list(planned.aliases.values()) == [("org", "big", 1), ("org", "big", 2), ("org", "big", 3), ("org", "small", 1)]
+    assert pending == {("org", "big"): {n: None for n in range(4, 8)}}
+
+
+def test_plan_takes_one_parent_over_budget():
+    pending = {("org", "repo"): {1: None, 2: None}}
+
+    planned = _planner(max_cost=0.5, max_nodes=1).plan(pending)
+
+    assert len(planned.aliases) == 1
+    assert pending == {("org", "repo"): {2: None}}
+
+
+def test_observe_calibrates_estimate_and_sums_costs():
+    planner = _planner()
+    planned = planner.plan({("org", "repo"): {n: None for n in range(1, 51)}})
+
+    planner.observe(planned, {"cost": 101, "remaining": 4000})
+
+    assert (planner.queries_count, planner.planned_cost_total, planner.observed_cost_total) == (1, 50.5, 101)
+    assert planner.estimate_cost(1010) == pytest.approx(20.2)  # twice the estimate was observed
+    # the calibrated estimate fits 49 parents into 100 points
+    assert len(planner.plan({("org", "repo"): {n: None for n in range(1, 100)}}).aliases) == 49
+
+
+def test_shrink_requeues_parents_and_halves_node_budget():
+    planner = _planner(per_page=10)
+    pending = {("org", "repo"): {1: None, 2: "CUR", 3: None, 4: None}}
+    planned = planner.plan(pending)
+
+    assert planner.shrink(planned, pending)
+
+    assert pending == {("org", "repo"): {1: None, 2: "CUR", 3: None, 4: None}}
+    assert len(planner.plan(pending).aliases) == 2
+    single = planner.plan({("org", "repo"): {5: None}})
+    assert not planner.shrink(single, pending)
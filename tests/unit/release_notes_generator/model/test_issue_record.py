@@ -156,18 +156,18 @@ def test_register_commit(mock_issue_open_2, mock_pull_merged, mock_commit):
     mock_pull_merged.body = "Release Notes:\n- Fixed bug\n- Improved performance\n\nFixes #123"
     record.register_commit(mock_pull_merged, mock_commit)
 
-    assert 1 == len(record._commits)
-    assert 124 in record._pull_requests.keys()
-    assert 124 in record._commits.keys()
+    assert 1 == len(record._commit_snapshots)
+    assert 124 in record._pull_request_snapshots.keys()
+    assert 124 in record._commit_snapshots.keys()
 
 
 def test_register_commit_pr_already_registered(mock_issue_open_2, mock_pull_merged, mock_commit):
     record = IssueRecord(issue=mock_issue_open_2)
     mock_pull_merged.body = "Release Notes:\n- Fixed bug\n- Improved performance\n\nFixes #123"
     record.register_pull_request(mock_pull_merged)
-    record._commits.pop(124)
+    record._commit_snapshots.pop(124)
     record.register_commit(mock_pull_merged, mock_commit)
 
-    assert 1 == len(record._commits)
-    assert 124 in record._pull_requests.keys()
-    assert 124 in record._commits.keys()
+    assert 1 == len(record._commit_snapshots)
+    assert 124 in record._pull_request_snapshots.keys()
+    assert 124 in record._commit_snapshots.keys()
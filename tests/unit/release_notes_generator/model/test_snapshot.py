@@ -0,0 +1,170 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timezone
+
+import pytest
+from github.Commit import Commit
+from github.Issue import Issue
+from github.PullRequest import PullRequest
+
+from release_notes_generator.model.record.issue_record import IssueRecord
+from release_notes_generator.model.record.pull_request_record import PullRequestRecord
+from release_notes_generator.model.snapshot import CommitSnapshot, IssueSnapshot, PullRequestSnapshot, payload_labels
+
+
+@pytest.fixture
+def offline_requester(mocker):
+    requester = mocker.Mock()
+    requester.is_not_lazy = False
+    requester.is_lazy = True
+    requester.requestJsonAndCheck.side_effect = AssertionError("network must not be touched")
+    return requester
+
+
+def test_issue_snapshot_from_partial_payload_does_not_complete(offline_requester):
+    issue = Issue(
+        offline_requester,
+        {},
+        {
+            "number": 7,
+            "title": "Broken build",
+            "state": "closed",
+            "state_reason": "not_planned",
+            "url": "https://api.github.com/repos/org/repo/issues/7",
+            "user": {"login": "alice"},
+            "assignees": [{"login": "bob"}],
+            "labels": [{"name": "bug"}],
+            "closed_at": "2024-06-01T10:00:00Z",
+        },
+        completed=False,
+    )
+
+    snapshot = IssueSnapshot.from_issue(issue)
+
+    assert snapshot.number == 7
+    assert snapshot.title == "Broken build"
+    assert snapshot.state_reason == "not_planned"
+    assert snapshot.author == "alice"
+    assert snapshot.assignees == ("bob",)
+    assert snapshot.labels == ("bug",)
+    assert snapshot.type_name is None  # 'type' missing from payload, no completion request
+    assert snapshot.closed_at == datetime(2024, 6, 1, 10, 0, tzinfo=timezone.utc)
+    offline_requester.requestJsonAndCheck.assert_not_called()
+
+
+def test_records_render_from_snapshot_without_network(mocker, offline_requester):
+    pull = PullRequest(
+        offline_requester,
+        {},
+        {
+            "number": 12,
+            "title": "Fix build",
+            "state": "closed",
+            "url": "https://api.github.com/repos/org/repo/pulls/12",
+            "user": {"login": "carol"},
+            "labels": [],
+            "body": "Release Notes:\n- Build fixed",
+            "draft": False,
+            "merged_at": "2024-06-01T09:00:00Z",
+            "closed_at": "2024-06-01T09:00:00Z",
+        },
+        completed=False,
+    )
+    issue = Issue(
+        offline_requester,
+        {},
+        {
+            "number": 7,
+            "title": "Broken build",
+            "state": "closed",
+            "labels": [],
+            "url": "https://api.github.com/repos/org/repo/issues/7",
+        },
+        completed=False,
+    )
+
+    rec = IssueRecord(issue, issue_labels=["bug"])
+    rec.register_pull_request(pull)
+    row = rec.to_chapter_row()
+
+    assert "#7 _Broken build_" in row
+    assert "@carol" in row
+    assert "- Build fixed" in row
+    offline_requester.requestJsonAndCheck.assert_not_called()
+
+    pr_rec = PullRequestRecord(pull, mocker.Mock(full_name="org/repo"), labels=[])
+    assert pr_rec.is_merged
+    assert pr_rec.pull_request.draft is False
+    assert pr_rec.author == "@carol"
+    assert pr_rec.assignees == []
+    offline_requester.requestJsonAndCheck.assert_not_called()
+
+
+def test_snapshots_fall_back_to_attributes(mocker):
+    commit = mocker.Mock(spec=Commit)
+    commit.sha = "abc1234"
+    commit.commit.message = "Direct change"
+    commit.author.login = "dave"
+
+    snapshot = CommitSnapshot.from_commit(commit)
+
+    assert snapshot == CommitSnapshot(sha="abc1234", message="Direct change", author="dave")
+
+
+def test_snapshots_are_slotted_and_immutable():
+    snapshot = PullRequestSnapshot(
+        number=1,
+        title="t",
+        state="open",
+        draft=False,
+        body=None,
+        author=None,
+        assignees=(),
+        labels=(),
+        merge_commit_sha=None,
+        merged_at=None,
+        closed_at=None,
+    )
+
+    assert not hasattr(snapshot, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        snapshot.title = "changed"  # type: ignore[misc]
+
+
+def test_payload_labels(offline_requester):
+    labeled = PullRequest(offline_requester, {}, {"number": 1, "labels": [{"name": "bug"}]}, completed=False)
+    unlabeled = PullRequest(offline_requester, {}, {"number": 2, "labels": []}, completed=False)
+    partial = PullRequest(offline_requester, {}, {"number": 3}, completed=False)
+
+    assert payload_labels(labeled) == ["bug"]
+    assert payload_labels(unlabeled) == []
+    assert payload_labels(partial) is None
+    offline_requester.requestJsonAndCheck.assert_not_called()
+
+
+def test_snapshot_pages_labels_missing_from_payload(mocker, offline_requester):
+    label = mocker.Mock()
+    label.name = "bug"
+    get_labels = mocker.patch.object(Issue, "get_labels", return_value=[label])
+    issue = Issue(offline_requester, {}, {"number": 3, "title": "t"}, completed=False)
+
+    snapshot = IssueSnapshot.from_issue(issue)
+
+    assert snapshot.labels == ("bug",)
+    get_labels.assert_called_once()
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import threading
 import time
 from datetime import datetime
 from typing import cast
@@ -28,8 +29,9 @@ from release_notes_generator.model.record.hierarchy_issue_record import Hierarch
 from release_notes_generator.model.record.issue_record import IssueRecord
 from release_notes_generator.model.mined_data import MinedData
 from release_notes_generator.model.record.pull_request_record import PullRequestRecord
+from release_notes_generator.model.snapshot import CommitSnapshot, PullRequestSnapshot
 from release_notes_generator.record.factory.default_record_factory import DefaultRecordFactory
-from tests.unit.conftest import mock_safe_call_decorator
+from tests.unit.conftest import mock_safe_call_decorator, mock_get_issues_for_prs
 
 # generate - non hierarchy issue records
 
@@ -209,10 +211,10 @@ def test_generate_with_issues_and_pulls_and_commits(mocker, mock_repo):
 
     # Verify that PRs are registered
     assert 1 == rec_i1.pull_requests_count()
-    assert pr1 == rec_i1.get_pull_request(101)
+    assert PullRequestSnapshot.from_pull_request(pr1) == rec_i1.get_pull_request(101)
 
     # Verify that commits are registered
-    assert commit1 == rec_i1.get_commit(101, "abc123")
+    assert CommitSnapshot.from_commit(commit1) == rec_i1.get_commit(101, "abc123")
 
 
 def test_generate_with_issues_and_pulls_and_commits_with_skip_labels(mocker, mock_repo):
@@ -268,13 +270,13 @@ def test_generate_with_issues_and_pulls_and_commits_with_skip_labels(mocker, moc
     assert 1 == rec_i1.pull_requests_count()
     assert 1 == rec_i2.pull_requests_count()
 
-    assert pr1 == rec_i1.get_pull_request(101)
-    assert pr2 == rec_i2.get_pull_request(102)
+    assert PullRequestSnapshot.from_pull_request(pr1) == rec_i1.get_pull_request(101)
+    assert PullRequestSnapshot.from_pull_request(pr2) == rec_i2.get_pull_request(102)
 
     # Verify that commits are registered
-    assert commit1 == rec_i1.get_commit(101, "abc123")
-    assert commit2 == rec_i2.get_commit(102, "def456")
-    assert commit3 == cast(CommitRecord, records["ghi789"]).commit
+    assert CommitSnapshot.from_commit(commit1) == rec_i1.get_commit(101, "abc123")
+    assert CommitSnapshot.from_commit(commit2) == rec_i2.get_commit(102, "def456")
+    assert CommitSnapshot.from_commit(commit3) == cast(CommitRecord, records["ghi789"]).snapshot
 
 
 def test_generate_with_no_commits(mocker, mock_repo):
@@ -310,7 +312,231 @@ def test_generate_with_no_commits(mocker, mock_repo):
     assert 1 == rec_issue1.pull_requests_count()
     assert 1 == rec_issue2.pull_requests_count()
 
-    assert pr1 == rec_issue2.get_pull_request(101)
+    assert PullRequestSnapshot.from_pull_request(pr1) == rec_issue2.get_pull_request(101)
+
+
+def test_generate_uses_batched_pull_linked_issues(mocker, mock_repo):
+    mock_github_client = mocker.Mock(spec=Github)
+    data = MinedData(mock_repo)
+    issue1, issue2, pr1, pr2, _commit1, _commit2 = setup_issues_pulls_commits(mocker, mock_repo)
+    data.issues = {issue1: mock_repo, issue2: mock_repo}
+    data.pull_requests = {pr1: mock_repo, pr2: mock_repo}
+
+    mock_rate_limit = mocker.Mock()
+    mock_rate_limit.rate.remaining = 10
+    mock_rate_limit.rate.reset.timestamp.return_value = time.time() + 3600
+    mock_github_client.get_rate_limit.return_value = mock_rate_limit
+
+    batch = mocker.patch(
+        "release_notes_generator.record.factory.default_record_factory.get_issues_for_prs",
+        return_value={101: {"org/repo#1"}, 102: {"org/repo#2"}},
+    )
+    single = mocker.patch("release_notes_generator.record.factory.default_record_factory.get_issues_for_pr")
+
+    records = DefaultRecordFactory(mock_github_client, mock_repo).generate(data)
+
+    batch.assert_called_once()
+    assert sorted(batch.call_args.kwargs["pull_numbers"]) == [101, 102]
+    single.assert_not_called()
+    assert PullRequestSnapshot.from_pull_request(pr1) == cast(IssueRecord, records["org/repo#1"]).get_pull_request(101)
+    assert PullRequestSnapshot.from_pull_request(pr2) == cast(IssueRecord, records["org/repo#2"]).get_pull_request(102)
+
+
+def test_issue_labels_are_read_from_mined_payload(mocker, mock_repo):
+    issue = Issue(
+        mocker.Mock(spec=Requester),
+        {},
+        {"number": 1, "labels": [{"name": "bug"}, {"name": "ui"}], "type": {"name": "Task"}},
+        completed=False,
+    )
+    factory = DefaultRecordFactory(mocker.Mock(spec=Github), mock_repo)
+    get_labels = mocker.patch.object(Issue, "get_labels")
+
+    assert factory._get_issue_labels_mix_with_type(issue) == ["bug", "ui", "task"]
+    get_labels.assert_not_called()
+
+
+def test_generate_large_release_hits_no_label_endpoint(mocker, mock_repo):
+    requester = mocker.Mock(spec=Requester)
+    requester.base_url = "https://api.github.com"
+    requester.is_lazy = True
+    requester.is_not_lazy = False
+    requester.requestJsonAndCheck.return_value = ({}, [])
+    pulls = [
+        PullRequest(
+            requester,
+            {},
+            {
+                "number": number,
+                "title": f"PR {number}",
+                "state": "closed",
+                "body": "No linked issue",
+                "url": f"https://api.github.com/repos/org/repo/pulls/{number}",
+                "user": {"login": "alice"},
+                "labels": [{"name": "enhancement"}],
+                "merge_commit_sha": f"sha{number}",
+                "merged_at": "2024-06-01T10:00:00Z",
+            },
+            completed=False,
+        )
+        for number in range(1, 501)
+    ]
+    data = MinedData(mock_repo)
+    data.pull_requests = {pull: mock_repo for pull in pulls}
+    mock_github_client = mocker.Mock(spec=Github)
+    mock_rate_limit = mocker.Mock()
+    mock_rate_limit.rate.remaining = 5000
+    mock_rate_limit.rate.reset.timestamp.return_value = time.time() + 3600
+    mock_github_client.get_rate_limit.return_value = mock_rate_limit
+    mocker.patch(
+        "release_notes_generator.record.factory.default_record_factory.get_issues_for_prs",
+        return_value={pull.number: set() for pull in pulls},
+    )
+
+    records = DefaultRecordFactory(mock_github_client, mock_repo).generate(data)
+
+    assert len(records) == 500
+    assert all(record.labels == ["enhancement"] for record in records.values())
+    label_calls = [c for c in requester.requestJsonAndCheck.call_args_list if "/labels" in str(c.args)]
+    assert label_calls == []
+
+
+class _CountingCommit:
+    """Commit stub counting the reads of its SHA, the unit of work of the commit association."""
+
+    reads = 0
+    author = None
+    commit = None
+
+    def __init__(self, sha: str):
+        self._sha = sha
+
+    @property
+    def sha(self) -> str:
+        _CountingCommit.reads += 1
+        return self._sha
+
+
+def _sha_reads_of_commit_association(mocker, mock_repo, size: int) -> int:
+    requester = mocker.Mock(spec=Requester)
+    requester.base_url = "https://api.github.com"
+    pulls = [
+        PullRequest(
+            requester,
+            {},
+            {
+                "number": n,
+                "title": f"PR {n}",
+                "body": "",
+                "url": f"https://api.github.com/repos/org/repo/pulls/{n}",
+                "labels": [],
+                "merge_commit_sha": f"sha{n}",
+            },
+            completed=False,
+        )
+        for n in range(1, size + 1)
+    ]
+    data = MinedData(mock_repo)
+    data.pull_requests = {pull: mock_repo for pull in pulls}
+    data.commits = {_CountingCommit(f"sha{n}"): mock_repo for n in range(1, size + 1)}
+    mocker.patch(
+        "release_notes_generator.record.factory.default_record_factory.get_issues_for_prs",
+        return_value={pull.number: set() for pull in pulls},
+    )
+
+    mock_github_client = _github_with_rate_limit(mocker)
+
+    _CountingCommit.reads = 0
+    records = DefaultRecordFactory(mock_github_client, mock_repo).generate(data)
+
+    assert all(cast(PullRequestRecord, records[f"org/repo#{n}"]).commits_count() == 1 for n in range(1, size + 1))
+    return _CountingCommit.reads
+
+
+def test_commit_association_scales_linearly(mocker, mock_repo):
+    small = _sha_reads_of_commit_association(mocker, mock_repo, 500)
+    large = _sha_reads_of_commit_association(mocker, mock_repo, 2000)
+
+    # a nested scan would need 16x more SHA reads for 4x more PRs and commits
+    assert large <= 4 * small + 10
+    assert large < 2000 * 10
+
+
+def _payload_pull(requester, number: int, body: str = "") -> PullRequest:
+    return PullRequest(
+        requester,
+        {},
+        {
+            "number": number,
+            "title": f"PR {number}",
+            "body": body,
+            "url": f"https://api.github.com/repos/org/repo/pulls/{number}",
+            "labels": [],
+            "merge_commit_sha": f"sha{number}",
+        },
+        completed=False,
+    )
+
+
+def _github_with_rate_limit(mocker):
+    mock_github_client = mocker.Mock(spec=Github)
+    mock_rate_limit = mocker.Mock()
+    mock_rate_limit.rate.remaining = 5000
+    mock_rate_limit.rate.reset.timestamp.return_value = time.time() + 3600
+    mock_github_client.get_rate_limit.return_value = mock_rate_limit
+    return mock_github_client
+
+
+def test_generate_collects_pull_linkage_in_parallel_and_keeps_order(mocker, mock_repo):
+    requester = mocker.Mock(spec=Requester)
+    requester.base_url = "https://api.github.com"
+    pulls = [_payload_pull(requester, n) for n in range(1, 17)]
+    data = MinedData(mock_repo)
+    data.pull_requests = {pull: mock_repo for pull in pulls}
+    mocker.patch(
+        "release_notes_generator.record.factory.default_record_factory.get_issues_for_prs", return_value={}
+    )
+    threads: set[str] = set()
+
+    def slow_single_query(pull_number, requester, rate_limiter=None):
+        threads.add(threading.current_thread().name)
+        time.sleep(0.02)
+        return set()
+
+    mocker.patch(
+        "release_notes_generator.record.factory.default_record_factory.get_issues_for_pr",
+        side_effect=slow_single_query,
+    )
+
+    records = DefaultRecordFactory(_github_with_rate_limit(mocker), mock_repo).generate(data)
+
+    assert list(records) == [f"org/repo#{n}" for n in range(1, 17)]
+    assert len(threads) > 1
+
+
+def test_generate_fetches_missing_linked_issue_once(mocker, mock_repo):
+    requester = mocker.Mock(spec=Requester)
+    requester.base_url = "https://api.github.com"
+    pr1 = _payload_pull(requester, 101, body="Fixes #9")
+    pr2 = _payload_pull(requester, 102, body="Closes #9")
+    data = MinedData(mock_repo)
+    data.pull_requests = {pr1: mock_repo, pr2: mock_repo}
+    mock_repo.get_issue.return_value = Issue(
+        requester,
+        {},
+        {"number": 9, "title": "Missing", "url": "https://api.github.com/repos/org/repo/issues/9", "labels": []},
+        completed=False,
+    )
+    mocker.patch(
+        "release_notes_generator.record.factory.default_record_factory.get_issues_for_prs",
+        return_value={101: set(), 102: set()},
+    )
+
+    records = DefaultRecordFactory(_github_with_rate_limit(mocker), mock_repo).generate(data)
+
+    mock_repo.get_issue.assert_called_once_with(9)
+    assert list(records) == ["org/repo#9"]
+    assert cast(IssueRecord, records["org/repo#9"]).pull_requests_count() == 2
 
 
 def test_generate_with_no_commits_with_wrong_issue_number_in_pull_body_mention(mocker, mock_repo):
@@ -347,19 +573,21 @@ def test_generate_with_no_commits_with_wrong_issue_number_in_pull_body_mention(m
     assert 0 == rec_issue1.pull_requests_count()
     assert 1 == rec_issue2.pull_requests_count()
 
-    assert pr1 == rec_issue2.get_pull_request(101)
+    assert PullRequestSnapshot.from_pull_request(pr1) == rec_issue2.get_pull_request(101)
 
 
 def mock_safe_call_decorator_no_issues(_rate_limiter):
     def wrapper(fn):
         if getattr(fn, "__name__", None) == "get_issues_for_pr":
             return mock_get_issues_for_pr_no_issues
+        if getattr(fn, "__name__", None) == "get_issues_for_prs":
+            return mock_get_issues_for_prs
         return fn
 
     return wrapper
 
 
-def mock_get_issues_for_pr_no_issues(pull_number: int, requester: Requester) -> list[str]:
+def mock_get_issues_for_pr_no_issues(pull_number: int, requester: Requester, rate_limiter=None) -> list[str]:
     return []
 
 
@@ -387,14 +615,14 @@ def test_generate_with_no_issues(mocker, mock_repo, request):
     rec_pr2 = cast(PullRequestRecord, records["org/repo#102"])
 
     # Verify that PRs are registered
-    assert pr1 == rec_pr1.pull_request
-    assert pr2 == rec_pr2.pull_request
+    assert PullRequestSnapshot.from_pull_request(pr1) == rec_pr1.snapshot
+    assert PullRequestSnapshot.from_pull_request(pr2) == rec_pr2.snapshot
 
     # Verify that commits are registered
     assert 1 == rec_pr1.commits_count()
     assert 1 == rec_pr2.commits_count()
-    assert commit1 == rec_pr1.get_commit("abc123")
-    assert commit2 == rec_pr2.get_commit("def456")
+    assert CommitSnapshot.from_commit(commit1) == rec_pr1.get_commit("abc123")
+    assert CommitSnapshot.from_commit(commit2) == rec_pr2.get_commit("def456")
 
 
 def test_generate_with_no_issues_skip_labels(mocker, mock_repo, request):
@@ -441,8 +669,8 @@ def test_generate_with_no_issues_skip_labels(mocker, mock_repo, request):
     assert 1 == rec_pr1.commits_count()
     assert 1 == rec_pr2.commits_count()
 
-    assert commit1 == rec_pr1.get_commit("abc123")
-    assert commit2 == rec_pr2.get_commit("def456")
+    assert CommitSnapshot.from_commit(commit1) == rec_pr1.get_commit("abc123")
+    assert CommitSnapshot.from_commit(commit2) == rec_pr2.get_commit("def456")
 
 
 def test_generate_with_no_pulls(mocker, mock_repo):
@@ -555,7 +783,7 @@ def test_generate_isolated_record_types_no_labels_no_type_defined(
     assert 1 == rec_hi_3.sub_issues["org/repo#452"].pull_requests_count()
     assert (
         "Fixed bug in PR 151"
-        == rec_hi_3.sub_issues["org/repo#452"].get_commit(151, "merge_commit_sha_151").commit.message
+        == rec_hi_3.sub_issues["org/repo#452"].get_commit(151, "merge_commit_sha_151").message
     )
     assert 0 == rec_hi_3.level
 
@@ -569,7 +797,7 @@ def test_generate_isolated_record_types_no_labels_no_type_defined(
         == rec_hi_4.sub_hierarchy_issues["org/repo#350"]
         .sub_issues["org/repo#453"]
         .get_commit(152, "merge_commit_sha_152")
-        .commit.message
+        .message
     )
     assert 0 == rec_hi_4.level
 
@@ -645,7 +873,7 @@ def test_generate_isolated_record_types_with_labels_no_type_defined(
     assert 1 == rec_hi_3.sub_issues["org/repo#452"].pull_requests_count()
     assert (
         "Fixed bug in PR 151"
-        == rec_hi_3.sub_issues["org/repo#452"].get_commit(151, "merge_commit_sha_151").commit.message
+        == rec_hi_3.sub_issues["org/repo#452"].get_commit(151, "merge_commit_sha_151").message
     )
 
     rec_hi_4 = cast(HierarchyIssueRecord, result["org/repo#304"])
@@ -658,7 +886,7 @@ def test_generate_isolated_record_types_with_labels_no_type_defined(
         == rec_hi_4.sub_hierarchy_issues["org/repo#350"]
         .sub_issues["org/repo#453"]
         .get_commit(152, "merge_commit_sha_152")
-        .commit.message
+        .message
     )
 
 
@@ -730,7 +958,7 @@ def test_generate_isolated_record_types_no_labels_with_type_defined(
     assert 1 == rec_hi_3.sub_issues["org/repo#452"].pull_requests_count()
     assert (
         "Fixed bug in PR 151"
-        == rec_hi_3.sub_issues["org/repo#452"].get_commit(151, "merge_commit_sha_151").commit.message
+        == rec_hi_3.sub_issues["org/repo#452"].get_commit(151, "merge_commit_sha_151").message
     )
 
     rec_hi_4 = cast(HierarchyIssueRecord, result["org/repo#304"])
@@ -743,7 +971,7 @@ def test_generate_isolated_record_types_no_labels_with_type_defined(
         == rec_hi_4.sub_hierarchy_issues["org/repo#350"]
         .sub_issues["org/repo#453"]
         .get_commit(152, "merge_commit_sha_152")
-        .commit.message
+        .message
     )
 
 
@@ -815,7 +1043,7 @@ def test_generate_isolated_record_types_with_labels_with_type_defined(
     assert 1 == rec_hi_3.sub_issues["org/repo#452"].pull_requests_count()
     assert (
         "Fixed bug in PR 151"
-        == rec_hi_3.sub_issues["org/repo#452"].get_commit(151, "merge_commit_sha_151").commit.message
+        == rec_hi_3.sub_issues["org/repo#452"].get_commit(151, "merge_commit_sha_151").message
     )
 
     rec_hi_4 = cast(HierarchyIssueRecord, result["org/repo#304"])
@@ -828,5 +1056,5 @@ def test_generate_isolated_record_types_with_labels_with_type_defined(
         == rec_hi_4.sub_hierarchy_issues["org/repo#350"]
         .sub_issues["org/repo#453"]
         .get_commit(152, "merge_commit_sha_152")
-        .commit.message
+        .message
     )
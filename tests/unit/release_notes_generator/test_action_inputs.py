@@ -441,6 +441,38 @@ def test_get_print_empty_chapters(mocker):
     assert ActionInputs.get_print_empty_chapters() is True
 
 
+def test_get_http_cache_dir_disabled_by_default(mocker):
+    mocker.patch("release_notes_generator.action_inputs.get_action_input", return_value="")
+    assert ActionInputs.get_http_cache_dir() == ""
+
+
+def test_get_http_cache_max_size_mb(mocker):
+    mocker.patch("release_notes_generator.action_inputs.get_action_input", return_value=" 250 ")
+    assert ActionInputs.get_http_cache_max_size_mb() == 250
+
+
+def test_get_http_cache_max_size_mb_invalid_value(mocker):
+    mocker.patch("release_notes_generator.action_inputs.get_action_input", return_value="big")
+    mock_log_error = mocker.patch("release_notes_generator.action_inputs.logger.error")
+    assert ActionInputs.get_http_cache_max_size_mb() == 100
+    mock_log_error.assert_called_once()
+
+
+def test_get_mining_state_file(mocker):
+    mocker.patch("release_notes_generator.action_inputs.get_action_input", return_value=" .cache/state.json ")
+    assert ActionInputs.get_mining_state_file() == ".cache/state.json"
+
+
+def test_get_sub_issue_graph_file(mocker):
+    mocker.patch("release_notes_generator.action_inputs.get_action_input", return_value=" .cache/graph.json ")
+    assert ActionInputs.get_sub_issue_graph_file() == ".cache/graph.json"
+
+
+def test_get_local_repository_path(mocker):
+    mocker.patch("release_notes_generator.action_inputs.get_action_input", return_value=" /work/repo ")
+    assert ActionInputs.get_local_repository_path() == "/work/repo"
+
+
 def test_get_verbose_verbose_by_action_input(mocker):
     mocker.patch("release_notes_generator.action_inputs.get_action_input", return_value="true")
     mocker.patch("os.getenv", return_value=0)
@@ -914,6 +946,7 @@ def test_generate_release_notes_latest_release_not_found(
     mock_pull_closed_with_rls_notes_102.merged_at = mock_repo.created_at + timedelta(days=7)
     mock_rate_limit = mocker.Mock()
     mock_rate_limit.rate.remaining = 1000
+    mock_rate_limit.rate.reset.timestamp.return_value = time.time() + 3600
     github_mock.get_rate_limit.return_value = mock_rate_limit
     mocker.patch("release_notes_generator.record.factory.default_record_factory.get_issues_for_pr", return_value=None)
     custom_chapters = CustomChapters(print_empty_chapters=True)
@@ -955,6 +988,7 @@ def test_generate_release_notes_latest_release_found_by_created_at(
     mocker.patch("release_notes_generator.data.miner.DataMiner.get_latest_release", return_value=mock_git_release)
     mock_rate_limit = mocker.Mock()
     mock_rate_limit.rate.remaining = 1000
+    mock_rate_limit.rate.reset.timestamp.return_value = time.time() + 3600
     github_mock.get_rate_limit.return_value = mock_rate_limit
     mock_get_action_input = mocker.patch("release_notes_generator.utils.gh_action.get_action_input")
     mock_get_action_input.side_effect = lambda first_arg, **kwargs: (
@@ -1000,6 +1034,7 @@ def test_generate_release_notes_latest_release_found_by_published_at(
     mocker.patch("release_notes_generator.data.miner.DataMiner.get_latest_release", return_value=mock_git_release)
     mock_rate_limit = mocker.Mock()
     mock_rate_limit.rate.remaining = 1000
+    mock_rate_limit.rate.reset.timestamp.return_value = time.time() + 3600
     github_mock.get_rate_limit.return_value = mock_rate_limit
     mocker.patch("release_notes_generator.record.factory.default_record_factory.get_issues_for_pr", return_value=None)
     custom_chapters = CustomChapters(print_empty_chapters=True)
@@ -68,6 +68,7 @@ def test_generate_release_notes_latest_release_not_found(
 
     mock_rate_limit = mocker.Mock()
     mock_rate_limit.rate.remaining = 1000
+    mock_rate_limit.rate.reset.timestamp.return_value = time.time() + 3600
     github_mock.get_rate_limit.return_value = mock_rate_limit
 
     mocker.patch("release_notes_generator.record.factory.default_record_factory.get_issues_for_pr", return_value=None)
@@ -117,6 +118,7 @@ def test_generate_release_notes_latest_release_found_by_created_at(
 
     mock_rate_limit = mocker.Mock()
     mock_rate_limit.rate.remaining = 1000
+    mock_rate_limit.rate.reset.timestamp.return_value = time.time() + 3600
     github_mock.get_rate_limit.return_value = mock_rate_limit
 
     mock_get_action_input = mocker.patch("release_notes_generator.utils.gh_action.get_action_input")
@@ -172,6 +174,7 @@ def test_generate_release_notes_latest_release_found_by_published_at(
 
     mock_rate_limit = mocker.Mock()
     mock_rate_limit.rate.remaining = 1000
+    mock_rate_limit.rate.reset.timestamp.return_value = time.time() + 3600
     github_mock.get_rate_limit.return_value = mock_rate_limit
 
     mocker.patch("release_notes_generator.record.factory.default_record_factory.get_issues_for_pr", return_value=None)
@@ -0,0 +1,51 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+
+from github import Github
+
+from release_notes_generator.utils.github_connection import install_thread_safe_connection
+
+
+def test_requests_of_threads_do_not_mix():
+    github = Github(base_url="https://github.example.com/api/v3")
+    install_thread_safe_connection(github)
+    connection_class = getattr(github.requester, "_Requester__connectionClass")
+    connection = connection_class("github.example.com", 443)
+
+    requested = threading.Event()
+
+    def other_thread():
+        connection.request("GET", "/other", None, {})
+        requested.set()
+
+    connection.request("GET", "/mine", None, {"Accept": "json"})
+    worker = threading.Thread(target=other_thread)
+    worker.start()
+    requested.wait()
+    worker.join()
+
+    assert connection_class.__name__.startswith("ThreadSafe")
+    assert connection.url == "/mine"
+    assert connection.headers == {"Accept": "json"}
+
+
+def test_unknown_connection_class_is_left_untouched(mocker):
+    github = mocker.Mock()
+
+    install_thread_safe_connection(github)
+
+    assert not isinstance(getattr(github.requester, "_Requester__connectionClass"), type)
@@ -14,9 +14,17 @@
 # limitations under the License.
 #
 
+import threading
 import time
 from datetime import datetime, timedelta
 
+import requests
+from github import Auth, Github
+from github.Rate import Rate
+from requests.adapters import HTTPAdapter
+
+from release_notes_generator.utils.github_rate_limiter import GithubRateLimiter, graphql_query, install_rate_limit_hook
+
 
 def test_rate_limiter_extended_sleep_remaining_1(mocker, rate_limiter, mock_rate_limiter):
     # Patch time.sleep to avoid actual delay and track call count
@@ -61,3 +69,161 @@ def test_rate_limiter_extended_sleep_remaining_1_negative_reset_time(mocker, rat
 
     method_mock.assert_called_once()
     mock_sleep.assert_called_once()
+
+
+def test_rate_limiter_polls_once_when_no_header_data(mocker, rate_limiter):
+    mocker.patch("time.sleep", return_value=None)
+
+    method_mock = mocker.Mock()
+    wrapped_method = rate_limiter(method_mock)
+
+    for _ in range(3):
+        wrapped_method()
+
+    assert 3 == method_mock.call_count
+    rate_limiter.github_client.get_rate_limit.assert_called_once()
+    assert 1 == rate_limiter.polls_count
+
+
+def test_rate_limiter_polls_again_when_reset_time_passed(mocker, rate_limiter):
+    mocker.patch("time.sleep", return_value=None)
+    rate_limiter.update_from_headers({"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": str(time.time() - 10)})
+
+    wrapped_method = rate_limiter(mocker.Mock())
+    wrapped_method()
+
+    rate_limiter.github_client.get_rate_limit.assert_called_once()
+
+
+def test_rate_limiter_update_from_headers_sleeps_on_low_budget(mocker, rate_limiter):
+    mock_sleep = mocker.patch("time.sleep", return_value=None)
+    rate_limiter.update_from_headers({"x-ratelimit-remaining": "2", "x-ratelimit-reset": str(int(time.time()) + 60)})
+
+    method_mock = mocker.Mock()
+    rate_limiter(method_mock)()
+
+    method_mock.assert_called_once()
+    mock_sleep.assert_called_once()
+    rate_limiter.github_client.get_rate_limit.assert_not_called()
+
+
+def test_rate_limiter_update_from_headers_ignores_missing_values(rate_limiter):
+    rate_limiter.update_from_headers({"Content-Type": "application/json"})
+    rate_limiter.update_from_headers({"X-RateLimit-Remaining": "abc", "X-RateLimit-Reset": "1"})
+
+    assert rate_limiter.remaining is None
+    assert rate_limiter.reset_time is None
+
+
+def test_rate_limiter_shared_budget_across_threads(mocker, rate_limiter):
+    mocker.patch("time.sleep", return_value=None)
+    method_mock = mocker.Mock()
+    wrapped_method = rate_limiter(method_mock)
+
+    threads = [threading.Thread(target=wrapped_method) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert 16 == method_mock.call_count
+    assert 1 == rate_limiter.polls_count
+
+
+def test_rate_limiter_graphql_headers_do_not_touch_rest_budget(rate_limiter):
+    reset = int(time.time()) + 3600
+    rate_limiter.update_from_headers({"X-RateLimit-Remaining": "4000", "X-RateLimit-Reset": str(reset)})
+    rate_limiter.update_from_headers(
+        {"X-RateLimit-Remaining": "2", "X-RateLimit-Reset": str(reset), "X-RateLimit-Resource": "graphql"}
+    )
+
+    assert 4000 == rate_limiter.remaining
+    assert (2, float(reset)) == rate_limiter.budget("graphql")
+
+
+def test_rate_limiter_polls_outside_the_lock(mocker, rate_limiter, mock_rate_limiter):
+    polling, answer = threading.Event(), threading.Event()
+
+    def _get_rate_limit():
+        polling.set()
+        answer.wait(5)
+        return mock_rate_limiter
+
+    rate_limiter.github_client.get_rate_limit.side_effect = _get_rate_limit
+    threads = [threading.Thread(target=rate_limiter.wait_if_needed) for _ in range(4)]
+    for t in threads:
+        t.start()
+    assert polling.wait(5)
+
+    # responses keep being reported while the poll waits for the network
+    rate_limiter.update_from_headers(
+        {"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": str(time.time() + 60), "X-RateLimit-Resource": "graphql"}
+    )
+    assert 100 == rate_limiter.budget("graphql")[0]
+    answer.set()
+    for t in threads:
+        t.join()
+
+    assert 1 == rate_limiter.polls_count
+    assert 10 == rate_limiter.remaining
+
+
+def test_install_rate_limit_hook_tracks_responses_by_resource(mocker):
+    reset = str(int(time.time()) + 3600)
+
+    def _send(request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"data": {}}' if request.url.endswith("/graphql") else b'{"login": "octocat"}'
+        response.headers = requests.structures.CaseInsensitiveDict({"X-RateLimit-Reset": reset})
+        if request.url.endswith("/graphql"):
+            response.headers.update({"X-RateLimit-Remaining": "4000", "X-RateLimit-Resource": "graphql"})
+        else:
+            response.headers.update({"X-RateLimit-Remaining": "4999", "X-RateLimit-Resource": "core"})
+        response.url = request.url
+        response.request = request
+        return response
+
+    mocker.patch.object(HTTPAdapter, "send", side_effect=_send)
+    github = Github(auth=Auth.Token("abc"), retry=None)
+    rate_limiter = GithubRateLimiter(github)
+    install_rate_limit_hook(github, rate_limiter)
+
+    github.requester.requestJsonAndCheck("GET", "/user")
+    # the requester keeps the headers of this latest response, the limiter keeps both resources apart
+    github.requester.graphql_query("query { viewer { login } }", {})
+
+    assert (4999, float(reset)) == rate_limiter.budget("core")
+    assert (4000, float(reset)) == rate_limiter.budget("graphql")
+    assert 0 == rate_limiter.polls_count
+
+
+def test_rate_limiter_polls_graphql_resource(mocker, rate_limiter, mock_rate_limiter):
+    mock_sleep = mocker.patch("time.sleep", return_value=None)
+    graphql_rate = mocker.Mock(spec=Rate)
+    graphql_rate.remaining = 1
+    graphql_rate.reset = datetime.now() + timedelta(hours=1)
+    mock_rate_limiter.resources = mocker.Mock(graphql=graphql_rate)
+
+    rate_limiter.wait_if_needed("graphql")
+
+    mock_sleep.assert_called_once()
+    assert rate_limiter.remaining is None
+
+
+def test_graphql_query_reports_headers_to_limiter(mocker, rate_limiter):
+    reset = int(time.time()) + 3600
+    requester = mocker.Mock()
+    requester.graphql_query.return_value = (
+        {"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": str(reset), "X-RateLimit-Resource": "graphql"},
+        {"data": {}},
+    )
+    rate_limiter.update_from_headers(
+        {"X-RateLimit-Remaining": "5000", "X-RateLimit-Reset": str(reset), "X-RateLimit-Resource": "graphql"}
+    )
+
+    assert {"data": {}} == graphql_query(requester, "query", {"a": 1}, rate_limiter)
+
+    requester.graphql_query.assert_called_once_with("query", {"a": 1})
+    assert 4999 == rate_limiter.budget("graphql")[0]
+    rate_limiter.github_client.get_rate_limit.assert_not_called()
@@ -0,0 +1,179 @@
+#
+# Copyright 2023 ABSA Group Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import requests
+from github import Auth, Github
+from requests.adapters import HTTPAdapter
+
+from release_notes_generator.utils.http_cache import HttpCache, install_http_cache, mount_http_cache
+
+URL = "https://api.github.com/repos/org/repo/issues"
+
+
+def _response(request, status: int, body: bytes = b"", headers: dict | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response._content = body
+    response.url = request.url
+    response.request = request
+    return response
+
+
+def _github_server(mocker, etag: str = '"v1"', body: bytes = b'[{"number": 1}]'):
+    """Patch the transport with a server answering 304 when the ETag matches."""
+    sent = []
+
+    def _send(request, **kwargs):
+        sent.append(dict(request.headers))
+        rate = {
+            "x-ratelimit-limit": "5000",
+            "x-ratelimit-remaining": str(5000 - len(sent)),
+            "x-ratelimit-reset": "1700000000",
+        }
+        if request.headers.get("If-None-Match") == etag:
+            return _response(request, 304, headers={"ETag": etag, **rate})
+        return _response(
+            request,
+            200,
+            body,
+            {"ETag": etag, "Content-Type": "application/json; charset=utf-8", "Content-Length": "15", **rate},
+        )
+
+    mocker.patch.object(HTTPAdapter, "send", side_effect=_send)
+    return sent
+
+
+def test_cache_revalidates_and_serves_cached_body_on_304(mocker, tmp_path):
+    sent = _github_server(mocker)
+    cache = HttpCache(str(tmp_path), max_size_bytes=1024 * 1024)
+    session = mount_http_cache(requests.Session(), cache)
+
+    first = session.get(URL, headers={"Authorization": "token abc"})
+    second = session.get(URL, headers={"Authorization": "token abc"})
+
+    assert "If-None-Match" not in sent[0]
+    assert sent[1]["If-None-Match"] == '"v1"'
+    assert first.status_code == second.status_code == 200
+    assert second.json() == [{"number": 1}]
+    # fresh headers of the 304 answer win over the stored ones
+    assert second.headers["x-ratelimit-remaining"] == "4998"
+    assert "Content-Length" not in second.headers
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_persists_between_instances_and_never_stores_token(mocker, tmp_path):
+    sent = _github_server(mocker)
+    session = mount_http_cache(requests.Session(), HttpCache(str(tmp_path), max_size_bytes=1024 * 1024))
+    session.get(URL, headers={"Authorization": "token secret-token"})
+
+    reopened = HttpCache(str(tmp_path), max_size_bytes=1024 * 1024)
+    response = mount_http_cache(requests.Session(), reopened).get(URL, headers={"Authorization": "token secret-token"})
+
+    assert len(reopened) == 1
+    assert sent[1]["If-None-Match"] == '"v1"'
+    assert response.json() == [{"number": 1}]
+    assert reopened.hits == 1
+    assert all(b"secret-token" not in path.read_bytes() for path in tmp_path.iterdir())
+
+
+def test_cache_entries_survive_token_change(mocker, tmp_path):
+    sent = _github_server(mocker)
+    cache = HttpCache(str(tmp_path), max_size_bytes=1024 * 1024)
+    session = mount_http_cache(requests.Session(), cache)
+
+    session.get(URL, headers={"Authorization": "token first-run"})
+    second = session.get(URL, headers={"Authorization": "token second-run"})
+
+    # revalidated with the new token, the server decides whether the cached body is still valid
+    assert sent[1]["If-None-Match"] == '"v1"'
+    assert sent[1]["Authorization"] == "token second-run"
+    assert second.json() == [{"number": 1}]
+    assert cache.hits == 1
+
+
+def test_cache_does_not_store_responses_without_etag(mocker, tmp_path):
+    def _send(request, **kwargs):
+        return _response(request, 200, b"[]", {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    mocker.patch.object(HTTPAdapter, "send", side_effect=_send)
+    cache = HttpCache(str(tmp_path), max_size_bytes=1024 * 1024)
+    session = mount_http_cache(requests.Session(), cache)
+
+    session.get(URL)
+
+    assert len(cache) == 0
+
+
+def test_cache_passes_post_requests_through(mocker, tmp_path):
+    sent = _github_server(mocker)
+    cache = HttpCache(str(tmp_path), max_size_bytes=1024 * 1024)
+    session = mount_http_cache(requests.Session(), cache)
+
+    session.post("https://api.github.com/graphql", json={"query": "{}"})
+    session.post("https://api.github.com/graphql", json={"query": "{}"})
+
+    assert len(sent) == 2
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_cache_drops_unpaired_and_damaged_entries_on_load(mocker, tmp_path):
+    _github_server(mocker)
+    session = mount_http_cache(requests.Session(), HttpCache(str(tmp_path), max_size_bytes=1024 * 1024))
+    session.get(URL)
+    (tmp_path / "interrupted.body").write_bytes(b"[]")
+    (tmp_path / "damaged.body").write_bytes(b"[]")
+    (tmp_path / "damaged.json").write_text("{", encoding="utf-8")
+
+    reopened = HttpCache(str(tmp_path), max_size_bytes=1024 * 1024)
+
+    assert len(reopened) == 1
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == [".body", ".json"]
+
+
+def test_cache_evicts_least_recently_used_entries(mocker, tmp_path):
+    _github_server(mocker, body=b"x" * 400)
+    cache = HttpCache(str(tmp_path), max_size_bytes=1500)
+    session = mount_http_cache(requests.Session(), cache)
+
+    session.get(f"{URL}?page=1")
+    session.get(f"{URL}?page=2")
+    session.get(f"{URL}?page=1")  # page 1 becomes the most recently used entry
+    session.get(f"{URL}?page=3")
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.size_bytes <= 1500
+    assert len(list(tmp_path.iterdir())) == 4
+    session.get(f"{URL}?page=1")
+    assert cache.hits == 2
+
+
+def test_install_http_cache_routes_pygithub_requests(mocker, tmp_path):
+    sent = _github_server(mocker, body=b'{"login": "octocat"}')
+    cache = HttpCache(str(tmp_path), max_size_bytes=1024 * 1024)
+    github = Github(auth=Auth.Token("abc"), retry=None)
+    install_http_cache(github, cache)
+
+    github.requester.requestJsonAndCheck("GET", "/user")
+    _headers, data = github.requester.requestJsonAndCheck("GET", "/user")
+
+    assert data["login"] == "octocat"
+    assert sent[1]["If-None-Match"] == '"v1"'
+    assert github.requester.rate_limiting[0] == 4998
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -214,3 +214,56 @@ def test_get_issues_for_pr_different_numbers_not_cached(monkeypatch):
     assert r1 == {"OWN/REPO#1"}
     assert r2 == {"OWN/REPO#2"}
     assert calls["nums"] == [1, 2]
+
+
+def test_get_issues_for_prs_batches_aliases(monkeypatch):
+    _patch_action_inputs(monkeypatch)
+    monkeypatch.setattr(pru, "ISSUES_FOR_PRS_BATCH_MAX", 2)
+
+    queries = []
+
+    class MockRequester:
+        def graphql_query(self, query, variables):
+            queries.append(query)
+            aliases = [line.split(":")[0].strip() for line in query.splitlines() if "pullRequest(number:" in line]
+            repository = {
+                alias: {"closingIssuesReferences": {"nodes": [{"number": int(alias[2:]) * 10}]}} for alias in aliases
+            }
+            return {}, {"data": {"repository": repository}}
+
+    result = pru.get_issues_for_prs([3, 1, 2, 1], MockRequester())
+
+    assert 2 == len(queries)
+    assert 'repository(owner: "OWN", name: "REPO")' in queries[0]
+    assert "pr1: pullRequest(number: 1)" in queries[0] and "pr2: pullRequest(number: 2)" in queries[0]
+    assert "pr3: pullRequest(number: 3)" in queries[1]
+    assert result == {1: {"OWN/REPO#10"}, 2: {"OWN/REPO#20"}, 3: {"OWN/REPO#30"}}
+
+
+def test_get_issues_for_prs_missing_pull_node_is_empty(monkeypatch):
+    _patch_action_inputs(monkeypatch)
+
+    class MockRequester:
+        def graphql_query(self, query, variables):
+            return {}, {"data": {"repository": {"pr5": None}}}
+
+    assert pru.get_issues_for_prs([5], MockRequester()) == {5: set()}
+
+
+def test_get_issues_for_prs_failed_batch_is_skipped(monkeypatch):
+    _patch_action_inputs(monkeypatch)
+
+    from github import GithubException
+
+    class MockRequester:
+        def graphql_query(self, query, variables):
+            raise GithubException(502, "Bad gateway")
+
+    assert pru.get_issues_for_prs([7, 8], MockRequester()) == {}
+
+
+def test_get_issues_for_prs_batch_size_respects_node_limit(monkeypatch):
+    assert pru.get_issues_for_prs_batch_size() == 100
+
+    monkeypatch.setattr(pru, "GRAPHQL_MAX_NODES", 56)
+    assert pru.get_issues_for_prs_batch_size() == 5